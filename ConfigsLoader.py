@@ -0,0 +1,28 @@
+'''
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+'''
+
+import yaml, functools
+
+# Use the LibYAML-based loader when PyYAML was built with it (much faster parsing).
+try:
+  from yaml import CSafeLoader as SafeLoader
+except ImportError:
+  from yaml import SafeLoader  # LibYAML is not available; use the pure-Python loader.
+
+
+@functools.cache
+def LoadConfigs(configsPath="configs.yaml"):
+  """
+  Load the configuration settings from the YAML file.
+  The file is parsed once per process; every module shares the returned dictionary,
+  so it must be treated as read-only.
+  """
+  with open(configsPath, "r") as configFile:
+    return yaml.load(configFile, Loader=SafeLoader)  # Parse the YAML configuration file.
@@ -14,22 +14,52 @@ configs = {
   "verbose"  : True,  # Enable verbose logging.
   "storePath": "./Jobs",
   "api"      : {
-    "version"      : "v1",  # Version of the server.
-    "port"         : 5000,  # Port on which the server will run.
-    "maxJobs"      : 1,  # Maximum number of jobs that can be processed concurrently.
-    "maxTextLength": 6500,  # Maximum length of text for processing.
-    "maxTimeout"   : 10,  # Maximum timeout for job proc  essing in seconds.
+    "version"            : "v1",  # Version of the server.
+    "port"               : 5000,  # Port on which the server will run.
+    "maxJobs"            : 1,  # Maximum number of jobs that can be processed concurrently.
+    "maxTextLength"      : 6500,  # Maximum length of text for processing.
+    "maxTimeout"         : 10,  # Maximum timeout for job proc  essing in seconds.
+    "maxUploadMB"        : 0,  # Maximum request body size in MB for uploads (0 = unlimited).
+    # Let a reverse proxy send downloaded files: "none", "x-sendfile" (Apache/lighttpd), or "x-accel" (nginx).
+    "sendfileOffload"    : "none",
+    "accelRedirectPrefix": "/_protected/",  # nginx internal location aliased to the store path (x-accel only).
+  },
+  "cache"    : {
+    "enabled"      : True,  # Cache TTS + Whisper results for repeated texts.
+    "path"         : "./Cache",  # Directory of the cache (kept outside the store path so it is not listed as a job).
+    "maxEntries"   : 256,  # Maximum number of cached texts before the oldest ones are pruned.
+    # Cache each sentence separately (repeated sentences skip TTS and Whisper even inside new texts).
+    "sentenceLevel": True,
+    # Cache the outputs of the audio tools (normalize, convert, volume, speed, silence) by input + parameters.
+    "audioTools"   : True,
   },
   "tts"      : {
-    "language"  : "en-us",  # Default language for TTS.
-    "voice"     : "af_nova",  # Default voice for TTS.
-    "sampleRate": 24000,  # Default sample rate for TTS.
-    "speechRate": 0.8,  # Default speech rate for TTS.
+    # TTS backend: "kokoro" (PyTorch KPipeline) or "kokoro-onnx" (ONNX Runtime, faster on CPU-only machines).
+    "backend"       : "kokoro",
+    "language"      : "en-us",  # Default language for TTS.
+    "voice"         : "af_nova",  # Default voice for TTS.
+    "sampleRate"    : 24000,  # Default sample rate for TTS.
+    "speechRate"    : 0.8,  # Default speech rate for TTS.
+    "onnxModelPath" : "./Assets/Models/kokoro-v1.0.int8.onnx",  # Quantized model for the ONNX backend.
+    "onnxVoicesPath": "./Assets/Models/voices-v1.0.bin",  # Voices file for the ONNX backend.
   },
   "whisper"  : {
     # Models: https://github.com/openai/whisper?tab=readme-ov-file#available-models-and-languages
-    "modelName": "turbo",  # Default model name for Whisper.
-    "language" : "en"  # Default language for transcription.
+    "modelName"      : "turbo",  # Default model name for Whisper.
+    "language"       : "en",  # Default language for transcription.
+    # Directory of the converted CTranslate2 models ("<modelName>-ct2", see WhisperTranscribeHelper.ConvertModel).
+    "modelsPath"     : "./Assets/Models/Whisper",
+    # Transcription backend: "auto" (faster-whisper when installed), "faster-whisper", or "openai".
+    "backend"        : "auto",
+    # CTranslate2 compute type: "auto" (int8_float16 on GPU, int8 on CPU), "int8", "float16", etc.
+    "computeType"    : "auto",
+    # Skip silent regions with the Silero VAD before transcription (faster-whisper backend only).
+    "vadFilter"      : True,
+    "vadMinSilenceMs": 500,  # Minimum silence duration (ms) that splits the voiced regions.
+    "batchSize"      : 8,  # Number of clips decoded per forward pass (faster-whisper backend only).
+    "maxConcurrency" : 2,  # Number of transcription batches allowed to run at the same time.
+    # Word timings: "align" (forced alignment of the known TTS text) or "transcribe" (full transcription).
+    "timingMode"     : "align",
   },
   "video"    : {
     "default"           : "./Assets/Videos",  # Default path for storing generated videos.
@@ -63,6 +93,13 @@ configs = {
     # Default video codec for video. Options include libx264, libx265, etc.
     # libx264 is a widely used codec for video encoding.
     "videoCodec"                       : "libx264",
+    "videoPreset"                      : "fast",  # Preset of the software video encoder.
+    "encoderThreads"                   : 0,  # Threads of the software video encoder (0 = one per CPU core).
+    # Hardware video encoder: "auto" (probe VideoToolbox on macOS, else NVENC then VAAPI), "none",
+    # "h264_nvenc", "hevc_nvenc", "h264_vaapi", or "h264_videotoolbox".
+    # Falls back to videoCodec when the encoder is not usable.
+    "hwEncoder"                        : "auto",
+    "vaapiDevice"                      : "/dev/dri/renderD128",  # Render device used by the VAAPI encoder.
     # Default video bitrate for encoding. 5000k is a common choice for high-quality video.
     "videoBitrate"                     : "5000k",
     "videoFormat"                      : "mp4",  # Default video format for encoding.
@@ -86,6 +123,9 @@ configs = {
     # "captionsPerLine"                  : 5,  # Default number of captions per line.
     "captionPosition"                  : "bottom",  # Default position for captions.
     "captionPositionOffset"            : "15%",  # Default position for captions.
+    # Caption renderer: "ass" (single libass filter, word-by-word highlight), "subtitles" (single libass filter,
+    # one SRT cue per line without highlight), or "drawtext" (two drawtext filters per word).
+    "captionRenderer"                  : "ass",
     "captionTextColor"                 : "white",  # Default text color for captions.
     "captionTextBorderColor"           : "blue",  # Default text color for captions.
     "captionTextBorderWidth"           : 2,  # Default border width for caption text.
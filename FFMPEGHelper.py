@@ -8,20 +8,99 @@
 # Permissions and Citation: Refer to the README file.
 '''
 
-import ffmpeg, subprocess, tempfile, yaml, os, random, asyncio, re, logging
+import ffmpeg, subprocess, tempfile, io, os, sys, random, asyncio, re, logging, functools, shutil, threading
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 from TextHelper import EscapeText
+from ConfigsLoader import LoadConfigs
 
 # Use module logger so messages go through Python's logging system and appear with Flask output.
 logger = logging.getLogger(__name__)
 
-with open("configs.yaml", "r") as configFile:
-  configs = yaml.safe_load(configFile)
+configs = LoadConfigs()  # Shared configuration settings (configs.yaml is parsed once per process).
 
 # Get the verbose setting from the config.
 VERBOSE = configs.get("verbose", False)
 
+# Encoder settings for the supported hardware video encoders.
+# Each entry holds the input arguments, the output arguments, and the filter suffix required to
+# upload the frames to the device (VAAPI only).
+HW_ENCODERS = {
+  "h264_nvenc"       : ([], ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23"], ""),
+  "hevc_nvenc"       : ([], ["-c:v", "hevc_nvenc", "-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23"], ""),
+  "h264_vaapi"       : (["-vaapi_device", "{vaapiDevice}"], ["-c:v", "h264_vaapi"], ",format=nv12,hwupload"),
+  "h264_videotoolbox": ([], ["-c:v", "h264_videotoolbox", "-q:v", "65"], ""),
+}
+
+
+# Chunk size used when feeding uploaded streams to ffprobe or copying them to disk.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _StreamFileDescriptor(stream):
+  r'''
+  Return the OS-level file descriptor behind an uploaded stream, if it has one.
+  Spooled temporary files return None (the callers fall back to piping/copying the data),
+  since calling `fileno()` on them would force an in-memory spool to roll over to disk.
+
+  Parameters:
+    stream (file-like): The uploaded stream (e.g., `FileStorage.stream`).
+
+  Returns:
+    int|None: The file descriptor, or None if the stream is not backed by a real file.
+  '''
+
+  if (isinstance(stream, tempfile.SpooledTemporaryFile)):
+    return None
+  try:
+    return stream.fileno()
+  except (AttributeError, io.UnsupportedOperation, OSError, ValueError):
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _DetectVideoEncoder(hwEncoder, vaapiDevice):
+  r'''
+  Select the video encoder once per process.
+  For "auto", VideoToolbox (macOS), NVENC, and then VAAPI are tried with a tiny test encode
+  (listing them in `ffmpeg -encoders` does not prove that a usable device is present).
+
+  Parameters:
+    hwEncoder (str): "auto", "none", or one of the HW_ENCODERS names.
+    vaapiDevice (str): Path of the VAAPI render device.
+
+  Returns:
+    str|None: The name of the hardware encoder to use, or None for the software encoder.
+  '''
+
+  if ((not hwEncoder) or (hwEncoder == "none")):
+    return None  # Hardware encoding is disabled.
+  if (hwEncoder == "auto"):
+    # VideoToolbox only exists on macOS; NVENC and VAAPI only elsewhere.
+    candidates = ["h264_videotoolbox"] if (sys.platform == "darwin") else ["h264_nvenc", "h264_vaapi"]
+  else:
+    candidates = [hwEncoder]
+  for encoder in candidates:
+    if (encoder not in HW_ENCODERS):
+      continue
+    inputArgs, outputArgs, filterSuffix = HW_ENCODERS[encoder]
+    testCommand = [
+      "ffmpeg", "-hide_banner",
+      *[arg.format(vaapiDevice=vaapiDevice) for arg in inputArgs],
+      "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+      "-vf", f"format=yuv420p{filterSuffix}",
+      *outputArgs,
+      "-f", "null", "-",
+    ]
+    try:
+      result = subprocess.run(testCommand, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
+      if (result.returncode == 0):
+        logger.info(f"Using hardware video encoder: {encoder}")
+        return encoder
+    except Exception:
+      pass
+  return None  # Fall back to the software encoder.
+
 
 class FFMPEGHelper(object):
   r'''
@@ -29,8 +108,10 @@ class FFMPEGHelper(object):
   This class provides methods to perform various video and audio processing tasks using FFMPEG.
   '''
 
-  def DetectFFmpegPath(self):
-    r'''Detect ffmpeg executable path on Windows or PATH.'''
+  @staticmethod
+  @functools.lru_cache(maxsize=None)
+  def DetectFFmpegPath():
+    r'''Detect ffmpeg executable path on Windows or PATH (scanned once per process).'''
     candidates = []
     # Check PATH.
     for p in os.environ.get("PATH", "").split(os.pathsep):
@@ -70,6 +151,227 @@ class FFMPEGHelper(object):
         logger.info(f"Error getting file duration: {e.stderr}")
       return None
 
+  async def GetFileDurationAsync(self, filePath):
+    r'''
+    Get the duration of a file in seconds without blocking the event loop.
+    This function runs ffprobe as an asynchronous subprocess, so several files can be probed concurrently.
+
+    Parameters:
+      filePath (str): Path to the input file.
+
+    Returns:
+      float: Duration of the file in seconds (None on failure).
+    '''
+
+    try:
+      process = await asyncio.create_subprocess_exec(
+        "ffprobe",
+        "-v", "error",  # Only report errors.
+        "-show_entries", "format=duration",  # Only read the container duration.
+        "-of", "default=noprint_wrappers=1:nokey=1",  # Print the bare value.
+        filePath,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+      )
+      stdout, stderr = await process.communicate()
+      if (process.returncode != 0):
+        raise RuntimeError(stderr.decode(errors="ignore").strip())
+      return float(stdout.strip())
+    except Exception as e:
+      if (VERBOSE):
+        logger.info("Function `GetFileDurationAsync` encountered an error:")
+        logger.info(f"Error getting file duration: {e}")
+      return None
+
+  def GetFileDurationFromStream(self, fileObj):
+    r'''
+    Get the duration of an uploaded stream in seconds without saving it first.
+    Streams backed by a real file are probed through /dev/fd (seekable, so the container duration
+    is exact); in-memory streams are written to ffprobe's stdin (`-i pipe:0`) in 1 MiB chunks.
+
+    Parameters:
+      fileObj (file-like): The uploaded stream (e.g., `FileStorage.stream`).
+
+    Returns:
+      float: Duration of the stream in seconds (None if it cannot be determined from the stream).
+    '''
+
+    try:
+      returnCode, output = self._RunOnStream(
+        fileObj,
+        lambda inputUrl: [
+          "ffprobe",
+          "-v", "error",  # Only report errors.
+          "-show_entries", "format=duration",  # Only read the container duration.
+          "-of", "default=noprint_wrappers=1:nokey=1",  # Print the bare value.
+          "-i", inputUrl,
+        ],
+      )
+      if (returnCode != 0):
+        return None
+      return float(output.strip())  # Raises ValueError on "N/A" (e.g., MP3 without a known size).
+    except Exception as e:
+      if (VERBOSE):
+        logger.info("Function `GetFileDurationFromStream` encountered an error:")
+        logger.info(f"Error getting stream duration: {e}")
+      return None
+
+  def IsStreamSilent(self, fileObj):
+    r'''
+    Check if an uploaded stream is silent without saving it first (see `IsFileSilent`).
+    The stream is decoded once through the `volumedetect` filter, fed the same way as in
+    `GetFileDurationFromStream`.
+
+    Parameters:
+      fileObj (file-like): The uploaded stream (e.g., `FileStorage.stream`).
+
+    Returns:
+      bool: True if the stream is silent, False otherwise (None if it cannot be decided from the stream,
+      e.g., when it has no audio stream).
+    '''
+
+    try:
+      returnCode, output = self._RunOnStream(
+        fileObj,
+        lambda inputUrl: [
+          "ffmpeg",
+          "-hide_banner", "-nostats",
+          "-i", inputUrl,
+          "-vn", "-af", "volumedetect",  # Decode the audio only.
+          "-f", "null", "-",
+        ],
+        captureStderr=True,  # volumedetect reports on stderr.
+      )
+      if (returnCode != 0):
+        return None
+      for line in output.decode(errors="replace").splitlines():
+        if ("mean_volume" in line):
+          # Extract the dB value from a line like "mean_volume: -91.0 dB".
+          meanVolume = float(line.split("mean_volume:")[1].strip().replace("dB", "").strip())
+          # Convert dB to a linear scale and compare with the threshold.
+          return (10 ** (meanVolume / 20)) < configs["ffmpeg"]["isSilentThreshold"]
+      return None
+    except Exception as e:
+      if (VERBOSE):
+        logger.info("Function `IsStreamSilent` encountered an error:")
+        logger.info(f"Error checking stream silence: {e}")
+      return None
+
+  def _RunOnStream(self, fileObj, BuildCommand, captureStderr=False):
+    r'''
+    Run an FFMPEG/FFPROBE command on an uploaded stream.
+    Streams backed by a real file are passed through /dev/fd (seekable, so container metadata is exact);
+    in-memory streams are written to the process's stdin (`pipe:0`) in 1 MiB chunks.
+
+    Parameters:
+      fileObj (file-like): The uploaded stream (rewound before and after the run).
+      BuildCommand (callable): Builds the command list from the input URL.
+      captureStderr (bool): Return stderr instead of stdout.
+
+    Returns:
+      tuple: (return code, captured output bytes).
+    '''
+
+    fd = _StreamFileDescriptor(fileObj)
+    useFd = (fd is not None) and os.path.isdir("/dev/fd")
+    fileObj.seek(0)
+    process = subprocess.Popen(
+      BuildCommand(f"/dev/fd/{fd}" if (useFd) else "pipe:0"),
+      stdin=subprocess.DEVNULL if (useFd) else subprocess.PIPE,
+      stdout=subprocess.DEVNULL if (captureStderr) else subprocess.PIPE,
+      stderr=subprocess.PIPE if (captureStderr) else subprocess.DEVNULL,
+      pass_fds=(fd,) if (useFd) else (),
+    )
+
+    def _FeedStdin():
+      # The process may stop reading once it has seen enough of the stream.
+      try:
+        while (chunk := fileObj.read(STREAM_CHUNK_SIZE)):
+          process.stdin.write(chunk)
+      except (BrokenPipeError, OSError, ValueError):
+        pass
+      finally:
+        try:
+          process.stdin.close()
+        except OSError:
+          pass
+
+    writer = None
+    if (not useFd):
+      writer = threading.Thread(target=_FeedStdin, daemon=True)
+      writer.start()
+    try:
+      output = (process.stderr if (captureStderr) else process.stdout).read()
+      process.wait()
+    finally:
+      if (writer is not None):
+        writer.join()
+      fileObj.seek(0)  # Leave the stream readable for the caller.
+    return process.returncode, output
+
+  def GetStreamSize(self, fileObj):
+    r'''
+    Get the size of an uploaded stream in bytes without saving it first.
+
+    Parameters:
+      fileObj (file-like): The uploaded stream (e.g., `FileStorage.stream`).
+
+    Returns:
+      int: Size of the stream in bytes.
+    '''
+
+    try:
+      fd = _StreamFileDescriptor(fileObj)
+      if (fd is not None):
+        return os.fstat(fd).st_size
+      size = fileObj.seek(0, os.SEEK_END)
+      fileObj.seek(0)
+      return size
+    except Exception as e:
+      if (VERBOSE):
+        logger.info("Function `GetStreamSize` encountered an error:")
+        logger.info(f"Error getting stream size: {str(e)}")
+      return None
+
+  def SaveStreamToFile(self, fileObj, filePath, hasher=None):
+    r'''
+    Write an uploaded stream to disk.
+    When the stream is backed by a real file, `os.sendfile` copies it inside the kernel; otherwise
+    (or if the platform refuses it) the data is copied with a 1 MiB buffer.
+    With a `hasher`, the data is hashed during the same pass (1 MiB chunks; no sendfile).
+
+    Parameters:
+      fileObj (file-like): The uploaded stream (e.g., `FileStorage.stream`).
+      filePath (str): Path of the output file.
+      hasher (hashlib object): Optional hash object updated with the stream content.
+
+    Returns:
+      str: The path of the written file.
+    '''
+
+    fileObj.seek(0)
+    fd = _StreamFileDescriptor(fileObj)
+    with open(filePath, "wb") as outFile:
+      if (hasher is not None):
+        while (chunk := fileObj.read(STREAM_CHUNK_SIZE)):
+          hasher.update(chunk)
+          outFile.write(chunk)
+        return filePath
+      if ((fd is not None) and hasattr(os, "sendfile")):
+        try:
+          size, offset = os.fstat(fd).st_size, 0
+          while (offset < size):
+            sent = os.sendfile(outFile.fileno(), fd, offset, size - offset)
+            if (sent == 0):
+              break
+            offset += sent
+          return filePath
+        except OSError:
+          outFile.seek(0)
+          outFile.truncate()  # Fall back to a buffered copy below.
+      shutil.copyfileobj(fileObj, outFile, STREAM_CHUNK_SIZE)
+    return filePath
+
   def GetFilesDuration(self, filePaths):
     r'''
     Get the total duration of multiple files in seconds.
@@ -233,6 +535,68 @@ class FFMPEGHelper(object):
         logger.info(f"Error checking audio stream: {e.stderr}")
       return False
 
+  def GetVideoEncoderArgs(self, allowHwUpload=False):
+    r'''
+    Get the output arguments of the video encoder (hardware encoder when available).
+
+    Parameters:
+      allowHwUpload (bool): Whether the caller appends GetVideoEncoderFilterSuffix() to its filter graph
+        and GetVideoEncoderInputArgs() to its inputs (required by VAAPI).
+
+    Returns:
+      list: The ffmpeg output arguments selecting the video encoder and its preset.
+    '''
+
+    encoder = self._GetHwEncoder(allowHwUpload)
+    if (encoder is None):
+      # Software encoder with the configured preset ("fast" balances speed and quality).
+      # The encoder threads default to one per CPU core (0 = all cores).
+      encoderThreads = int(configs["ffmpeg"].get("encoderThreads", 0)) or (os.cpu_count() or 1)
+      return [
+        "-c:v", configs["ffmpeg"].get("videoCodec", "libx264"),
+        "-preset", configs["ffmpeg"].get("videoPreset", "fast"),
+        "-threads", str(encoderThreads),
+      ]
+    return list(HW_ENCODERS[encoder][1])
+
+  def GetVideoEncoderInputArgs(self, allowHwUpload=True):
+    r'''
+    Get the global (pre-input) arguments required by the selected hardware encoder.
+
+    Returns:
+      list: The ffmpeg arguments to place before the inputs.
+    '''
+
+    encoder = self._GetHwEncoder(allowHwUpload)
+    if (encoder is None):
+      return []
+    vaapiDevice = configs["ffmpeg"].get("vaapiDevice", "/dev/dri/renderD128")
+    return [arg.format(vaapiDevice=vaapiDevice) for arg in HW_ENCODERS[encoder][0]]
+
+  def GetVideoEncoderFilterSuffix(self, allowHwUpload=True):
+    r'''
+    Get the filter suffix that uploads the frames for the selected hardware encoder.
+
+    Returns:
+      str: The filter suffix (empty when no upload is needed).
+    '''
+
+    encoder = self._GetHwEncoder(allowHwUpload)
+    return "" if (encoder is None) else HW_ENCODERS[encoder][2]
+
+  def _GetHwEncoder(self, allowHwUpload):
+    r'''
+    Get the configured hardware encoder, skipping the ones that need a frame upload when it is not allowed.
+    '''
+
+    encoder = _DetectVideoEncoder(
+      configs["ffmpeg"].get("hwEncoder", "auto"),
+      configs["ffmpeg"].get("vaapiDevice", "/dev/dri/renderD128"),
+    )
+    if ((encoder is not None) and HW_ENCODERS[encoder][2] and (not allowHwUpload)):
+      return None  # The stage cannot upload frames to the device; use the software encoder.
+    return encoder
+
   async def _ExecuteFFmpegCommand(self, command, functionName="", logPath=None):
     r'''
     Execute an FFMPEG command asynchronously.
@@ -480,10 +844,9 @@ class FFMPEGHelper(object):
       "-to", str(end),  # End time in seconds for the video portion.
       # "-vf", f"scale={width}:{height}",  # Video filter to scale the video.
       "-r", str(configs["video"].get("fps", 30)),  # Set the frame rate.
-      "-vcodec", configs["ffmpeg"].get("videoCodec", "libx264"),  # Set the video codec.
+      *self.GetVideoEncoderArgs(),  # Set the video codec and its preset (hardware encoder when available).
       "-pix_fmt", configs["ffmpeg"].get("pixelFormat", "yuv420p"),  # Set the pixel format.
       "-acodec", configs["ffmpeg"].get("audioCodec", "libmp3lame"),  # Set the audio codec.
-      "-preset", "fast",  # Use a fast preset for encoding. It balances speed and quality.
       "-y",  # Overwrite output file without asking.
       outputFilePath  # Output video file.
     ]
@@ -528,11 +891,10 @@ class FFMPEGHelper(object):
       "-map", "[vout]",  # Map the filtered video.
       "-map", "0:a?",  # Map audio if it exists.
       "-r", str(configs["video"].get("fps", 30)),  # Set the frame rate.
-      "-vcodec", configs["ffmpeg"].get("videoCodec", "libx264"),  # Set the video codec.
+      *self.GetVideoEncoderArgs(),  # Set the video codec and its preset (hardware encoder when available).
       "-acodec", configs["ffmpeg"].get("audioCodec", "libmp3lame"),  # Set the audio codec.
       "-ar", str(configs["ffmpeg"].get("sampleRate", 44100)),  # Set audio sample rate for consistency.
       "-ac", str(configs["ffmpeg"].get("channels", 2)),  # Set audio channels to stereo.
-      "-preset", "fast",  # Use a fast preset for encoding. It balances speed and quality.
       "-y",  # Overwrite output file without asking.
       outputFilePath  # Output video file.
     ]
@@ -583,11 +945,10 @@ class FFMPEGHelper(object):
       "-map", "[vout]",  # Map the filtered video.
       "-map", "0:a?",  # Map audio if it exists.
       "-r", str(configs["video"].get("fps", 30)),  # Set the frame rate.
-      "-vcodec", configs["ffmpeg"].get("videoCodec", "libx264"),  # Set the video codec.
+      *self.GetVideoEncoderArgs(),  # Set the video codec and its preset (hardware encoder when available).
       "-acodec", configs["ffmpeg"].get("audioCodec", "libmp3lame"),  # Set the audio codec.
       "-ar", str(configs["ffmpeg"].get("sampleRate", 44100)),  # Set audio sample rate for consistency.
       "-ac", str(configs["ffmpeg"].get("channels", 2)),  # Set audio channels to stereo.
-      "-preset", "fast",  # Use a fast preset for encoding. It balances speed and quality.
       "-y",  # Overwrite output file without asking.
       outputFilePath  # Output video file.
     ]
@@ -759,10 +1120,9 @@ class FFMPEGHelper(object):
         "-map", "[outv]",
         "-map", "[outa]",
         "-r", str(configs["video"].get("fps", 30)),  # Set the frame rate.
-        "-vcodec", configs["ffmpeg"].get("videoCodec", "libx264"),  # Set the video codec.
+        *self.GetVideoEncoderArgs(),  # Set the video codec and its preset (hardware encoder when available).
         "-pix_fmt", configs["ffmpeg"].get("pixelFormat", "yuv420p"),  # Set the pixel format.
         "-acodec", configs["ffmpeg"].get("audioCodec", "libmp3lame"),  # Set the audio codec.
-        "-preset", "fast",  # Use a fast preset for encoding. It balances speed and quality.
         "-y",
         outputFilePath
       ]
@@ -873,12 +1233,11 @@ class FFMPEGHelper(object):
           "-map", "[outv]",  # Map the output video stream.
           "-map", "[outa]",  # Map the output audio stream.
           "-r", str(configs["video"].get("fps", 30)),  # Set the frame rate.
-          "-vcodec", configs["ffmpeg"].get("videoCodec", "libx264"),  # Set the video codec.
+          *self.GetVideoEncoderArgs(),  # Set the video codec and its preset (hardware encoder when available).
           "-acodec", configs["ffmpeg"].get("audioCodec", "libmp3lame"),  # Set the audio codec.
           "-ar", str(configs["ffmpeg"].get("sampleRate", 44100)),  # Set audio sample rate for consistency.
           "-ac", str(configs["ffmpeg"].get("channels", 2)),  # Set audio channels to stereo.
           "-pix_fmt", configs["ffmpeg"].get("pixelFormat", "yuv420p"),  # Set the pixel format.
-          "-preset", "fast",  # Use a fast preset for encoding. It balances speed and quality.
           "-y",  # Overwrite output file without asking.
           outputFilePath
         ]
@@ -920,13 +1279,12 @@ class FFMPEGHelper(object):
       "ffmpeg",  # Command to run ffmpeg.
       "-i", videoFilePath,  # Input video file.
       "-i", audioFilePath,  # Input audio file.
-      "-c:v", configs["ffmpeg"].get("videoCodec", "libx264"),  # Set the video codec.
+      *self.GetVideoEncoderArgs(),  # Set the video codec and its preset (hardware encoder when available).
       "-c:a", configs["ffmpeg"].get("audioCodec", "libmp3lame"),  # Set the audio codec.
       "-map", "0:v:0",  # Take video from first input (index 0, video stream 0).
       "-map", "1:a:0",  # Take audio from second input (index 1, audio stream 0).
       # Stop when the shortest stream ends. Other option is to use -t to specify duration. For example, -t 10 to limit the output to 10 seconds.
       "-shortest",
-      "-preset", "fast",  # Use a fast preset for encoding. It balances speed and quality.
       "-y",  # Overwrite output file without asking.
       outputFilePath  # Output merged video file.
     ]
@@ -990,35 +1348,22 @@ class FFMPEGHelper(object):
 
     return charWidths
 
-  async def AddCaptionsToVideo(
-    self,
-    videoFilePath,  # Path to the input video file.
-    outputFilePath,  # Path to save the output video file with captions.
-    captionsList,  # A list of dictionaries containing caption text and timing.
-    captionFontSize,  # Font size for captions.
-  ):
+  def _BuildCaptionFilters(self, videoWidth, videoHeight, captionsList, captionFontSize):
     r'''
-    Add word-by-word highlighted captions to a video file using ffmpeg.
-    Each word is highlighted during its specific time window.
+    Build the drawtext filters for word-by-word highlighted captions.
+    Each word gets a normal filter (visible during its caption) and a highlighted filter
+    (visible during its own time window).
 
     Parameters:
-      videoFilePath (str): Path to the input video file.
-      outputFilePath (str): Path to save the output video file with captions.
+      videoWidth (int): Width of the video in pixels.
+      videoHeight (int): Height of the video in pixels.
       captionsList (list): A list of dictionaries containing caption words and timing.
       captionFontSize (str|int): Font size for captions as a percentage string (e.g., "5%") or fixed size in pixels.
 
     Returns:
-      bool: True if captions were added successfully, False otherwise.
+      list: A list of drawtext filter strings.
     '''
 
-    # Get video dimensions.
-    dimensions = self.GetFileDimensions(videoFilePath)
-    if (dimensions is None):
-      if (VERBOSE):
-        logger.info(f"Failed to get video dimensions for: {videoFilePath}")
-      return False
-    videoWidth, videoHeight = dimensions
-
     fontType = configs["ffmpeg"].get("captionFont", "Arial")  # Default font type for captions.
     captionTextColor = configs["ffmpeg"].get("captionTextColor", "white")  # Default text color for captions.
     captionTextBorderColor = configs["ffmpeg"].get("captionTextBorderColor", "navy")  # Border color for caption text.
@@ -1178,8 +1523,327 @@ class FFMPEGHelper(object):
         )
         drawtextFilters.append(highlightFilter)
 
-    # Combine all drawtext filters.
-    vfFilter = ",".join(drawtextFilters)
+    return drawtextFilters
+
+  def _AssColor(self, color, default="white", alpha=None):
+    r'''
+    Convert a color name or hex string to the ASS color format.
+
+    Parameters:
+      color (str): Color name (e.g., "navy") or hex string (e.g., "#1E90FF").
+      default (str): Color used when the given one cannot be parsed.
+      alpha (int|None): Alpha value (0 = opaque) for style lines, or None for the "&HBBGGRR&" override tag format.
+
+    Returns:
+      str: The color in ASS format.
+    '''
+
+    try:
+      red, green, blue = ImageColor.getrgb(str(color))[:3]
+    except ValueError:
+      red, green, blue = ImageColor.getrgb(default)[:3]
+    if (alpha is None):
+      return f"&H{blue:02X}{green:02X}{red:02X}&"
+    return f"&H{alpha:02X}{blue:02X}{green:02X}{red:02X}"
+
+  def _GetSubtitlesStyle(self, videoWidth, videoHeight, captionFontSize):
+    r'''
+    Get the caption style for the libass renderers, following the drawtext captions settings.
+
+    Parameters:
+      videoWidth (int): Width of the video in pixels.
+      videoHeight (int): Height of the video in pixels.
+      captionFontSize (str|int): Font size for captions as a percentage string (e.g., "5%") or fixed size in pixels.
+
+    Returns:
+      dict: The style values (sizes in video pixels, colors as names).
+    '''
+
+    fontType = configs["ffmpeg"].get("captionFont", "Arial")  # Default font type for captions.
+    # Caption position and offset. Position of captions (top, bottom, center).
+    captionPosition = configs["ffmpeg"].get("captionPosition", "bottom")
+    captionPositionOffset = configs["ffmpeg"].get("captionPositionOffset", "15%")  # Offset for caption position.
+    # Border width for highlighted text (percentage of the font size).
+    captionTextBorderWidthHighlighted = configs["ffmpeg"].get("captionTextBorderWidthHighlighted", "0.1%")
+    # Border color for highlighted text.
+    captionTextBorderColorHighlighted = configs["ffmpeg"].get("captionTextBorderColorHighlighted", "orange")
+
+    # Calculate relative font size (as percentage of video width).
+    if (isinstance(captionFontSize, str) and captionFontSize.endswith("%")):
+      fontSize = int(videoWidth * float(captionFontSize.rstrip("%")) / 100)
+    else:
+      fontSize = int(captionFontSize)
+
+    # Calculate the vertical margin (as percentage of video height).
+    if (isinstance(captionPositionOffset, str) and captionPositionOffset.endswith("%")):
+      marginV = int(videoHeight * float(captionPositionOffset.rstrip("%")) / 100)
+    else:
+      marginV = int(captionPositionOffset)
+
+    # Calculate the highlighted border width (as percentage of the font size).
+    if (isinstance(captionTextBorderWidthHighlighted, str) and captionTextBorderWidthHighlighted.endswith("%")):
+      borderWidthHighlighted = fontSize * float(captionTextBorderWidthHighlighted.rstrip("%")) / 100
+    else:
+      borderWidthHighlighted = float(captionTextBorderWidthHighlighted)
+
+    if (captionTextBorderColorHighlighted == "random"):
+      # Randomly choose a border color from the list.
+      captionTextBorderColorHighlighted = random.choice(configs.get("colors", ["blue"]))
+
+    # Validate caption position.
+    if (captionPosition not in ["top", "bottom", "middle"]):
+      # Randomly choose a position if not specified.
+      captionPosition = random.choice(["top", "bottom", "middle"])
+
+    # A font file is loaded from its directory and selected by its name;
+    # a plain font name is looked up in the system fonts.
+    fontName, fontExt = os.path.splitext(os.path.basename(fontType))
+
+    return {
+      "fontName"              : fontName,
+      "fontsDir"              : os.path.dirname(os.path.abspath(fontType)) if (fontExt) else None,
+      "fontSize"              : fontSize,
+      "textColor"             : configs["ffmpeg"].get("captionTextColor", "white"),
+      "borderColor"           : configs["ffmpeg"].get("captionTextBorderColor", "navy"),
+      "borderWidth"           : int(configs["ffmpeg"].get("captionTextBorderWidth", "2")),
+      "textColorHighlighted"  : configs["ffmpeg"].get("captionTextColorHighlighted", "navy"),
+      "borderColorHighlighted": captionTextBorderColorHighlighted,
+      "borderWidthHighlighted": round(borderWidthHighlighted, 2),
+      # ASS numpad alignment: 2 = bottom center, 8 = top center, 5 = middle center.
+      "alignment"             : {"bottom": 2, "top": 8, "middle": 5}[captionPosition],
+      "marginV"               : marginV,
+    }
+
+  def _CaptionWordText(self, word):
+    r'''
+    Normalize a caption word like the drawtext captions (uppercase, no single quotes),
+    dropping the characters that are special in subtitle files.
+    '''
+
+    word = word.upper().strip().replace("'", "")
+    return word.replace("{", "").replace("}", "").replace("\\", "")
+
+  def _WriteSrt(self, captionsList, srtFilePath):
+    r'''
+    Write the captions to an SRT file with one cue per caption line.
+    Each cue spans from the first word start to the last word end of its line.
+
+    Parameters:
+      captionsList (list): A list of dictionaries containing caption words and timing.
+      srtFilePath (str): Path to save the SRT file.
+
+    Returns:
+      int: The number of cues written.
+    '''
+
+    def FormatTime(seconds):
+      # Format the seconds as an SRT timestamp (HH:MM:SS,mmm).
+      totalMillis = int(round(max(float(seconds), 0.0) * 1000))
+      hours, totalMillis = divmod(totalMillis, 3600000)
+      minutes, totalMillis = divmod(totalMillis, 60000)
+      secs, millis = divmod(totalMillis, 1000)
+      return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+    cues = []
+    for caption in captionsList:
+      words = caption.get("words", [])
+      if (not words):
+        continue
+      text = " ".join(self._CaptionWordText(wordInfo["word"]) for wordInfo in words)
+      cues.append(
+        f"{len(cues) + 1}\n"
+        f"{FormatTime(words[0]['start'])} --> {FormatTime(words[-1]['end'])}\n"
+        f"{text}\n"
+      )
+
+    with open(srtFilePath, "w", encoding="utf-8") as f:
+      f.write("\n".join(cues))
+    return len(cues)
+
+  def _WriteAss(self, captionsList, assFilePath, style):
+    r'''
+    Write the captions to an ASS file with word-by-word highlighting.
+    Each caption line is split at its word boundaries into consecutive events; in each event the
+    words whose time window covers it carry color and border override tags, so libass renders
+    the same output as the normal and highlighted drawtext filters.
+
+    Parameters:
+      captionsList (list): A list of dictionaries containing caption words and timing.
+      assFilePath (str): Path to save the ASS file.
+      style (dict): The caption style from _GetSubtitlesStyle().
+
+    Returns:
+      int: The number of events written.
+    '''
+
+    def FormatTime(centiseconds):
+      # Format the centiseconds as an ASS timestamp (H:MM:SS.cs).
+      hours, centiseconds = divmod(centiseconds, 360000)
+      minutes, centiseconds = divmod(centiseconds, 6000)
+      secs, centiseconds = divmod(centiseconds, 100)
+      return f"{hours:d}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
+
+    # Override tags switching a word to the highlighted style and back to the line style.
+    highlightTag = (
+      "{\\c" + self._AssColor(style["textColorHighlighted"]) +
+      "\\3c" + self._AssColor(style["borderColorHighlighted"]) +
+      "\\bord" + str(style["borderWidthHighlighted"]) + "}"
+    )
+    resetTag = "{\\r}"
+
+    lines = [
+      "[Script Info]",
+      "ScriptType: v4.00+",
+      f"PlayResX: {style['playResX']}",
+      f"PlayResY: {style['playResY']}",
+      "WrapStyle: 2",  # No line wrapping (the lines are already sized to the video).
+      "ScaledBorderAndShadow: yes",
+      "",
+      "[V4+ Styles]",
+      "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+      "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+      "Alignment, MarginL, MarginR, MarginV, Encoding",
+      f"Style: Default,{style['fontName']},{style['fontSize']},"
+      f"{self._AssColor(style['textColor'], alpha=0)},{self._AssColor(style['textColor'], alpha=0)},"
+      f"{self._AssColor(style['borderColor'], 'navy', alpha=0)},&H00000000,"
+      f"0,0,0,0,100,100,0,0,1,{style['borderWidth']},0,{style['alignment']},0,0,{style['marginV']},1",
+      "",
+      "[Events]",
+      "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+
+    numberOfEvents = 0
+    for caption in captionsList:
+      words = caption.get("words", [])
+      if (not words):
+        continue
+      texts = [self._CaptionWordText(wordInfo["word"]) for wordInfo in words]
+      # Word windows in centiseconds (the ASS time resolution).
+      starts = [int(round(max(float(wordInfo["start"]), 0.0) * 100)) for wordInfo in words]
+      ends = [int(round(max(float(wordInfo["end"]), 0.0) * 100)) for wordInfo in words]
+      # Split the line at every word boundary between its first start and last end.
+      boundaries = sorted(set(starts + ends + [starts[0], ends[-1]]))
+      boundaries = [t for t in boundaries if (starts[0] <= t <= ends[-1])]
+      for eventStart, eventEnd in zip(boundaries[:-1], boundaries[1:]):
+        text = " ".join(
+          (highlightTag + texts[i] + resetTag) if (starts[i] <= eventStart and ends[i] >= eventEnd) else texts[i]
+          for i in range(len(words))
+        )
+        lines.append(f"Dialogue: 0,{FormatTime(eventStart)},{FormatTime(eventEnd)},Default,,0,0,0,,{text}")
+        numberOfEvents += 1
+
+    with open(assFilePath, "w", encoding="utf-8") as f:
+      f.write("\n".join(lines) + "\n")
+    return numberOfEvents
+
+  def _BuildSubtitlesFilter(self, subtitlesFilePath, style, forceStyle=False):
+    r'''
+    Build the libass `subtitles` filter that burns a subtitles file into the video.
+
+    Parameters:
+      subtitlesFilePath (str): Path to the subtitles file.
+      style (dict): The caption style from _GetSubtitlesStyle().
+      forceStyle (bool): Whether to pass the style through force_style (SRT files carry no style).
+
+    Returns:
+      str: The subtitles filter string.
+    '''
+
+    def EscapePath(path):
+      # Forward slashes and escaped colons (Windows drive letters) inside the quoted option.
+      return os.path.abspath(path).replace('\\', '/').replace(':', '\\:')
+
+    subtitlesFilter = f"subtitles=filename='{EscapePath(subtitlesFilePath)}'"
+    if (style["fontsDir"]):
+      subtitlesFilter += f":fontsdir='{EscapePath(style['fontsDir'])}'"
+    if (forceStyle):
+      # Render in video pixels so the sizes match the drawtext captions.
+      subtitlesFilter += ":force_style='" + ",".join([
+        f"PlayResX={style['playResX']}",
+        f"PlayResY={style['playResY']}",
+        f"FontName={style['fontName']}",
+        f"FontSize={style['fontSize']}",
+        f"PrimaryColour={self._AssColor(style['textColor'])}",
+        f"OutlineColour={self._AssColor(style['borderColor'], 'navy')}",
+        "BorderStyle=1",
+        f"Outline={style['borderWidth']}",
+        "Shadow=0",
+        f"Alignment={style['alignment']}",
+        f"MarginV={style['marginV']}",
+      ]) + "'"
+    return subtitlesFilter
+
+  def _PrepareCaptionFilters(self, videoWidth, videoHeight, captionsList, captionFontSize):
+    r'''
+    Build the caption filters with the configured renderer (`captionRenderer`):
+    "ass" (one libass filter, word-by-word highlight), "subtitles" (one libass filter, SRT lines
+    without highlight), or "drawtext" (two drawtext filters per word).
+
+    Parameters:
+      videoWidth (int): Width of the video in pixels.
+      videoHeight (int): Height of the video in pixels.
+      captionsList (list): A list of dictionaries containing caption words and timing.
+      captionFontSize (str|int): Font size for captions as a percentage string (e.g., "5%") or fixed size in pixels.
+
+    Returns:
+      tuple: (list of filter strings, path of the temporary subtitles file or None).
+    '''
+
+    captionRenderer = configs["ffmpeg"].get("captionRenderer", "ass")
+    if (captionRenderer not in ["ass", "subtitles"]):
+      # Two drawtext filters per word (normal and highlighted).
+      return self._BuildCaptionFilters(videoWidth, videoHeight, captionsList, captionFontSize), None
+
+    style = self._GetSubtitlesStyle(videoWidth, videoHeight, captionFontSize)
+    style["playResX"], style["playResY"] = videoWidth, videoHeight
+    suffix = ".ass" if (captionRenderer == "ass") else ".srt"
+    with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as f:
+      subtitlesFilePath = f.name
+    if (captionRenderer == "ass"):
+      numberOfEntries = self._WriteAss(captionsList, subtitlesFilePath, style)
+    else:
+      numberOfEntries = self._WriteSrt(captionsList, subtitlesFilePath)
+    if (numberOfEntries == 0):
+      return [], subtitlesFilePath  # Nothing to burn.
+    subtitlesFilter = self._BuildSubtitlesFilter(subtitlesFilePath, style, forceStyle=(captionRenderer != "ass"))
+    return [subtitlesFilter], subtitlesFilePath
+
+  async def AddCaptionsToVideo(
+    self,
+    videoFilePath,  # Path to the input video file.
+    outputFilePath,  # Path to save the output video file with captions.
+    captionsList,  # A list of dictionaries containing caption text and timing.
+    captionFontSize,  # Font size for captions.
+  ):
+    r'''
+    Add word-by-word highlighted captions to a video file using ffmpeg.
+    Each word is highlighted during its specific time window (see `captionRenderer`).
+
+    Parameters:
+      videoFilePath (str): Path to the input video file.
+      outputFilePath (str): Path to save the output video file with captions.
+      captionsList (list): A list of dictionaries containing caption words and timing.
+      captionFontSize (str|int): Font size for captions as a percentage string (e.g., "5%") or fixed size in pixels.
+
+    Returns:
+      bool: True if captions were added successfully, False otherwise.
+    '''
+
+    # Get video dimensions.
+    dimensions = self.GetFileDimensions(videoFilePath)
+    if (dimensions is None):
+      if (VERBOSE):
+        logger.info(f"Failed to get video dimensions for: {videoFilePath}")
+      return False
+    videoWidth, videoHeight = dimensions
+
+    # Build the caption filters (a single subtitles filter or the drawtext filters).
+    captionFilters, subtitlesFilePath = self._PrepareCaptionFilters(
+      videoWidth, videoHeight, captionsList, captionFontSize
+    )
+
+    # Combine all caption filters.
+    vfFilter = ",".join(captionFilters) if (captionFilters) else "null"
 
     # Create a temporary file for the filter.
     with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as filterFile:
@@ -1193,20 +1857,23 @@ class FFMPEGHelper(object):
       "-i", videoFilePath,
       # "-vf", vfFilter,
       "-filter_complex_script", tempFilterFilePath,
-      "-c:v", configs["ffmpeg"]["videoCodec"],
+      *self.GetVideoEncoderArgs(),  # Set the video codec and its preset (hardware encoder when available).
       "-c:a", configs["ffmpeg"]["audioCodec"],
       # "-f", "segment",
       # "-segment_time", str(1),  # Segment duration in seconds.
       # "-segment_format", videoFormat,  # Segment format.
       # "-reset_timestamps", "1",  # Reset timestamps for each segment.
       # "-segment_start_number", "0",  # Start from 0
-      "-preset", "fast",  # Use a fast preset for encoding. It balances speed and quality.
       "-y",
       outputFilePath
       # .replace(f".{videoFormat}", f"_%03d.{videoFormat}")  # Output video file with segment numbering.
     ]
 
     success, process = await self._ExecuteFFmpegCommand(ffmpegCommand, "AddCaptionsToVideo")
+    # Remove the temporary files.
+    for tempPath in (tempFilterFilePath, subtitlesFilePath):
+      if (tempPath and os.path.exists(tempPath)):
+        os.remove(tempPath)
     if (success):
       if (VERBOSE):
         logger.info(f"Captions added successfully to video: {outputFilePath}")
@@ -1216,6 +1883,131 @@ class FFMPEGHelper(object):
         logger.info(f"Failed to add captions to video: {videoFilePath}")
       return False
 
+  async def BuildFullPipeline(
+    self,
+    videoFilePaths,  # List of paths to the background video files.
+    audioFilePaths,  # List of paths to the audio files to concatenate.
+    captionsList,  # A list of dictionaries containing caption text and timing.
+    captionFontSize,  # Font size for captions.
+    outputFilePath,  # Path to save the final captioned video file.
+    start,  # Start time in seconds for each video portion.
+    end,  # End time in seconds for each video portion.
+    width,  # Width of the output video.
+    height,  # Height of the output video.
+  ):
+    r'''
+    Produce the final captioned video in a single ffmpeg pass.
+    The video portions are trimmed, scaled, and concatenated, the audio files are concatenated
+    (concat demuxer), and the captions are burned (a temporary ASS/SRT file through the `subtitles`
+    filter or drawtext filters, see `captionRenderer`) in one filter graph, so the video is decoded
+    and encoded only once and no intermediate video or audio files are written.
+
+    Parameters:
+      videoFilePaths (list): List of paths to the background video files.
+      audioFilePaths (list): List of paths to the audio files to concatenate.
+      captionsList (list): A list of dictionaries containing caption words and timing.
+      captionFontSize (str|int): Font size for captions as a percentage string (e.g., "5%") or fixed size in pixels.
+      outputFilePath (str): Path to save the final captioned video file.
+      start (int): Start time in seconds for each video portion.
+      end (int): End time in seconds for each video portion.
+      width (int): Width of the output video.
+      height (int): Height of the output video.
+
+    Returns:
+      bool: True if the video was created successfully, False otherwise.
+    '''
+
+    fileListPath = None
+    tempFilterFilePath = None
+    subtitlesFilePath = None
+    try:
+      # Create the video inputs.
+      inputs = []
+      for filePath in videoFilePaths:
+        inputs.extend(["-i", filePath.replace('\\', '/')])
+
+      # Create a temporary file with the list of audio files (concat demuxer input).
+      with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+        for filePath in audioFilePaths:
+          # Use absolute forward-slash paths and escape single quotes.
+          ffPath = os.path.abspath(filePath).replace('\\', '/').replace("'", "'\"'\"'")
+          f.write(f"file '{ffPath}'\n")
+        fileListPath = f.name
+      audioInputIndex = len(videoFilePaths)  # The audio list is the last input.
+
+      # Trim, scale, and pad each video portion.
+      pixelFormat = configs["ffmpeg"].get("pixelFormat", "yuv420p")
+      filterParts = []
+      for i in range(len(videoFilePaths)):
+        filterParts.append(
+          f"[{i}:v]trim=start={start}:end={end},setpts=PTS-STARTPTS,"
+          f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+          f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,"
+          f"setsar=1/1,format={pixelFormat}[v{i}]"
+        )
+      # Concatenate the video portions (their own audio is not used).
+      concatInputs = "".join(f"[v{i}]" for i in range(len(videoFilePaths)))
+      filterParts.append(f"{concatInputs}concat=n={len(videoFilePaths)}:v=1:a=0[vcat]")
+
+      # Burn the captions into the concatenated video.
+      captionFilters, subtitlesFilePath = self._PrepareCaptionFilters(width, height, captionsList, captionFontSize)
+      # Upload the frames to the device when the hardware encoder requires it.
+      hwFilterSuffix = self.GetVideoEncoderFilterSuffix(allowHwUpload=True)
+      if (captionFilters):
+        filterParts.append("[vcat]" + ",".join(captionFilters) + hwFilterSuffix + "[outv]")
+      else:
+        filterParts.append("[vcat]null" + hwFilterSuffix + "[outv]")
+      filterComplex = "; ".join(filterParts)
+
+      # Write the filter graph to a temporary script file (it can be very long).
+      with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as filterFile:
+        filterFile.write(filterComplex)
+        tempFilterFilePath = filterFile.name
+
+      ffmpegCommand = [
+        "ffmpeg",
+        *self.GetVideoEncoderInputArgs(allowHwUpload=True),  # Hardware device arguments (if any).
+        *inputs,  # Input video files.
+        "-f", "concat",  # Use the concat demuxer for the audio files.
+        "-safe", "0",  # Allow absolute paths in the list file.
+        "-i", fileListPath,  # Audio files list.
+        "-filter_complex_script", tempFilterFilePath,  # Use the filter complex from the temporary file.
+        "-map", "[outv]",  # Map the captioned video stream.
+        "-map", f"{audioInputIndex}:a:0",  # Map the concatenated audio stream.
+        "-r", str(configs["video"].get("fps", 30)),  # Set the frame rate.
+        *self.GetVideoEncoderArgs(allowHwUpload=True),  # Set the video codec and its preset.
+        "-c:a", configs["ffmpeg"].get("audioCodec", "libmp3lame"),  # Set the audio codec.
+        "-ar", str(configs["ffmpeg"].get("sampleRate", 44100)),  # Set audio sample rate for consistency.
+        "-ac", str(configs["ffmpeg"].get("channels", 2)),  # Set audio channels to stereo.
+        # Set the pixel format (hardware-uploaded frames already carry their device format).
+        *([] if (hwFilterSuffix) else ["-pix_fmt", pixelFormat]),
+        "-shortest",  # Stop when the shortest stream (the audio) ends.
+        "-y",  # Overwrite output file without asking.
+        outputFilePath
+      ]
+
+      success, process = await self._ExecuteFFmpegCommand(ffmpegCommand, "BuildFullPipeline")
+      if (success):
+        if (VERBOSE):
+          logger.info(f"Captioned video created in a single pass: {outputFilePath}")
+        return True
+      else:
+        if (VERBOSE):
+          logger.info(f"Single-pass video creation failed for: {outputFilePath}")
+        return False
+    except Exception as e:
+      if (VERBOSE):
+        logger.info(f"Unexpected error in `BuildFullPipeline`: {str(e)}")
+      return False
+    finally:
+      # Remove the temporary files.
+      for tempPath in (fileListPath, tempFilterFilePath, subtitlesFilePath):
+        try:
+          if (tempPath and os.path.exists(tempPath)):
+            os.remove(tempPath)
+        except Exception:
+          pass
+
   async def MixAudioFiles(
     self,
     audioFilePaths,  # List of paths to audio files to mix.
@@ -1596,7 +2388,6 @@ class FFMPEGHelper(object):
 
     if (semitones == 0):
       # No shift needed.
-      import shutil
       shutil.copy(audioFilePath, outputFilePath)
       return True
 
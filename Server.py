@@ -24,7 +24,7 @@ import os
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"  # Suppress TensorFlow logs.
 
 # Import necessary libraries.
-import os, yaml, json, logging
+import os, logging, threading
 from logging.handlers import RotatingFileHandler
 from flask import Flask, request, jsonify, render_template
 from apiRoutes import apiBp
@@ -33,6 +33,7 @@ from routes import webBp
 from datetime import datetime
 from VideoCreatorHelper import VideoCreatorHelper
 from TextToSpeechHelper import TextToSpeechHelper
+from ConfigsLoader import LoadConfigs
 
 
 def ProcessJob(jobId):
@@ -47,8 +48,7 @@ def ProcessJob(jobId):
 
   # Before switching to processing, check cancel flag if present.
   try:
-    with open(os.path.join(jobDir, "job.json"), "r") as f:
-      preData = json.load(f)
+    preData = ReadJsonFile(os.path.join(jobDir, "job.json"))
     if (preData.get("cancelRequested", False)):
       jobHistoryObj.updateStatus(jobId, "canceled")
       UpdateJobStatus(jobId, "canceled")
@@ -65,8 +65,7 @@ def ProcessJob(jobId):
 
   try:
     # Read the job data from the JSON file.
-    with open(os.path.join(jobDir, "job.json"), "r") as f:
-      jobData = json.load(f)
+    jobData = ReadJsonFile(os.path.join(jobDir, "job.json"))
 
     # Check cancellation again at start of processing.
     if (jobData.get("cancelRequested", False)):
@@ -119,6 +118,8 @@ def ProcessJob(jobId):
     # Initialize the video creator helper if not already available.
     if (not videoCreator):
       videoCreator = VideoCreatorHelper()
+      # Persist the video creator instance in the app config for reuse (also after a failed job).
+      app.config["videoCreator"] = videoCreator
 
     # Generate a video from the provided text.
     isGenerated, videoID = videoCreator.GenerateVideo(
@@ -142,9 +143,6 @@ def ProcessJob(jobId):
     jobHistoryObj.updateStatus(jobId, "completed")
     UpdateJobStatus(jobId, "completed")
 
-    # Persist the video creator instance in the app config for reuse.
-    app.config["videoCreator"] = videoCreator
-
   except Exception as e:
     # On any exception during processing, mark job as failed and log the error.
     if (verbose):
@@ -162,22 +160,20 @@ def UpdateJobStatus(jobId, status):
 
   # Read the existing job data and return if not found.
   try:
-    with open(jobFilePath, "r") as f:
-      jobData = json.load(f)
+    jobData = ReadJsonFile(jobFilePath)
   except FileNotFoundError:
     return
 
   # Update the status and write back the job data.
   jobData["status"] = status
-  with open(jobFilePath, "w") as f:
-    json.dump(jobData, f)
+  WriteJsonFile(jobFilePath, jobData)
+  fileSyncer.sync(jobFilePath)
 
   if (verbose):
     logger.info(f"Job {jobId} status updated to: {status}")
 
 
-with open("configs.yaml", "r") as configFile:
-  configs = yaml.safe_load(configFile)
+configs = LoadConfigs()  # Shared configuration settings (configs.yaml is parsed once per process).
 
 # Get the verbose setting from the config.
 verbose = configs.get("verbose", False)
@@ -241,17 +237,32 @@ else:
 
 # Define the directory where job data will be stored.
 os.makedirs(storePath, exist_ok=True)
+SweepTrash(storePath)  # Finish deletions interrupted by an earlier shutdown or crash.
+
+# Flush the written job.json files to disk in the background (grouped across requests).
+fileSyncer = FileSyncer()
+fileSyncer.start()
 
 # Create the Flask application and store configuration values in app.config.
 app = Flask(__name__)
 app.secret_key = configs.get("secret", "default_secret_key")
+app.json = OrjsonProvider(app)  # Serialize JSON responses with orjson when it is installed.
+app.request_class = UploadRequest  # Spool large uploads straight to disk under the store path.
 app.config["STORE_PATH"] = storePath
+# Reject request bodies above the configured upload size with 413 (0 disables the limit).
+app.config["MAX_CONTENT_LENGTH"] = (configs["api"].get("maxUploadMB", 0) * 1024 * 1024) or None
+# Hand file downloads to the reverse proxy (X-Sendfile / X-Accel-Redirect) when configured.
+app.config["USE_X_SENDFILE"] = (configs["api"].get("sendfileOffload", "none") != "none")
 app.config["JOB_HISTORY_OBJ"] = jobHistoryObj
+app.config["JOB_META_OBJ"] = {}  # Cached job.json data by job ID (used by the jobs listing).
 app.config["configs"] = configs
 app.config["MAX_JOBS"] = maxJobs
 app.config["MAX_TIMEOUT"] = maxTimeout
 app.config["VERBOSE"] = verbose
 app.config["QUEUE_WATCHER"] = queueWatcher
+app.config["QUEUE_WATCHER_LOCK"] = threading.Lock()  # Guards restarting the queue watcher.
+app.config["FILE_SYNCER"] = fileSyncer
+app.config["BG_LOOP"] = StartBackgroundLoop()  # Shared event loop for the async FFMPEG calls of the routes.
 app.config["TEST_MODE"] = testMode
 app.config["ProcessJob"] = ProcessJob
 app.config["logger"] = logger
@@ -266,13 +277,16 @@ if (__name__ == "__main__"):
   # Load the previously saved job statuses if they exist.
   jobsList = os.listdir(storePath)
   # Filter out non-directory entries from jobs list.
-  jobsList = [jobId for jobId in jobsList if os.path.isdir(os.path.join(storePath, jobId))]
+  jobsList = [
+    jobId for jobId in jobsList
+    if ((jobId != TRASH_DIR_NAME) and os.path.isdir(os.path.join(storePath, jobId)))
+  ]
   for jobId in jobsList:
     jobFilePath = os.path.join(storePath, jobId, "job.json")
     if (os.path.exists(jobFilePath)):
       try:
-        with open(jobFilePath, "r") as f:
-          jobData = json.load(f)
+        jobData = ReadJsonFile(jobFilePath)
+        app.config["JOB_META_OBJ"][jobId] = jobData  # Warm the metadata cache.
         jobHistoryObj.updateStatus(jobId, jobData.get("status", "unknown"))
         jobStatus = jobHistoryObj.get(jobId, "unknown")
         if ((jobStatus == "queued") or (jobStatus == "processing")):
@@ -14,19 +14,82 @@ import shutup
 shutup.please()  # This function call suppresses unnecessary warnings from libraries such as PyTorch.
 
 # Import necessary libraries for the text-to-speech system.
-import torch, os, time, random, asyncio, yaml
+import torch, os, random, asyncio, itertools, secrets, pathlib
 import soundfile as sf
 from kokoro import KPipeline
 from FFMPEGHelper import FFMPEGHelper
+from ConfigsLoader import LoadConfigs
+
+# Optional ONNX Runtime backend (kokoro-onnx) for CPU-only deployments.
+try:
+  import onnxruntime as ort
+  from kokoro_onnx import Kokoro as KokoroOnnx
+except ImportError:
+  ort = None  # ONNX Runtime is not installed.
+  KokoroOnnx = None  # kokoro-onnx is not installed.
 
 # Load configuration settings from the YAML file.
-with open("configs.yaml", "r") as configFile:
-  configs = yaml.safe_load(configFile)  # Parse the YAML configuration file.
+configs = LoadConfigs()  # Shared configuration settings (configs.yaml is parsed once per process).
 
 # Get the verbose setting from the config. If not found, default to False.
 VERBOSE = configs.get("verbose", False)
 
 
+class _KokoroOnnxAdapter(object):
+  """An adapter exposing the KPipeline call surface on top of an ONNX Runtime Kokoro session."""
+
+  # Map the helper language codes to the espeak codes used by kokoro-onnx.
+  languageMap = {
+    "en-us": "en-us",  # American English.
+    "en-gb": "en-gb",  # British English.
+    "es"   : "es",  # Spanish.
+    "fr"   : "fr-fr",  # French.
+    "hi"   : "hi",  # Hindi.
+    "it"   : "it",  # Italian.
+    "ja"   : "ja",  # Japanese.
+    "pt-br": "pt-br",  # Brazilian Portuguese.
+    "zh"   : "cmn",  # Mandarin Chinese.
+  }
+
+  def __init__(self, modelPath, voicesPath):
+    """Creates the ONNX Runtime session and the kokoro-onnx model wrapper."""
+
+    if ((ort is None) or (KokoroOnnx is None)):
+      # Raise an error if the optional dependencies are missing.
+      raise ImportError("The 'kokoro-onnx' backend requires: pip install kokoro-onnx onnxruntime")
+
+    # Enable all graph optimizations and use every available core.
+    sessionOptions = ort.SessionOptions()
+    sessionOptions.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sessionOptions.intra_op_num_threads = os.cpu_count()
+    # Prefer CUDA when available, otherwise fall back to the CPU provider.
+    availableProviders = ort.get_available_providers()
+    providers = [
+      provider for provider in ["CUDAExecutionProvider", "CPUExecutionProvider"]
+      if (provider in availableProviders)
+    ]
+    session = ort.InferenceSession(modelPath, sess_options=sessionOptions, providers=providers)
+    self.model = KokoroOnnx.from_session(session, voicesPath)  # Wrap the session with kokoro-onnx.
+    self.lang = "en-us"  # Default espeak language code.
+
+  def SetLanguage(self, language):
+    """Sets the espeak language code used for phonemization."""
+
+    self.lang = self.languageMap.get(language, "en-us")  # Map the language or default to American English.
+
+  def load_voice(self, voice):
+    """Returns the style vector of the given voice (mirrors KPipeline.load_voice)."""
+
+    return self.model.get_voice_style(voice)  # Load the voice style from the voices file.
+
+  def __call__(self, text, voice, speed=1.0):
+    """Synthesizes the text and yields a single (text, phonemes, audio) chunk like KPipeline."""
+
+    # Generate the audio samples for the whole text.
+    samples, _ = self.model.create(text, voice=voice, speed=speed, lang=self.lang)
+    yield text, "", samples  # Phonemes are not exposed by kokoro-onnx.
+
+
 class TextToSpeechHelper(object):
   """A helper class for managing text-to-speech operations, including language and voice selection."""
 
@@ -88,8 +151,11 @@ class TextToSpeechHelper(object):
       "pf_dora", "pm_alex", "pm_santa"
     ]
 
+    # Precompute a frozen set of the voice files for constant-time validation.
+    self._voiceSet = frozenset(self.voiceFiles)
+
     # Define a subset of English voices for random selection.
-    self.englishVoices = self.voiceFiles[:20]  # First 20 voices are English.
+    self.englishVoices = tuple(self.voiceFiles[:20])  # First 20 voices are English.
 
     # Default settings for the TTS system, loaded from the configuration file.
     self.language = configs["tts"].get("language", "en-us")  # Default language is American English.
@@ -97,6 +163,9 @@ class TextToSpeechHelper(object):
     self.selectedVoice = configs["tts"].get("voice", "af_nova")  # Default voice is af_nova.
     self.speechRate = configs["tts"].get("speechRate", 1.0)  # Default speech rate.
     self.sampleRate = configs["tts"].get("sampleRate", 44100)  # Sample rate for audio processing.
+    self.backend = configs["tts"].get("backend", "kokoro")  # TTS backend: "kokoro" or "kokoro-onnx".
+    self._onnxAdapter = None  # Lazily created ONNX Runtime adapter.
+    self._idCounter = itertools.count()  # Monotonic counter for default unique identifiers.
 
   def GetAvailableLanguages(self):
     """Returns a dictionary of available languages mapped by their codes."""
@@ -158,16 +227,34 @@ class TextToSpeechHelper(object):
     self.langCode = self.language2code[language]  # Update the language code.
     self.language = language  # Update the selected language.
     # Initialize the TTS pipeline with the new language code.
-    self.pipeline = KPipeline(lang_code=self.langCode, repo_id="hexgrad/Kokoro-82M")
+    self.pipeline = self._CreatePipeline()
     return self.pipeline  # Return the initialized pipeline.
 
+  def _CreatePipeline(self):
+    """Creates the TTS pipeline for the configured backend and the current language."""
+
+    if (self.backend == "kokoro-onnx"):
+      if (self._onnxAdapter is None):
+        # Create the ONNX Runtime session once and reuse it across calls.
+        self._onnxAdapter = _KokoroOnnxAdapter(
+          configs["tts"].get("onnxModelPath", "./Assets/Models/kokoro-v1.0.int8.onnx"),
+          configs["tts"].get("onnxVoicesPath", "./Assets/Models/voices-v1.0.bin"),
+        )
+      self._onnxAdapter.SetLanguage(self.language)  # Keep the adapter language in sync.
+      return self._onnxAdapter
+    # Default to the PyTorch Kokoro pipeline.
+    pipeline = KPipeline(lang_code=self.langCode, repo_id="hexgrad/Kokoro-82M")
+    if (getattr(pipeline, "model", None) is not None):
+      pipeline.model.eval()  # Put the model in evaluation mode once after construction.
+    return pipeline
+
   def SetVoice(self, voiceFile):
     """Sets the voice for the TTS pipeline. Supports random selection if 'random' is passed."""
 
     if (voiceFile == "random"):
       # Randomly select a voice from the available English voices.
       voiceFile = random.choice(self.englishVoices)
-    if (voiceFile not in self.voiceFiles):  # Check if the voice file is supported.
+    if (voiceFile not in self._voiceSet):  # Check if the voice file is supported.
       # Raise an error if the voice file is unsupported.
       raise ValueError(f"Unsupported voice file: {voiceFile}")
     self.selectedVoice = voiceFile  # Update the selected voice.
@@ -175,17 +262,37 @@ class TextToSpeechHelper(object):
 
   def GenerateYieldSpeech(self, text):
     """Generates speech from the given text using the selected voice and speech rate, yielding audio chunks."""
-    # Set up the pipeline with the selected language and voice.
-    self.pipeline = KPipeline(lang_code=self.langCode, repo_id="hexgrad/Kokoro-82M")
-
-    # Generate speech using the pipeline.
-    generator = self.pipeline(text, voice=self.selectedVoice, speed=self.speechRate)
-
-    # Iterate over the generated speech chunks and yield them.
-    for i, (generatedText, phonemes, audio) in enumerate(generator):
+    for _, generatedText, phonemes, audio in self.GenerateYieldSpeechTexts([text]):
       # Yield each chunk of generated speech.
       yield generatedText, phonemes, audio
 
+  def GenerateYieldSpeechTexts(self, texts):
+    """
+    Generates speech for several texts in order with a single pipeline instance, yielding audio chunks.
+    The texts are synthesized one after the other: the Kokoro pipeline has no batch dimension.
+    Parameters:
+      texts (list): The list of texts to convert to speech.
+    Yields:
+      tuple: The index of the source text, the generated text, the phonemes, and the audio chunk.
+    """
+    # Set up the pipeline with the selected language and voice.
+    self.pipeline = self._CreatePipeline()
+
+    for idx, text in enumerate(texts):
+      # Generate speech using the pipeline.
+      generator = iter(self.pipeline(text, voice=self.selectedVoice, speed=self.speechRate))
+
+      # Iterate over the generated speech chunks and yield them.
+      while (True):
+        # Run the forward pass without autograd bookkeeping.
+        with torch.inference_mode():
+          chunk = next(generator, None)
+        if (chunk is None):
+          break  # Stop when the generator is exhausted.
+        generatedText, phonemes, audio = chunk
+        # Yield each chunk of generated speech with the source index.
+        yield idx, generatedText, phonemes, audio
+
   def GenerateStoreSpeech(
     self,
     text,
@@ -196,6 +303,7 @@ class TextToSpeechHelper(object):
     language=None,
     voice=None,
     speechRate=None,
+    keepAudio=True,
   ):
     """
     Generates speech from the given text and stores the audio data in the
@@ -206,10 +314,54 @@ class TextToSpeechHelper(object):
       audioFormat (str): The format of the audio files (default is "mp3").
       applyNormalization (bool): Whether to apply normalization to the audio files (default is True).
       uniqueHashID (str): A unique identifier for the audio files
-        (default is None, which will use the current timestamp).
+        (default is None, which will use a monotonic counter with a random hex suffix).
       language (str): The language code for the TTS system (default is None, uses the current language).
       voice (str): The voice file to use for TTS (default is None, uses the current voice).
       speechRate (float): The speech rate for TTS (default is None, uses the current speech rate).
+      keepAudio (bool): Whether to keep the audio arrays in the results (default is True).
+        When False, only the metadata is kept and the audio slot is None.
+    Returns:
+      list: A list of tuples containing the generated text, phonemes, audio data, and file paths.
+    """
+
+    # Run the asynchronous pipeline on a single event loop.
+    return asyncio.run(
+      self.GenerateStoreSpeechAsync(
+        text,
+        storePath,
+        audioFormat=audioFormat,
+        applyNormalization=applyNormalization,
+        uniqueHashID=uniqueHashID,
+        language=language,
+        voice=voice,
+        speechRate=speechRate,
+        keepAudio=keepAudio,
+      )
+    )
+
+  async def GenerateStoreSpeechAsync(
+    self,
+    text,
+    storePath,
+    audioFormat="mp3",
+    applyNormalization=True,
+    uniqueHashID=None,
+    language=None,
+    voice=None,
+    speechRate=None,
+    keepAudio=True,
+    readyQueue=None,
+    sourceIndices=None,
+  ):
+    """
+    Asynchronous variant of GenerateStoreSpeech for callers that already run an event loop.
+    Parameters:
+      (Same as GenerateStoreSpeech.)
+      text (str|list): The text to convert to speech, or a list of texts synthesized in order.
+      readyQueue (asyncio.Queue): Optional queue that receives (index, filePath, text) as soon as each
+        chunk is stored, followed by None once all the chunks are done (default is None).
+      sourceIndices (list): Optional list that receives the index of the source text of each chunk
+        (in chunk order) when a list of texts is given (default is None).
     Returns:
       list: A list of tuples containing the generated text, phonemes, audio data, and file paths.
     """
@@ -224,45 +376,141 @@ class TextToSpeechHelper(object):
 
     # Define the file path for the audio file.
     if (uniqueHashID is None):
-      uniqueHashID = time.strftime("%Y%m%d_%H%M%S")  # Get the current time as a string.
+      # Combine a monotonic counter with a random suffix to avoid collisions in batch runs.
+      uniqueHashID = f"{next(self._idCounter):06d}_{secrets.token_hex(4)}"
+
+    try:
+      # Run the asynchronous producer/consumer pipeline so synthesis overlaps with normalization.
+      audioData = await self._generateStoreSpeechAsync(
+        text,  # Text to convert to speech.
+        storePath,  # Directory where the audio files will be stored.
+        audioFormat,  # Format of the audio files.
+        applyNormalization,  # Whether to normalize the audio files.
+        uniqueHashID,  # Unique identifier for the audio files.
+        keepAudio,  # Whether to keep the audio arrays in the results.
+        readyQueue,  # Queue notified as each chunk is stored.
+        sourceIndices,  # List receiving the source text index of each chunk.
+      )
+    finally:
+      if (readyQueue is not None):
+        await readyQueue.put(None)  # Signal the end of the chunks (even on failure).
+
+    # Return the list of audio data with file paths.
+    return audioData  # Return the list of audio data with file paths.
 
-    # Generate speech using the helper method.
-    f = self.GenerateYieldSpeech(text)
+  async def _generateStoreSpeechAsync(
+    self,
+    text,
+    storePath,
+    audioFormat,
+    applyNormalization,
+    uniqueHashID,
+    keepAudio=True,
+    readyQueue=None,
+    sourceIndices=None,
+  ):
+    """
+    Produces speech chunks in a worker thread and stores/normalizes them concurrently.
+    The producer pushes each generated chunk into a bounded queue while the consumer
+    writes it to disk and schedules its FFmpeg normalization as a separate task.
+    Parameters:
+      text (str|list): The text to convert to speech, or a list of texts synthesized in order.
+      storePath (str): The directory where the audio files will be stored.
+      audioFormat (str): The format of the audio files.
+      applyNormalization (bool): Whether to apply normalization to the audio files.
+      uniqueHashID (str): A unique identifier for the audio files.
+      keepAudio (bool): Whether to keep the audio arrays in the results.
+      readyQueue (asyncio.Queue): Optional queue that receives (index, filePath, text) for each stored chunk.
+      sourceIndices (list): Optional list that receives the source text index of each chunk.
+    Returns:
+      list: A list of tuples containing the generated text, phonemes, audio data, and file paths.
+    """
+
+    # Bounded queue between the TTS producer and the storage consumer.
+    queue = asyncio.Queue(maxsize=4)
+    # Sentinel object used to signal the end of the generated chunks.
+    endMarker = object()
+    # Results are placed by chunk index once each chunk is fully processed.
     audioData = []
-    # Iterate over the generated speech chunks.
-    for (generatedText, phonemes, audio) in f:
-      # Store the generated data.
-      audioData.append((generatedText, phonemes, audio))
-
-    # Save the audio data to the specified path.
-    # Iterate over the collected audio data.
-    for i, (generatedText, phonemes, audio) in enumerate(audioData):
-      audioFilePath = f"{storePath}/{uniqueHashID}_{i}.{audioFormat}"
-      # Create the directory if it doesn't exist.
-      os.makedirs(storePath, exist_ok=True)
-      # Write the audio data to the file.
-      sf.write(audioFilePath, audio, self.sampleRate)
+    # Share a single FFmpeg helper across all chunks processed on this event loop.
+    ffmpegHelper = FFMPEGHelper()
+    # Run up to one normalization subprocess per CPU core at a time.
+    normalizationSlots = asyncio.Semaphore(os.cpu_count() or 1)
+    # Create the directory once (if it doesn't exist) instead of per chunk.
+    os.makedirs(storePath, exist_ok=True)
+    storePathP = pathlib.Path(storePath)  # Base path used to build the chunk file paths.
+
+    async def Producer():
+      # Create the speech generator (model inference runs in a worker thread).
+      generator = self.GenerateYieldSpeechTexts(text if (isinstance(text, list)) else [text])
+      i = 0  # Index of the current chunk.
+      while (True):
+        # Pull the next chunk without blocking the event loop.
+        chunk = await asyncio.to_thread(next, generator, endMarker)
+        if (chunk is endMarker):
+          break  # Stop when the generator is exhausted.
+        sourceIndex, generatedText, phonemes, audio = chunk
+        if (sourceIndices is not None):
+          sourceIndices.append(sourceIndex)  # Chunks are produced (and indexed) in order.
+        # Push the chunk to the consumer (waits if the queue is full).
+        await queue.put((i, generatedText, phonemes, audio))
+        i += 1
+      # Signal the consumer that no more chunks will be produced.
+      await queue.put(endMarker)
+
+    async def StoreChunk(i, generatedText, phonemes, audio):
+      audioFilePath = str(storePathP / f"{uniqueHashID}_{i}.{audioFormat}")
+      # Write the audio data to the file without blocking the event loop.
+      await asyncio.to_thread(sf.write, audioFilePath, audio, self.sampleRate)
       # If normalization is enabled, apply it to the audio data.
       if (applyNormalization):
-        obj = FFMPEGHelper()
-        normalizedAudioFilePath = f"{storePath}/Normalized_{uniqueHashID}_{i}.{audioFormat}"
-        # Apply normalization to the audio file.
-        success = asyncio.run(
-          obj.NormalizeAudio(audioFilePath, normalizedAudioFilePath)
-        )
-        if (success):
-          # If normalization was successful, update the file path.
-          normalizedAudioFilePath = normalizedAudioFilePath
-        else:
+        normalizedAudioFilePath = str(storePathP / f"Normalized_{uniqueHashID}_{i}.{audioFormat}")
+        # Apply normalization to the audio file (bounded by the available CPU cores).
+        async with normalizationSlots:
+          success = await ffmpegHelper.NormalizeAudio(audioFilePath, normalizedAudioFilePath)
+        if (not success):
           # If normalization failed, keep the original file path.
           normalizedAudioFilePath = audioFilePath
       else:
         normalizedAudioFilePath = audioFilePath
-      # Update the audio data with the file path.
-      audioData[i] = (generatedText.strip(), phonemes, audio, normalizedAudioFilePath)
+      if (readyQueue is not None):
+        # Notify downstream consumers early.
+        await readyQueue.put((i, normalizedAudioFilePath, generatedText.strip()))
+      # Return the chunk data with the file path (dropping the audio array if not needed).
+      return (generatedText.strip(), phonemes, audio if (keepAudio) else None, normalizedAudioFilePath)
+
+    async def Consumer():
+      tasks = []  # Normalization tasks running concurrently with the producer.
+      try:
+        while (True):
+          item = await queue.get()
+          if (item is endMarker):
+            break  # Stop when the producer is done.
+          # Schedule the storage/normalization of the chunk.
+          tasks.append(asyncio.create_task(StoreChunk(*item)))
+        # Wait for all chunks to be stored and keep them in generation order.
+        audioData.extend(await asyncio.gather(*tasks))
+      except BaseException:
+        # Do not leave storage tasks behind on the long-lived loop.
+        for task in tasks:
+          task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    # Run the producer and the consumer concurrently.
+    producerTask = asyncio.create_task(Producer())
+    consumerTask = asyncio.create_task(Consumer())
+    try:
+      await asyncio.gather(producerTask, consumerTask)
+    except BaseException:
+      # A failed side would leave the other one blocked on the queue forever: cancel both.
+      producerTask.cancel()
+      consumerTask.cancel()
+      await asyncio.gather(producerTask, consumerTask, return_exceptions=True)
+      raise
 
     # Return the list of audio data with file paths.
-    return audioData  # Return the list of audio data with file paths.
+    return audioData
 
 
 # Example usage of the TextToSpeechHelper class.
@@ -14,22 +14,105 @@ import shutup
 
 shutup.please()  # This function call suppresses unnecessary warnings.
 
-import ffmpeg, os, time, random, yaml, hashlib, asyncio, logging
+import ffmpeg, os, re, time, random, hashlib, asyncio, logging, json, shutil, functools, threading
 import numpy as np
 from WhisperTranscribeHelper import WhisperTranscribeHelper
 from TextToSpeechHelper import TextToSpeechHelper
 from TextHelper import CleanText
+from ConfigsLoader import LoadConfigs
 from FFMPEGHelper import *
 
+# Optional Numba JIT for the caption packing loop.
+try:
+  from numba import njit
+except ImportError:
+  njit = None  # Numba is not installed; the pure-Python loop is used.
+
+# Optional xxHash for the job IDs.
+try:
+  import xxhash
+except ImportError:
+  xxhash = None  # xxHash is not installed; BLAKE2b is used.
+
 # Use module logger so messages go through Python's logging system and appear with Flask output.
 logger = logging.getLogger(__name__)
 
-with open("configs.yaml", "r") as configFile:
-  # Load the configuration from the YAML file.
-  configs = yaml.safe_load(configFile)
+configs = LoadConfigs()  # Shared configuration settings (configs.yaml is parsed once per process).
 VERBOSE = configs.get("verbose", False)  # Get the verbose setting from the configuration.
 
 
+@functools.lru_cache(maxsize=128)
+def _ReadCacheMeta(metaFilePath, inode, size):
+  """
+  Read (and keep in memory) the metadata of a TTS + Whisper cache entry.
+  The inode and size identify the file version (meta.json is replaced, never rewritten in place),
+  so an entry that was pruned and stored again is read anew; its mtime is not part of the key since
+  every cache hit touches it for the pruning order.
+  """
+  with open(metaFilePath, "r") as f:
+    return json.load(f)
+
+
+def _PackWords(widths, reservedWidth):
+  """
+  Greedily pack word widths into lines and return the end index (exclusive) of each line.
+  A word wider than the reserved width always forms a line on its own.
+  """
+  noOfWords = widths.shape[0]
+  lineEnds = np.empty(noOfWords, dtype=np.int64)
+  noOfLines = 0
+  start = 0
+  while (start < noOfWords):
+    if (widths[start] > reservedWidth):
+      # An oversized word is emitted alone.
+      lineEnds[noOfLines] = start + 1
+      noOfLines += 1
+      start += 1
+      continue
+    currentWidth = 0.0
+    i = start
+    # Add words while they are not oversized and the line still fits.
+    while ((i < noOfWords) and (widths[i] <= reservedWidth) and (currentWidth + widths[i] <= reservedWidth)):
+      currentWidth += widths[i]
+      i += 1
+    lineEnds[noOfLines] = i
+    noOfLines += 1
+    start = i
+  return lineEnds[:noOfLines]
+
+
+if (njit is not None):
+  # Compile the packing loop to machine code (cached on disk across runs).
+  _PackWords = njit(cache=True)(_PackWords)
+
+
+# Sentence boundaries: whitespace after terminal punctuation, or line breaks.
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+")
+# Abbreviations whose period does not end the sentence.
+_ABBREVIATIONS = frozenset(["mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "jr.", "st.", "vs.", "etc.", "e.g.", "i.e."])
+
+
+def _SplitSentences(text):
+  """Split the text into its non-empty sentences."""
+  sentences = []
+  for piece in _SENTENCE_BOUNDARY.split(text):
+    piece = piece.strip()
+    if (not piece):
+      continue
+    if (sentences and (sentences[-1].rsplit(None, 1)[-1].lower() in _ABBREVIATIONS)):
+      sentences[-1] += " " + piece  # The previous piece ended with an abbreviation.
+    else:
+      sentences.append(piece)
+  return sentences
+
+
+def _UniqueHashID(data):
+  """Return a 32-character hex ID for the given bytes (xxh3_128 when available, BLAKE2b otherwise)."""
+  if (xxhash is not None):
+    return xxhash.xxh3_128_hexdigest(data)
+  return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 class VideoCreatorHelper(object):
   def __init__(self):
     """Initialize the VideoCreatorHelper with Whisper and TTS helpers."""
@@ -45,6 +128,77 @@ class VideoCreatorHelper(object):
     self.whisperHelper.SetModelName(configs["whisper"]["modelName"])
     self.ffmpegHelper = FFMPEGHelper()
 
+    # Long-lived event loop owned by the helper, running in its own daemon thread and reused by every stage.
+    self._loop = asyncio.new_event_loop()
+    self._loopThread = threading.Thread(target=self._loop.run_forever, name="VideoCreatorLoop", daemon=True)
+    self._loopThread.start()
+
+    # Character width maps keyed by (video width, caption font size).
+    self._charWidthCache = {}
+
+    # Per-directory video duration caches persisted to a ".durations.json" sidecar file.
+    self._durationCache = {}
+    self._dirtyDurationPaths = set()  # Directories whose sidecar needs to be rewritten (flushed after each scan).
+
+  def _RunAsync(self, coroutine):
+    """Run a coroutine to completion on the helper's event loop and return its result (blocking)."""
+
+    if (self._loop.is_closed()):
+      raise RuntimeError("The video creator helper has been closed.")
+    return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+  def Close(self):
+    """Stop the helper's event loop, wait for its thread, and close the loop."""
+
+    loop = getattr(self, "_loop", None)
+    if ((loop is None) or loop.is_closed()):
+      return
+    loop.call_soon_threadsafe(loop.stop)
+    loopThread = getattr(self, "_loopThread", None)
+    if ((loopThread is not None) and (loopThread is not threading.current_thread())):
+      loopThread.join()
+    if (not loop.is_running()):
+      loop.close()
+
+  def __del__(self):
+    """Release the event loop if the helper was not closed explicitly."""
+
+    try:
+      self.Close()
+    except Exception:
+      pass
+
+  def _LoadDurationCache(self, videosPath):
+    """Return the duration cache of a videos directory, loading its sidecar file on first use."""
+
+    if (videosPath not in self._durationCache):
+      cache = {}
+      sidecarPath = os.path.join(videosPath, ".durations.json")
+      if (os.path.exists(sidecarPath)):
+        try:
+          with open(sidecarPath, "r") as f:
+            cache = json.load(f)
+        except Exception as e:
+          if (VERBOSE):
+            logger.info(f"Ignoring unreadable duration cache {sidecarPath}: {e}")
+      self._durationCache[videosPath] = cache
+    return self._durationCache[videosPath]
+
+  def _FlushDurationCache(self):
+    """Write the modified duration caches back to their sidecar files."""
+
+    for videosPath in list(self._dirtyDurationPaths):
+      try:
+        sidecarPath = os.path.join(videosPath, ".durations.json")
+        # Write to a temporary file and swap it in so a reader never sees a partial file.
+        with open(f"{sidecarPath}.tmp", "w") as f:
+          json.dump(self._durationCache[videosPath], f)
+        os.replace(f"{sidecarPath}.tmp", sidecarPath)
+        self._dirtyDurationPaths.discard(videosPath)
+      except Exception as e:
+        if (VERBOSE):
+          logger.info(f"Failed to write the duration cache of {videosPath}: {e}")
+
   def FormatSRTTime(self, seconds):
     """Format a float seconds value into SRT timestamp HH:MM:SS,mmm."""
     try:
@@ -68,6 +222,27 @@ class VideoCreatorHelper(object):
     speechRate=None,
   ):
     """Convert text to audio and then transcribe it to get timing information."""
+    return self._RunAsync(
+      self.Text2Audio2TextTimingAsync(
+        text,
+        workingPath=workingPath,
+        uniqueHashID=uniqueHashID,
+        language=language,
+        voice=voice,
+        speechRate=speechRate,
+      )
+    )
+
+  async def Text2Audio2TextTimingAsync(
+    self,
+    text,
+    workingPath=None,
+    uniqueHashID=None,
+    language=None,
+    voice=None,
+    speechRate=None,
+  ):
+    """Convert text to audio and then transcribe it to get timing information (on the running event loop)."""
 
     if (not workingPath):
       # If no working path is provided, use the default store path.
@@ -75,59 +250,387 @@ class VideoCreatorHelper(object):
       # Ensure the working path is an absolute path.
       workingPath = os.path.abspath(workingPath)
 
+    # Reuse the cached TTS + Whisper results for a previously seen text (if any).
+    cacheKey = self._GetCacheKey(text, language, voice, speechRate)
+    if ((cacheKey is not None) and configs["cache"].get("sentenceLevel", False)):
+      sentences = _SplitSentences(text)
+      if (len(sentences) > 1):
+        # Cache each sentence separately so repeated sentences (within or across texts) skip both stages.
+        return await self._SentenceTimingAsync(sentences, workingPath, uniqueHashID, language, voice, speechRate)
+    if (cacheKey is not None):
+      dataList = self._LoadFromCache(cacheKey, workingPath, uniqueHashID)
+      if (dataList is not None):
+        if (VERBOSE):
+          logger.info(f"TTS + Whisper cache hit: {cacheKey}")
+        return dataList
+
     dataList = []  # List to store transcriptions.
-    # Generate audio from the provided text using the TTS helper.
-    audios = self.ttsHelper.GenerateStoreSpeech(
-      text,
-      workingPath,
-      audioFormat=configs["ffmpeg"].get("audioFormat", "mp3"),
-      applyNormalization=configs["ffmpeg"].get("applyNormalization", True),
-      uniqueHashID=uniqueHashID,
-      language=language,
-      voice=voice,
-      speechRate=speechRate,
+    # Run TTS and Whisper as an asynchronous pipeline so that both stages overlap.
+    audios, transcriptions = await self._text2Audio2TextTimingAsync(
+      text, workingPath, uniqueHashID, language, voice, speechRate
     )
 
-    # Iterate over the generated audio data.
+    # Zip the transcriptions back with the generated audio data.
     for i, (generatedText, phonemes, audio, audioFilePath) in enumerate(audios):
-      # Transcribe the generated audio to text.
-      transcription = self.whisperHelper.Transcribe(
-        audioFilePath, language=configs["whisper"].get("language", "en")
-      )
+      transcription = transcriptions[i]  # Transcription of the i-th chunk.
       # Append the transcription to the list.
       dataList.append((generatedText, phonemes, audio, audioFilePath, transcription))
+
+    if (cacheKey is not None):
+      # Persist the results so that the next request with the same text skips both stages.
+      self._StoreInCache(cacheKey, dataList)
+
     # Return the list of transcriptions with timing information.
     return dataList
 
+  async def _SentenceTimingAsync(self, sentences, workingPath, uniqueHashID, language, voice, speechRate):
+    """
+    Get the timings sentence by sentence: the cached sentences are reused and the other distinct
+    sentences are generated together in a single TTS + Whisper pipeline run, then cached one by one.
+    """
+
+    keys = [self._GetCacheKey(sentence, language, voice, speechRate) for sentence in sentences]
+    results = {}  # Data list of each distinct sentence.
+    for j, key in enumerate(keys):
+      if (key not in results):
+        # Prefix the linked files by the sentence index so the entries do not overwrite each other.
+        dataList = self._LoadFromCache(key, workingPath, f"{uniqueHashID or key}_S{j}")
+        if (dataList is not None):
+          results[key] = dataList
+
+    # The distinct sentences that are not cached yet (in text order).
+    missing = {key: sentence for key, sentence in zip(keys, sentences) if (key not in results)}
+    if (VERBOSE):
+      logger.info(f"Sentence cache: {len(keys) - sum(key in missing for key in keys)}/{len(keys)} hits.")
+
+    if (missing):
+      missingKeys = list(missing)
+      sourceIndices = []  # Sentence index (within the missing ones) of each generated chunk.
+      audios, transcriptions = await self._text2Audio2TextTimingAsync(
+        list(missing.values()), workingPath, uniqueHashID, language, voice, speechRate,
+        sourceIndices=sourceIndices,
+      )
+      for key in missingKeys:
+        results[key] = []
+      # Group the chunks back by their sentence.
+      for i, (generatedText, phonemes, audio, audioFilePath) in enumerate(audios):
+        results[missingKeys[sourceIndices[i]]].append(
+          (generatedText, phonemes, audio, audioFilePath, transcriptions[i])
+        )
+      for key in missingKeys:
+        self._StoreInCache(key, results[key])
+
+    # Repeated sentences reuse the same audio files.
+    return [item for key in keys for item in results[key]]
+
+  def _GetCacheKey(self, text, language, voice, speechRate):
+    """Return the cache key of the TTS + Whisper results, or None if caching does not apply."""
+
+    cacheConfigs = configs.get("cache", {})
+    if (not cacheConfigs.get("enabled", False)):
+      return None  # Caching is disabled.
+    if (voice == "random"):
+      return None  # A random voice must not be pinned by the cache.
+    # Resolve the defaults so that explicit and implicit settings share the same entry.
+    language = language or self.ttsHelper.GetSelectedLanguage()
+    voice = voice or self.ttsHelper.GetSelectedVoice()
+    speechRate = speechRate or self.ttsHelper.GetSpeechRate()
+    keyText = "|".join([
+      text,
+      str(language),
+      str(voice),
+      str(speechRate),
+      str(configs["ffmpeg"].get("audioFormat", "mp3")),  # The cached files keep their format.
+      str(configs["ffmpeg"].get("applyNormalization", True)),
+      str(self.whisperHelper.GetModelName()),  # Transcriptions depend on the Whisper model.
+      str(configs["whisper"].get("timingMode", "align")),  # Aligned and transcribed timings differ.
+    ])
+    return hashlib.blake2b(keyText.encode(), digest_size=16).hexdigest()  # 32 hex characters.
+
+  def _LoadFromCache(self, cacheKey, workingPath, uniqueHashID):
+    """Copy the cached audio files into the working path and return the cached data list (or None)."""
+
+    entryPath = os.path.join(configs["cache"].get("path", "./Cache"), cacheKey)
+    metaFilePath = os.path.join(entryPath, "meta.json")
+    if (not os.path.exists(metaFilePath)):
+      return None  # Cache miss.
+    try:
+      metaStat = os.stat(metaFilePath)
+      meta = _ReadCacheMeta(metaFilePath, metaStat.st_ino, metaStat.st_size)
+      os.makedirs(workingPath, exist_ok=True)
+      dataList = []
+      for i, (generatedText, phonemes, fileName, transcription) in enumerate(meta):
+        extension = os.path.splitext(fileName)[1]
+        audioFilePath = os.path.join(workingPath, f"{uniqueHashID or cacheKey}_{i}{extension}")
+        try:
+          # Hard-link when possible (same file system); otherwise copy.
+          os.link(os.path.join(entryPath, fileName), audioFilePath)
+        except OSError:
+          shutil.copyfile(os.path.join(entryPath, fileName), audioFilePath)
+        dataList.append((generatedText, phonemes, None, audioFilePath, transcription))
+      os.utime(metaFilePath)  # Mark the entry as recently used for the pruning order.
+      return dataList
+    except Exception as e:
+      if (VERBOSE):
+        logger.info(f"Ignoring unusable cache entry {cacheKey}: {e}")
+      return None
+
+  def _StoreInCache(self, cacheKey, dataList):
+    """Store the audio files and transcriptions in the cache, then prune the oldest entries."""
+
+    cachePath = configs["cache"].get("path", "./Cache")
+    entryPath = os.path.join(cachePath, cacheKey)
+    try:
+      os.makedirs(entryPath, exist_ok=True)
+      meta = []
+      for i, (generatedText, phonemes, _, audioFilePath, transcription) in enumerate(dataList):
+        fileName = f"{i}{os.path.splitext(audioFilePath)[1]}"
+        shutil.copyfile(audioFilePath, os.path.join(entryPath, fileName))
+        meta.append((generatedText, phonemes, fileName, transcription))
+      # Write the metadata last so that only complete entries are ever read.
+      # Replace the file (new inode) so that the in-memory metadata cache never serves an older version.
+      metaFilePath = os.path.join(entryPath, "meta.json")
+      with open(f"{metaFilePath}.tmp", "w") as f:
+        json.dump(meta, f)
+      os.replace(f"{metaFilePath}.tmp", metaFilePath)
+
+      # Prune the least recently used entries beyond the configured limit.
+      maxEntries = configs["cache"].get("maxEntries", 256)
+      entries = []
+      for entry in os.scandir(cachePath):
+        metaFilePath = os.path.join(entry.path, "meta.json")
+        if (entry.is_dir() and os.path.exists(metaFilePath)):
+          entries.append((os.stat(metaFilePath).st_mtime, entry.path))
+      entries.sort()
+      prunedEntries = entries[:max(len(entries) - maxEntries, 0)]
+      for _, oldEntryPath in prunedEntries:
+        shutil.rmtree(oldEntryPath, ignore_errors=True)
+      if (prunedEntries):
+        # Drop the in-memory metadata of the removed entries (their inodes may be reused).
+        _ReadCacheMeta.cache_clear()
+    except Exception as e:
+      if (VERBOSE):
+        logger.info(f"Failed to store cache entry {cacheKey}: {e}")
+
+  async def _text2Audio2TextTimingAsync(
+    self, text, workingPath, uniqueHashID, language, voice, speechRate, sourceIndices=None
+  ):
+    """
+    Produce audio chunks with TTS while transcribing the already-stored chunks in batches.
+    The text can be a list of texts; sourceIndices then receives the text index of each chunk.
+    """
+
+    readyQueue = asyncio.Queue()  # Receives (index, filePath, text) as each chunk is stored.
+    transcriptions = {}  # Transcriptions indexed by chunk.
+    whisperLanguage = configs["whisper"].get("language", "en")
+    # Limit the number of batches transcribed at the same time (GPU/CPU concurrency).
+    transcriptionSlots = asyncio.Semaphore(max(1, configs["whisper"].get("maxConcurrency", 2)))
+
+    # "align": force-align the known chunk texts (no decoding); "transcribe": full Whisper transcription.
+    timingMode = configs["whisper"].get("timingMode", "align")
+
+    async def TranscribeBatch(batch):
+      try:
+        # Get the word timings of the batch in a worker thread so TTS keeps running.
+        if (timingMode == "align"):
+          results = await asyncio.to_thread(
+            self.whisperHelper.Align,
+            [filePath for (_, filePath, _) in batch],
+            [chunkText for (_, _, chunkText) in batch],
+            language=whisperLanguage,
+          )
+        else:
+          results = await asyncio.to_thread(
+            self.whisperHelper.Transcribe,
+            [filePath for (_, filePath, _) in batch],
+            language=whisperLanguage,
+          )
+      finally:
+        transcriptionSlots.release()  # Let the next batch start.
+      for (i, _, _), result in zip(batch, results):
+        transcriptions[i] = result
+
+    async def Transcriber():
+      tasks = []
+      isDone = False
+      try:
+        while (not isDone):
+          # Collect the next batch only when a slot is free so the waiting chunks join the same batch.
+          await transcriptionSlots.acquire()
+          # Wait for at least one chunk, then drain whatever else is ready into the same batch.
+          batch = [await readyQueue.get()]
+          while (not readyQueue.empty()):
+            batch.append(readyQueue.get_nowait())
+          if (None in batch):
+            isDone = True  # The TTS stage has finished.
+            batch = [item for item in batch if (item is not None)]
+          if (len(batch) == 0):
+            transcriptionSlots.release()
+            continue
+          tasks.append(asyncio.create_task(TranscribeBatch(batch)))
+        # Wait for the batches that are still being transcribed.
+        await asyncio.gather(*tasks)
+      except BaseException:
+        # Do not leave batch tasks running on the long-lived loop after a failure.
+        for task in tasks:
+          task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    # Run the TTS producer and the Whisper consumer concurrently.
+    producerTask = asyncio.create_task(
+      self.ttsHelper.GenerateStoreSpeechAsync(
+        text,
+        workingPath,
+        audioFormat=configs["ffmpeg"].get("audioFormat", "mp3"),
+        applyNormalization=configs["ffmpeg"].get("applyNormalization", True),
+        uniqueHashID=uniqueHashID,
+        language=language,
+        voice=voice,
+        speechRate=speechRate,
+        keepAudio=False,  # Only the file paths are needed downstream.
+        readyQueue=readyQueue,
+        sourceIndices=sourceIndices,
+      )
+    )
+    consumerTask = asyncio.create_task(Transcriber())
+    try:
+      audios, _ = await asyncio.gather(producerTask, consumerTask)
+    except BaseException:
+      # A failed side would leave the other one blocked (or running) on the long-lived loop: cancel both.
+      producerTask.cancel()
+      consumerTask.cancel()
+      await asyncio.gather(producerTask, consumerTask, return_exceptions=True)
+      raise
+    return audios, transcriptions
+
+  def _BuildCaptionsList(self, captionWords, charactersWidth, captionReservedWidth):
+    """
+    Greedily pack the caption words into caption lines that fit within the reserved width.
+    The word widths are computed once into a NumPy array and the line breaks are found by
+    the (Numba-compiled when available) _PackWords. A word wider than the reserved width is emitted alone.
+    Parameters:
+      captionWords (dict): The caption words as a structure of arrays:
+        "word" (list of str), "start" and "end" (NumPy arrays of seconds).
+      charactersWidth (dict): A mapping from each (uppercase) character to its width in pixels.
+      captionReservedWidth (float): The maximum width of a caption line in pixels.
+    Returns:
+      list: A list of dictionaries with the caption text and its words.
+    """
+
+    # Build a 256-entry lookup table of the character widths (unknown characters have zero width).
+    widthsLUT = np.zeros(256, dtype=np.float64)
+    for char, charWidth in charactersWidth.items():
+      if (ord(char) < 256):
+        widthsLUT[ord(char)] = charWidth
+
+    # Encode all the (uppercased) words into one byte buffer; characters outside Latin-1 are dropped (zero width).
+    encodedWords = [word.upper().encode("latin-1", "ignore") for word in captionWords["word"]]
+    wordEnds = np.cumsum(np.fromiter(map(len, encodedWords), dtype=np.int64, count=len(encodedWords)))
+    charCodes = np.frombuffer(b"".join(encodedWords), dtype=np.uint8)
+    # Sum the character widths of every word through prefix sums over the looked-up widths.
+    cumCharWidths = np.concatenate(([0.0], np.cumsum(widthsLUT[charCodes])))
+    widths = cumCharWidths[wordEnds] - cumCharWidths[np.concatenate(([0], wordEnds[:-1]))]
+    # Compute the end index of every caption line in compiled code.
+    lineEnds = _PackWords(widths, float(captionReservedWidth))
+
+    captionsList = []  # List to store caption strings.
+    start = 0
+    for end in lineEnds:
+      end = int(end)
+      if (VERBOSE):
+        logger.info(f"Words from index {start} to {end} fit in the caption width.")
+        logger.info(f"Current width used: {widths[start:end].sum()}, Reserved width: {captionReservedWidth}")
+      lineTexts = captionWords["word"][start:end]  # Slice the line words once; shared by the text and the entry.
+      captionsList.append({
+        "text" : " ".join(lineTexts),
+        # Convert to the per-word dictionaries only at the FFmpeg filter boundary.
+        "words": [
+          {"start": wordStart, "end": wordEnd, "word": word}
+          for word, wordStart, wordEnd in zip(
+            lineTexts, captionWords["start"][start:end].tolist(), captionWords["end"][start:end].tolist()
+          )
+        ],
+      })
+      start = end
+
+    return captionsList
+
+  async def _PrepareCaptionsAndVideos(self, captionWords, charactersWidth, captionReservedWidth, videoType):
+    """Build the captions list and the list of current videos concurrently (worker threads)."""
+    captionsList, availableVideos = await asyncio.gather(
+      asyncio.to_thread(self._BuildCaptionsList, captionWords, charactersWidth, captionReservedWidth),
+      self.GetCurrentVideosListAsync(videoType=videoType),
+    )
+    return captionsList, availableVideos
+
   def GetCurrentVideosList(self, videoType="Horizontal"):
-    """Get the list of current videos in the default video directory."""
+    """Get the list of current videos in the default video directory (sorted by file name)."""
+    return self._RunAsync(self.GetCurrentVideosListAsync(videoType=videoType))
+
+  async def GetCurrentVideosListAsync(self, videoType="Horizontal"):
+    """Get the list of current videos in the default video directory (new files are probed concurrently)."""
     # List all files in the default video directory.
     videosPath = configs["video"].get("default", "./Assets/Videos")
     if (videoType == "Vertical"):
       videosPath = os.path.join(videosPath, "Vertical Videos")
     else:
       videosPath = os.path.join(videosPath, "Horizontal Videos")
-    currentVideosList = os.listdir(videosPath)
-    # Filter out only video files (assuming they have specific extensions).
     # Convert allowed extensions to a tuple for filtering.
     videoExtensions = tuple(configs["video"].get("allowedExtensions", [".mp4", ".avi", ".mov", ".mkv"]))
-    currentVideosList = [f for f in currentVideosList if f.lower().endswith(videoExtensions)]
-
-    # Shuffle the list of video files to randomize their order.
-    # Seed with current time for randomness.
-    np.random.seed(int(time.time()))
-    # Shuffle the list of videos.
-    np.random.shuffle(currentVideosList)
+    # Scan the directory once; the entries carry their path and file type (no extra stat per name).
+    with os.scandir(videosPath) as entries:
+      # Keep only regular video files (assuming they have specific extensions).
+      currentVideosList = [
+        entry for entry in entries
+        if (entry.name.lower().endswith(videoExtensions) and entry.is_file())
+      ]
+    # Keep a stable (name) order; the callers pick the videos they need at random.
+    currentVideosList.sort(key=lambda entry: entry.name)
+
+    durationCache = self._LoadDurationCache(videosPath)
+    requiredDuration = configs["video"]["maxLengthPerVideo"]  # Maximum length of each video segment.
+    candidates = []  # (entry, stat, cached duration or None) in the name order.
+    for entry in currentVideosList:
+      try:
+        fileStat = entry.stat()  # Reuses the result cached by is_file() where the platform provides it.
+      except OSError:
+        continue  # Skip the files that disappeared.
+      cached = durationCache.get(entry.name)
+      if ((cached is not None) and (cached[0] == fileStat.st_mtime_ns) and (cached[1] == fileStat.st_size)):
+        candidates.append((entry, fileStat, cached[2]))  # The file is unchanged; reuse its duration.
+      else:
+        candidates.append((entry, fileStat, None))
+
+    # Probe the new (or changed) files with concurrent FFprobe processes, bounded by the CPU count.
+    probeSlots = asyncio.Semaphore(os.cpu_count() or 1)
+
+    async def Probe(videoFilePath):
+      async with probeSlots:
+        return await self.ffmpegHelper.GetFileDurationAsync(videoFilePath)
+
+    toProbe = [i for i, (_, _, duration) in enumerate(candidates) if (duration is None)]
+    probedDurations = await asyncio.gather(*[Probe(candidates[i][0].path) for i in toProbe])
+    for i, duration in zip(toProbe, probedDurations):
+      entry, fileStat, _ = candidates[i]
+      candidates[i] = (entry, fileStat, duration)
+      if (duration is not None):
+        durationCache[entry.name] = [fileStat.st_mtime_ns, fileStat.st_size, duration]
+        self._dirtyDurationPaths.add(videosPath)
 
     summary = []  # List to store video file paths and their durations.
-    for videoFile in currentVideosList:
-      videoFilePath = os.path.join(videosPath, videoFile)
-      requiredDuration = configs["video"]["maxLengthPerVideo"]  # Maximum length of each video segment.
-      if (os.path.isfile(videoFilePath)):
-        # Get the duration of the video file using FFprobe.
-        duration = self.ffmpegHelper.GetFileDuration(videoFilePath)
-        if (duration >= requiredDuration):
-          summary.append((videoFilePath, duration))
+    for entry, _, duration in candidates:
+      if ((duration is not None) and (duration >= requiredDuration)):
+        summary.append((entry.path, duration))
+
+    # Drop the entries of the videos that were removed from the directory.
+    seenNames = {entry.name for entry in currentVideosList}
+    for staleName in [name for name in durationCache if (name not in seenNames)]:
+      del durationCache[staleName]
+      self._dirtyDurationPaths.add(videosPath)
+    if (videosPath in self._dirtyDurationPaths):
+      # Persist the newly probed durations now (not only at exit) so other processes reuse them.
+      self._FlushDurationCache()
 
     return summary
 
@@ -143,6 +646,36 @@ class VideoCreatorHelper(object):
   ):
     '''
     Generate a video with captions from the provided text.
+    All the stages run on the helper's long-lived event loop (see GenerateVideoAsync).
+    Parameters:
+      (Same as GenerateVideoAsync.)
+    Returns:
+      (bool, str): A tuple indicating success and the generated video file name.
+    '''
+    return self._RunAsync(
+      self.GenerateVideoAsync(
+        text,
+        language=language,
+        voice=voice,
+        speechRate=speechRate,
+        videoQuality=videoQuality,
+        videoType=videoType,
+        uniqueHashID=uniqueHashID,
+      )
+    )
+
+  async def GenerateVideoAsync(
+    self,
+    text,
+    language=None,
+    voice=None,
+    speechRate=None,
+    videoQuality=None,
+    videoType=None,
+    uniqueHashID=None
+  ):
+    '''
+    Generate a video with captions from the provided text (on the running event loop).
     Parameters:
       text (str): The input text to convert to audio and captions.
       language (str): The language for TTS.
@@ -155,10 +688,13 @@ class VideoCreatorHelper(object):
       (bool, str): A tuple indicating success and the generated video file name.
     '''
 
+    # Bind the frequently used configuration sections once.
+    vcfg, fcfg = configs["video"], configs["ffmpeg"]
+
     if (not uniqueHashID):
       currentTime = str(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()))  # Get the current time.
       # Create a unique hash ID for the text.
-      uniqueHashID = hashlib.md5(text.encode() + currentTime.encode()).hexdigest()
+      uniqueHashID = _UniqueHashID(text.encode() + currentTime.encode())
       if (VERBOSE):
         logger.info(f"Unique Hash ID for the text: {uniqueHashID}")
 
@@ -167,295 +703,208 @@ class VideoCreatorHelper(object):
     os.makedirs(storageFolder, exist_ok=True)  # Ensure the storage folder exists.
     workingPath = os.path.join(storageFolder, uniqueHashID)  # Create a working path for the job.
     os.makedirs(workingPath, exist_ok=True)  # Ensure the working path exists.
+    # Scratch folder for the intermediate audio files; it is removed as a whole once the job ends (success or not).
+    tempPath = os.path.join(workingPath, "Temp")
 
-    # Escaping text for safe processing.
-    if (VERBOSE):
-      logger.info(f"Escaping text for processing: {text}")
-    # Escape special characters in the text for safe processing.
-    text = CleanText(text)
-
-    if (VERBOSE):
-      logger.info(f"Processed text: {text}")
-      logger.info(f"Working path: {workingPath}")
-      logger.info(f"Unique Hash ID: {uniqueHashID}")
-      logger.info(f"Language: {language}, Voice: {voice}, Speech Rate: {speechRate}")
-
-    if (not text or len(text.strip()) == 0):
+    try:
+      # Escaping text for safe processing.
       if (VERBOSE):
-        logger.info("No text provided for transcription after cleaning. Exiting.")
-      return False, None
+        logger.info(f"Escaping text for processing: {text}")
+      # Escape special characters in the text for safe processing.
+      text = CleanText(text)
 
-    # Get the transcription with timing.
-    dataList = self.Text2Audio2TextTiming(
-      text,
-      workingPath=workingPath,
-      uniqueHashID=uniqueHashID,
-      language=language,
-      voice=voice,
-      speechRate=speechRate,
-    )
-    # Merge the transcribed audios into one.
-    if (not dataList or (len(dataList) == 0)):
       if (VERBOSE):
-        logger.info("No transcriptions available. Exiting.")
-      return False, None
+        logger.info(f"Processed text: {text}")
+        logger.info(f"Working path: {workingPath}")
+        logger.info(f"Temporary path: {tempPath}")
+        logger.info(f"Unique Hash ID: {uniqueHashID}")
+        logger.info(f"Language: {language}, Voice: {voice}, Speech Rate: {speechRate}")
 
-    if (VERBOSE):
-      logger.info(f"Total transcriptions: {len(dataList)}")
-      for i, (generatedText, phonemes, audio, audioFilePath, transcription) in enumerate(dataList):
-        logger.info(f"Transcription {i + 1}:")
-        logger.info(f"- Generated Text: {generatedText}")
-        logger.info(f"- Audio File Path: {audioFilePath}")
-        logger.info(f"- Transcription: {transcription}")
-
-    captionWords = []
-    # Add word-level captions to the video.
-    timeOffset = 0.0  # Initialize time offset for captions.
-    for i, (generatedText, phonemes, audio, audioFilePath, transcription) in enumerate(dataList):
-      if (VERBOSE):
-        logger.info(f"Processing transcription {i + 1} with audio file: {audioFilePath}")
-        logger.info(f"Transcription: {transcription} | Duration: {transcription['duration']:.2f} seconds")
-        logger.info("")
-      # Create captions for each segment.
-      for segment in transcription["segments"]:
+      if (not text or len(text.strip()) == 0):
         if (VERBOSE):
-          logger.info(f"Processing segment {i + 1}: {segment['text']}")
-          logger.info(f"Segment start: {segment['start']}, end: {segment['end']}")
-          logger.info("")
-        # segmentStart = segment["start"]  # Start time of the segment.
-        words = segment["words"]  # Get the words in the segment.
-        for word in words:
-          if (VERBOSE):
-            logger.info(
-              f"Word: {word['word']} | Start: {word['start']:.2f} | End: {word['end']:.2f} | Start': "
-              f"{timeOffset + word['start']:.2f} | End': "
-              f"{timeOffset + word['end']:.2f}"
-            )
-          # Create a caption entry for each word with its start and end times.
-          captionWords.append(
-            {
-              "start": timeOffset + word["start"],
-              "end"  : timeOffset + word["end"],  # Calculate the end time of the word.
-              "word" : word["word"].strip(),  # Strip whitespace from the word.
-            }
-          )
-      # Update the time offset with the end time of the last segment.
-      timeOffset += transcription["duration"]
-    if (VERBOSE):
-      logger.info(f"Total captions generated: {len(captionWords)}")
-
-    # Determine video quality and type; and hence we can determine width and height.
-    availableVideoQualities = configs["video"].get("availableQualities", [])
-    qualityKeys = [quality[0] for quality in availableVideoQualities]
-
-    availableVideoTypes = configs["video"].get("availableTypes", [])
-    if (not videoQuality or (videoQuality not in qualityKeys)):
-      videoQuality = "Full HD"  # Default to Full HD if not specified.
-    if (not videoType or (videoType not in availableVideoTypes)):
-      videoType = availableVideoTypes[0]
-    if (VERBOSE):
-      logger.info(f"Video Quality: {videoQuality}, Video Type: {videoType}")
-    width, height = availableVideoQualities[qualityKeys.index(videoQuality)][1]
-    if (videoType == "Vertical"):
-      width, height = height, width
-    configs["video"]["width"] = width
-    configs["video"]["height"] = height
-
-    if (videoType == "Vertical"):
-      captionFontSize = configs["ffmpeg"].get("verticalCaptionFontSize", "4.8%")  # Font size for captions.
-    else:
-      captionFontSize = configs["ffmpeg"].get("horizontalCaptionFontSize", "6.8%")  # Font size for captions.
-
-    captionLineUsagePercentage = configs["ffmpeg"].get("captionLineUsagePercentage", 80)  # Line usage percentage.
-    captionReservedWidth = (width * captionLineUsagePercentage) / 100  # Calculate reserved width for captions.
+          logger.info("No text provided for transcription after cleaning. Exiting.")
+        return False, None
+
+      # Get the transcription with timing.
+      dataList = await self.Text2Audio2TextTimingAsync(
+        text,
+        workingPath=tempPath,
+        uniqueHashID=uniqueHashID,
+        language=language,
+        voice=voice,
+        speechRate=speechRate,
+      )
+      # Merge the transcribed audios into one.
+      if (not dataList or (len(dataList) == 0)):
+        if (VERBOSE):
+          logger.info("No transcriptions available. Exiting.")
+        return False, None
 
-    charactersWidth = FFMPEGHelper().GetCharactersWidth(width, captionFontSize)
+      if (VERBOSE):
+        logger.info(f"Total transcriptions: {len(dataList)}")
+      # The per-transcription, per-segment, and per-word details are lazily formatted DEBUG records.
+      # The check is hoisted so the loops below do not even build the arguments unless they are emitted.
+      debugEnabled = VERBOSE and logger.isEnabledFor(logging.DEBUG)
+
+      # Add word-level captions to the video.
+      # The caption words are kept as a structure of arrays: the word texts plus NumPy start/end arrays.
+      wordTexts, wordStarts, wordEnds = [], [], []
+      timeOffset = 0.0  # Initialize time offset for captions.
+      for i, (generatedText, phonemes, audio, audioFilePath, transcription) in enumerate(dataList):
+        if (debugEnabled):
+          logger.debug(
+            "Transcription %d: text=%r | audio=%s | duration=%.2f seconds | %s",
+            i + 1, generatedText, audioFilePath, transcription["duration"], transcription,
+          )
+          for segment in transcription["segments"]:
+            logger.debug(
+              "Segment %d: %s | start=%s, end=%s", i + 1, segment["text"], segment["start"], segment["end"]
+            )
+            for word in segment["words"]:
+              logger.debug(
+                "Word: %s | Start: %.2f | End: %.2f | Start': %.2f | End': %.2f",
+                word["word"], word["start"], word["end"], timeOffset + word["start"], timeOffset + word["end"],
+              )
+        # Flatten the words of all the segments.
+        words = [word for segment in transcription["segments"] for word in segment["words"]]
+        wordTexts.extend(word["word"].strip() for word in words)  # Strip whitespace from the words.
+        # Shift the word timings by the offset of the transcription with one broadcast add.
+        wordStarts.append(np.fromiter((word["start"] for word in words), dtype=np.float64, count=len(words)) + timeOffset)
+        wordEnds.append(np.fromiter((word["end"] for word in words), dtype=np.float64, count=len(words)) + timeOffset)
+        # Update the time offset with the duration of the transcribed audio.
+        timeOffset += transcription["duration"]
+      captionWords = {
+        "word" : wordTexts,
+        "start": np.concatenate(wordStarts) if (wordStarts) else np.zeros(0),
+        "end"  : np.concatenate(wordEnds) if (wordEnds) else np.zeros(0),
+      }
+      if (VERBOSE):
+        logger.info(f"Total captions generated: {len(wordTexts)}")
 
-    if (VERBOSE):
-      logger.info(f"Video dimensions: {width}x{height}")
-      logger.info(f"Caption reserved width: {captionReservedWidth}")
-      logger.info(f"Caption font size: {captionFontSize}")
-      logger.info(f"Characters width mapping: {charactersWidth}")
+      # Determine video quality and type; and hence we can determine width and height.
+      availableVideoQualities = vcfg.get("availableQualities", [])
+      qualityKeys = [quality[0] for quality in availableVideoQualities]
 
-    # Loop through the caption words and create a caption string. Process N words at a time.
-    captionsList = []  # List to store caption strings.
-    counter = 0
-    wordWidth = 0
-    # Loop through the caption words to create caption strings that fit within the reserved width.
-    while (counter < len(captionWords)):
-      currentWidth = 0
-      i = counter
-      while (i < len(captionWords)):
-        currentWord = captionWords[i]["word"].upper()
-        wordWidth = sum([charactersWidth.get(char, 0) for char in currentWord])
-        if (VERBOSE):
-          logger.info(f"Word: {currentWord}, Width: {wordWidth}, Current Total Width: {currentWidth}")
-        # Check if the current word alone exceeds the reserved width.
-        if (wordWidth > captionReservedWidth):
-          if (VERBOSE):
-            logger.info(f"Single word '{currentWord}' exceeds caption reserved width. Skipping this word.")
-          break
-        # Check if adding the current word along with the previous words exceeds the reserved width.
-        if (currentWidth + wordWidth <= captionReservedWidth):
-          currentWidth += wordWidth
-          i += 1
-        else:
-          break
+      availableVideoTypes = vcfg.get("availableTypes", [])
+      if (not videoQuality or (videoQuality not in qualityKeys)):
+        videoQuality = "Full HD"  # Default to Full HD if not specified.
+      if (not videoType or (videoType not in availableVideoTypes)):
+        videoType = availableVideoTypes[0]
       if (VERBOSE):
-        logger.info(f"Words from index {counter} to {i} fit in the caption width.")
-        logger.info(f"Current width used: {currentWidth}, Reserved width: {captionReservedWidth}")
-      firstWordIndex = counter
-      lastWordIndex = i
-      text = " ".join([word["word"] for word in captionWords[firstWordIndex:lastWordIndex]])
-      captionsList.append({
-        "text" : text,
-        "words": captionWords[firstWordIndex:lastWordIndex],
-      })
-      counter = lastWordIndex
+        logger.info(f"Video Quality: {videoQuality}, Video Type: {videoType}")
+      width, height = availableVideoQualities[qualityKeys.index(videoQuality)][1]
+      if (videoType == "Vertical"):
+        width, height = height, width
+      # Keep the dimensions local (the shared configs dict is read-only and used by concurrent jobs).
+
+      if (videoType == "Vertical"):
+        captionFontSize = fcfg.get("verticalCaptionFontSize", "4.8%")  # Font size for captions.
+      else:
+        captionFontSize = fcfg.get("horizontalCaptionFontSize", "6.8%")  # Font size for captions.
+
+      captionLineUsagePercentage = fcfg.get("captionLineUsagePercentage", 80)  # Line usage percentage.
+      captionReservedWidth = (width * captionLineUsagePercentage) / 100  # Calculate reserved width for captions.
+
+      # Measure the character widths once per (width, font size) combination.
+      charWidthKey = (width, captionFontSize)
+      charactersWidth = self._charWidthCache.get(charWidthKey)
+      if (charactersWidth is None):
+        charactersWidth = self.ffmpegHelper.GetCharactersWidth(width, captionFontSize)
+        self._charWidthCache[charWidthKey] = charactersWidth
 
-      if (wordWidth > captionReservedWidth):
-        # If a single word alone exceeds the reserved width, add it alone and move to the next word.
-        text = captionWords[counter]["word"]
-        captionsList.append({
-          "text" : text,
-          "words": [captionWords[counter]],
-        })
-        counter += 1
+      if (VERBOSE):
+        logger.info(f"Video dimensions: {width}x{height}")
+        logger.info(f"Caption reserved width: {captionReservedWidth}")
+        logger.info(f"Caption font size: {captionFontSize}")
+      if (debugEnabled):
+        logger.debug("Characters width mapping: %s", charactersWidth)
+
+      # The final audio duration equals the sum of the chunk durations (the final caption offset).
+      estimatedAudioDuration = timeOffset
+      if (estimatedAudioDuration <= 0):
+        if (VERBOSE):
+          logger.info("Generated audio has zero duration. Exiting.")
+        return False, None
 
-    if (VERBOSE):
-      logger.info(f"Total caption strings generated: {len(captionsList)}")
-      logger.info(captionsList)
+      # Pack the caption words into lines that fit within the reserved width while the list of
+      # current videos is scanned and probed (FFprobe-bound for the new files).
+      captionsList, availableVideos = await self._PrepareCaptionsAndVideos(
+        captionWords, charactersWidth, captionReservedWidth, videoType
+      )
 
-    # Get the audio format from the configuration.
-    audioFormat = configs["ffmpeg"].get("audioFormat", "mp3")
+      if (VERBOSE):
+        logger.info(f"Total caption strings generated: {len(captionsList)}")
+      if (debugEnabled):
+        logger.debug("Captions: %s", captionsList)
 
-    # Merge all audio files into one.
-    mergedAudioPath = os.path.join(workingPath, f"{uniqueHashID}_Merged.{audioFormat}")
-    inputAudioFiles = [audioFilePath for _, _, _, audioFilePath, _ in dataList]
-    if (VERBOSE):
-      logger.info(f"Input audio files: {inputAudioFiles}")
-    isDone = asyncio.run(
-      self.ffmpegHelper.ConcatAudioFiles(
-        inputAudioFiles,
-        mergedAudioPath,
-      )
-    )
-    if (not isDone):
+      # Audio files to be concatenated into the final video.
+      inputAudioFiles = [audioFilePath for _, _, _, audioFilePath, _ in dataList]
       if (VERBOSE):
-        logger.info("Failed to merge audio files. Exiting.")
-      return False, None
+        logger.info(f"Input audio files: {inputAudioFiles}")
 
-    audioDuration = self.ffmpegHelper.GetFileDuration(mergedAudioPath)
-    if (VERBOSE):
-      logger.info(f"Merged audio file created at {mergedAudioPath} with duration {audioDuration:.2f} seconds.")
-    if (audioDuration <= 0):
+      maxLengthPerVideo = vcfg.get("maxLengthPerVideo", 5)  # Maximum length of each video segment.
+      # Calculate the number of videos needed.
+      requiredNoOfVideos = int(estimatedAudioDuration / maxLengthPerVideo) + 1
       if (VERBOSE):
-        logger.info("Merged audio file has zero duration. Exiting.")
-      return False, None
+        logger.info(
+          f"Required number of videos: {requiredNoOfVideos} for audio duration {estimatedAudioDuration:.2f} seconds."
+        )
 
-    maxLengthPerVideo = configs["video"].get("maxLengthPerVideo", 5)  # Maximum length of each video segment.
-    # Get the list of current videos and their durations.
-    availableVideos = self.GetCurrentVideosList(videoType=videoType)
-    requiredNoOfVideos = int(audioDuration / maxLengthPerVideo) + 1  # Calculate the number of videos needed.
-    if (VERBOSE):
-      logger.info(f"Required number of videos: {requiredNoOfVideos} for audio duration {audioDuration:.2f} seconds.")
+      if (requiredNoOfVideos <= 0):
+        if (VERBOSE):
+          logger.info("No videos required for the given audio duration. Exiting.")
+        return False, None
+      elif (not availableVideos):
+        if (VERBOSE):
+          logger.info("No more videos available to add. Exiting.")
+        return False, None
 
-    if (requiredNoOfVideos <= 0):
-      if (VERBOSE):
-        logger.info("No videos required for the given audio duration. Exiting.")
-      return False, None
-    elif (requiredNoOfVideos > len(availableVideos)):
-      while (requiredNoOfVideos > len(availableVideos)):
-        # If not enough videos are available, add more random videos.
-        newVideos = self.GetCurrentVideosList(videoType)
-        if (not newVideos):
-          if (VERBOSE):
-            logger.info("No more videos available to add. Exiting.")
-          return False, None
-        availableVideos.extend(newVideos)
+      # Pick distinct videos at random in one step.
+      selectedVideos = random.sample(availableVideos, k=min(requiredNoOfVideos, len(availableVideos)))
+      if (requiredNoOfVideos > len(selectedVideos)):
+        # If not enough videos are available, re-sample from the already probed list.
+        selectedVideos.extend(random.choices(availableVideos, k=requiredNoOfVideos - len(selectedVideos)))
 
-    videoFormat = configs["ffmpeg"].get("videoFormat", "mp4")  # Default video format.
-    portionedOutputVideoPath = os.path.join(workingPath, f"{uniqueHashID}_Merged.{videoFormat}")
+      videoFormat = fcfg.get("videoFormat", "mp4")  # Default video format.
 
-    # Get the absolute paths of the video files to concatenate.
-    videoFilePaths = [os.path.abspath(videoFilePath) for videoFilePath, _ in availableVideos[:requiredNoOfVideos]]
-    if (VERBOSE):
-      logger.info(portionedOutputVideoPath)
-      logger.info(videoFilePaths)
+      # Get the absolute paths of the video files to concatenate.
+      videoFilePaths = [os.path.abspath(videoFilePath) for videoFilePath, _ in selectedVideos]
+      if (debugEnabled):
+        logger.debug("Video files: %s", videoFilePaths)
 
-    isDone = asyncio.run(
-      self.ffmpegHelper.TrimConcatVideoFiles(
+      # Produce the final captioned video in a single ffmpeg pass (concat + trim + audio mux + captions).
+      captionedVideoPath = os.path.join(workingPath, f"{uniqueHashID}_Final.{videoFormat}")
+      isDone = await self.ffmpegHelper.BuildFullPipeline(
         videoFilePaths=videoFilePaths,  # List of paths to video files to concatenate.
-        outputFilePath=portionedOutputVideoPath,  # Path to save the concatenated video file.
+        audioFilePaths=inputAudioFiles,  # List of paths to the audio files to concatenate.
+        captionsList=captionsList,  # A list of dictionaries containing caption text and timing.
+        captionFontSize=captionFontSize,  # Font size for the captions.
+        outputFilePath=captionedVideoPath,  # Path to save the output video file with captions.
         start=0,  # Start time in seconds for the video portion.
         end=maxLengthPerVideo,  # End time in seconds for the video portion.
         width=width,  # Width of the output video.
         height=height,  # Height of the output video.
       )
-    )
-    if (not isDone):
-      if (VERBOSE):
-        logger.info("Failed to create video portion. Exiting.")
-      return False, None
-    if (VERBOSE):
-      logger.info(f"Video portion created at {portionedOutputVideoPath} with duration {audioDuration:.2f} seconds.")
-
-    outputNoCaptionPath = os.path.join(workingPath, f"{uniqueHashID}_NoCaptions.{videoFormat}")
-    isDone = asyncio.run(
-      self.ffmpegHelper.MergeAudioVideoFiles(
-        videoFilePath=portionedOutputVideoPath,  # Path to the video file.
-        audioFilePath=mergedAudioPath,  # Path to the audio file.
-        outputFilePath=outputNoCaptionPath,
-      )
-    )
-    if (not isDone):
-      if (VERBOSE):
-        logger.info("Failed to merge audio and video files. Exiting.")
-      return False, None
-    if (VERBOSE):
-      logger.info("Merged audio and video files successfully.")
-
-    # Add captions to the video using FFmpeg.
-    captionedVideoPath = os.path.join(workingPath, f"{uniqueHashID}_Final.{videoFormat}")
-    # Add captions to the video using FFmpeg.
-    isDone = asyncio.run(
-      self.ffmpegHelper.AddCaptionsToVideo(
-        videoFilePath=outputNoCaptionPath,  # Path to the input video file.
-        outputFilePath=captionedVideoPath,  # Path to save the output video file with captions.
-        captionsList=captionsList,  # A list of dictionaries containing caption text and timing.
-        captionFontSize=captionFontSize,  # Font size for the captions.
-      )
-    )
-    if (not isDone):
+      if (not isDone):
+        if (VERBOSE):
+          logger.info("Failed to create the captioned video. Exiting.")
+        return False, None
       if (VERBOSE):
-        logger.info("Failed to add captions to the video. Exiting.")
-      return False, None
-    if (VERBOSE):
-      logger.info(f"Video with captions created at {captionedVideoPath}.")
-
-    if (VERBOSE):
-      logger.info("We are good.")
+        logger.info(f"Video with captions created at {captionedVideoPath}.")
 
-    # Clean up temporary files if needed.
-    try:
-      os.remove(mergedAudioPath)  # Remove the merged audio file.
-      os.remove(portionedOutputVideoPath)  # Remove the video portion file.
-      os.remove(outputNoCaptionPath)  # Remove the video without captions.
-      # Remove audio files generated during the process.
-      for _, _, _, audioFilePath, _ in dataList:
-        if (os.path.exists(audioFilePath)):
-          os.remove(audioFilePath)
-          os.remove(audioFilePath.replace("Normalized_", ""))
-    except Exception as e:
       if (VERBOSE):
-        logger.info(f"Error cleaning up temporary files: {e}")
+        logger.info("We are good.")
 
-    # Get the file name from the path.
-    fileNameOnly = os.path.basename(captionedVideoPath)
-    if (VERBOSE):
-      logger.info(f"Generated video file name: {fileNameOnly}")
-    # Return True indicating the video was generated successfully, along with the file name.
-    return True, fileNameOnly
+      # Get the file name from the path.
+      fileNameOnly = os.path.basename(captionedVideoPath)
+      if (VERBOSE):
+        logger.info(f"Generated video file name: {fileNameOnly}")
+      # Return True indicating the video was generated successfully, along with the file name.
+      return True, fileNameOnly
+    finally:
+      # Clean up the intermediate audio files (raw and normalized) by removing the scratch folder,
+      # whether the video was generated or not. Delete it in the background so the caller does not wait for the disk.
+      threading.Thread(target=shutil.rmtree, args=(tempPath,), kwargs={"ignore_errors": True}, daemon=True).start()
 
 
 if __name__ == "__main__":
@@ -525,3 +974,6 @@ if __name__ == "__main__":
   else:
     if (VERBOSE):
       print("Generated video:", videoID)
+
+  # Stop the helper's event loop.
+  videoCreator.Close()
@@ -8,21 +8,183 @@
 # Permissions and Citation: Refer to the README file.
 '''
 
-import threading, time, logging
+import threading, time, logging, collections, json, asyncio, os, mmap, shutil, secrets, queue, tempfile
+from concurrent.futures import ThreadPoolExecutor
+from flask import Request, current_app
+from flask.json.provider import DefaultJSONProvider
+
+# Optional orjson for faster JSON (de)serialization.
+try:
+  import orjson
+except ImportError:
+  orjson = None  # orjson is not installed; the standard json module is used.
 
 # Use module logger so messages go through Python's logging system and appear with Flask output.
 logger = logging.getLogger(__name__)
 
 
+
+# Uploads up to this size stay in memory; larger ones are spooled to disk as they arrive.
+UPLOAD_SPOOL_SIZE = 500 * 1024
+
+# Buffer size used when writing spooled uploads.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Folder inside the store path that receives deleted job directories until they are removed.
+TRASH_DIR_NAME = ".trash"
+
+# Files at least this large are memory-mapped; smaller ones (such as job.json) take a single read().
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def ReadJsonFile(filePath):
+  """Read and parse a JSON file (e.g., job.json) without going through Python's buffered I/O layer."""
+  fd = os.open(filePath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+  try:
+    size = os.fstat(fd).st_size
+    if ((size >= MMAP_MIN_SIZE) and (orjson is not None)):
+      # Let orjson parse the mapped pages directly (no copy into a bytes object).
+      with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+          return orjson.loads(view)
+    data = os.read(fd, size + 1)  # One syscall for small files (+1 catches a file that grew).
+    while (len(data) > size):
+      chunk = os.read(fd, MMAP_MIN_SIZE)
+      if (not chunk):
+        break
+      data += chunk
+  finally:
+    os.close(fd)
+  return orjson.loads(data) if (orjson is not None) else json.loads(data)
+
+
+def WriteJsonFile(filePath, data):
+  """Serialize data to a JSON file (e.g., job.json) with one open and (usually) one write."""
+  payload = orjson.dumps(data) if (orjson is not None) else json.dumps(data).encode("utf-8")
+  fd = os.open(filePath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+  try:
+    view = memoryview(payload)
+    while (view):
+      view = view[os.write(fd, view):]  # Loop only on short writes.
+  finally:
+    os.close(fd)
+
+
+
+def StartBackgroundLoop():
+  """Start a long-lived event loop in a daemon thread (request handlers submit their coroutines to it)."""
+  loop = asyncio.new_event_loop()
+  threading.Thread(target=loop.run_forever, name="BackgroundLoop", daemon=True).start()
+  return loop
+
+
+def DeleteDirsInBackground(dirPaths, storePath):
+  """
+  Delete directories without blocking the caller.
+  Each directory is renamed into a fresh folder under `<storePath>/.trash` (one rename per directory),
+  and a daemon thread removes that folder. Directories that cannot be renamed are removed inline.
+  Folders left behind by an interrupted run are removed by `SweepTrash` at startup.
+  """
+  trashPath = os.path.join(storePath, TRASH_DIR_NAME, f"{time.time_ns() // 1_000_000}-{secrets.token_hex(4)}")
+  os.makedirs(trashPath, exist_ok=True)
+  for dirPath in dirPaths:
+    try:
+      os.rename(dirPath, os.path.join(trashPath, os.path.basename(dirPath)))
+    except OSError:
+      shutil.rmtree(dirPath, ignore_errors=True)  # E.g., on another file system.
+  threading.Thread(target=_RemoveTrash, args=(trashPath,), daemon=True).start()
+
+
+def SweepTrash(storePath):
+  """Remove, in the background, the trash folders left in the store path by an earlier (interrupted) run."""
+  try:
+    with os.scandir(os.path.join(storePath, TRASH_DIR_NAME)) as entries:
+      trashPaths = [entry.path for entry in entries if (entry.is_dir(follow_symlinks=False))]
+  except FileNotFoundError:
+    return
+  if (trashPaths):
+    threading.Thread(
+      target=lambda: [_RemoveTrash(trashPath) for trashPath in trashPaths],
+      name="TrashSweeper",
+      daemon=True,
+    ).start()
+
+
+def _RemoveTrash(trashPath, maxWorkers=8):
+  """Remove a trash folder, deleting its job directories in parallel (unlink and rmdir release the GIL)."""
+  try:
+    with os.scandir(trashPath) as entries:
+      dirPaths = [entry.path for entry in entries]
+  except OSError:
+    dirPaths = []  # Already removed.
+  if (len(dirPaths) > 1):
+    with ThreadPoolExecutor(max_workers=min(maxWorkers, len(dirPaths)), thread_name_prefix="TrashRemover") as pool:
+      for dirPath in dirPaths:
+        pool.submit(shutil.rmtree, dirPath, ignore_errors=True)
+  shutil.rmtree(trashPath, ignore_errors=True)  # Whatever is left (the single directory, or the folder itself).
+
+
+class OrjsonProvider(DefaultJSONProvider):
+  """Flask JSON provider that serializes responses with orjson (falls back to the default provider)."""
+
+  def dumps(self, obj, **kwargs):
+    if ((orjson is None) or ("cls" in kwargs)):
+      return super().dumps(obj, **kwargs)
+    option = orjson.OPT_NON_STR_KEYS
+    if (kwargs.get("sort_keys", self.sort_keys)):
+      option |= orjson.OPT_SORT_KEYS
+    if (kwargs.get("indent")):
+      option |= orjson.OPT_INDENT_2
+    try:
+      return orjson.dumps(obj, default=self.default, option=option).decode()
+    except TypeError:
+      return super().dumps(obj, **kwargs)  # E.g., integers wider than 64 bits.
+
+  def loads(self, s, **kwargs):
+    if (orjson is None):
+      return super().loads(s, **kwargs)
+    return orjson.loads(s)
+
+
+class UploadRequest(Request):
+  """
+  Flask request class that spools large uploads straight into a temporary file under the store path.
+  Werkzeug's default buffers every upload in memory first and copies it to /tmp once it passes 500 KB;
+  here a large upload is written to disk once, on the same file system as the files saved from it.
+  """
+
+  def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+    if ((total_content_length is not None) and (total_content_length <= UPLOAD_SPOOL_SIZE)):
+      return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+    storePath = current_app.config.get("STORE_PATH")
+    return tempfile.TemporaryFile("rb+", buffering=STREAM_CHUNK_SIZE, dir=storePath if (storePath) else None)
+
+
 class JobStatusHistory(object):
   """Class to maintain a history of job statuses with timestamps."""
 
   def __init__(self):
     self.history = {}
+    self._cv = threading.Condition()  # Notified whenever a status changes.
+    self._queued = collections.deque()  # Queued job IDs in arrival order (validated lazily on pop).
+    self._processing = set()  # IDs of the jobs being processed.
+    self._queuedCount = 0  # Number of jobs whose current status is "queued".
+
+  def _track(self, jobId, status):
+    """Move the job between the queued/processing indexes and wake up the waiting watchers."""
+    with self._cv:
+      self._queuedCount += (status == "queued") - (self.history.get(jobId) == "queued")
+      self.history[jobId] = status
+      self._processing.discard(jobId)
+      if (status == "processing"):
+        self._processing.add(jobId)
+      elif (status == "queued"):
+        self._queued.append(jobId)
+      self._cv.notify_all()
 
   def addStatus(self, jobId, status):
     """Add a status entry for a job."""
-    self.history[jobId] = status
+    self._track(jobId, status)
 
   def getHistory(self, jobId):
     """Retrieve the status history for a specific job."""
@@ -41,19 +203,57 @@ class JobStatusHistory(object):
     return self.history.get(jobId, default)
 
   def delete(self, jobId):
-    if (jobId in self.history):
-      del self.history[jobId]
+    with self._cv:
+      if (jobId in self.history):
+        self._queuedCount -= (self.history.pop(jobId) == "queued")
+      self._processing.discard(jobId)
+      self._cv.notify_all()
 
   def clear(self):
-    self.history.clear()
+    with self._cv:
+      self.history.clear()
+      self._queued.clear()
+      self._processing.clear()
+      self._queuedCount = 0
+      self._cv.notify_all()
 
   def updateStatus(self, jobId, status):
     """Update the status of a job."""
-    self.history[jobId] = status
+    self._track(jobId, status)
+
+  def processingCount(self):
+    """Return the number of jobs being processed."""
+    return len(self._processing)
+
+  def queuedCount(self):
+    """Return the number of queued jobs (kept up to date on every status change)."""
+    return self._queuedCount
+
+  def _hasQueued(self):
+    """Drop the stale head entries (no longer queued) and report whether a queued job is waiting."""
+    while (self._queued and (self.history.get(self._queued[0]) != "queued")):
+      self._queued.popleft()
+    return bool(self._queued)
+
+  def popQueued(self):
+    """Remove and return the oldest queued job ID (None when nothing is queued)."""
+    with self._cv:
+      return self._queued.popleft() if (self._hasQueued()) else None
+
+  def waitForQueued(self, maxJobs, timeout):
+    """Block until a queued job can start (fewer than maxJobs being processed) or the timeout expires."""
+    with self._cv:
+      return self._cv.wait_for(
+        lambda: (len(self._processing) < maxJobs) and self._hasQueued(),
+        timeout=timeout,
+      )
 
   def __len__(self):
     return len(self.history)
 
+  def __contains__(self, jobId):
+    return (jobId in self.history)
+
 
 class QueueWatcher(threading.Thread):
   """A thread to monitor the job queue and process jobs as they are added."""
@@ -71,29 +271,114 @@ class QueueWatcher(threading.Thread):
   def run(self):
     """Continuously check the job queue and process jobs if available."""
     while (self.running):
-      noOfBeingProcessedJobs = len(
-        [status for status in self.jobHistoryObj.values() if (status == "processing")]
-      )
-      isBusy = noOfBeingProcessedJobs >= self.maxJobs
-
-      if (not isBusy):
-        logger.info(f"QueueWatcher: Processing jobs. Currently {noOfBeingProcessedJobs} jobs being processed.")
-        if (not self.running):
-          logger.info("QueueWatcher: Stopping thread as requested.")
+      # Wait (at most one second) until a job is queued and a processing slot is free.
+      if (not self.jobHistoryObj.waitForQueued(self.maxJobs, timeout=1)):
+        self.counter += 1
+        if (self.counter >= self.timout):
+          logger.info("QueueWatcher: No jobs to process. Sleeping for a while...")
           break
+        continue
 
-        # Process the next job if available
-        for jobId, status in self.jobHistoryObj.items():
-          if (status == "queued"):
-            logger.info(f"QueueWatcher: Processing job {jobId}.")
-            self.func(jobId)
-            break
-
-      # Sleep for a short duration before checking again.
-      time.sleep(1)
-      self.counter += 1
-      if (self.counter >= self.timout):
-        logger.info("QueueWatcher: No jobs to process. Sleeping for a while...")
+      if (not self.running):
+        logger.info("QueueWatcher: Stopping thread as requested.")
         break
 
+      noOfBeingProcessedJobs = self.jobHistoryObj.processingCount()
+      logger.info(f"QueueWatcher: Processing jobs. Currently {noOfBeingProcessedJobs} jobs being processed.")
+      # Take the next job (another watcher may have taken it in the meantime).
+      jobId = self.jobHistoryObj.popQueued()
+      if (jobId is not None):
+        logger.info(f"QueueWatcher: Processing job {jobId}.")
+        self.func(jobId)
+
     logger.info("QueueWatcher: Exiting run loop.")
+
+
+class FileSyncer(threading.Thread):
+  """
+  A thread that flushes written files (e.g., job.json) to disk in the background.
+  Requests are grouped: after the first path arrives, the thread collects more for up to `maxDelay`
+  seconds (or `maxBatch` paths), then syncs each distinct file once and each parent directory once,
+  so a burst of new jobs shares one flush round instead of blocking every request on its own fsync.
+  """
+
+  def __init__(self, maxBatch=64, maxDelay=0.01):
+    super().__init__(name="FileSyncer", daemon=True)
+    self.maxBatch = maxBatch
+    self.maxDelay = maxDelay
+    self._queue = queue.Queue()
+
+  def sync(self, filePath):
+    """Schedule a file (already written and closed) to be flushed to disk."""
+    self._queue.put(filePath)
+
+  def _collectBatch(self):
+    """Block for the first path, then gather more until the batch is full or the delay expires."""
+    batch = {self._queue.get()}
+    deadline = time.monotonic() + self.maxDelay
+    while (len(batch) < self.maxBatch):
+      remaining = deadline - time.monotonic()
+      if (remaining <= 0):
+        break
+      try:
+        batch.add(self._queue.get(timeout=remaining))
+      except queue.Empty:
+        break
+    return batch
+
+  @staticmethod
+  def _flush(path, isDir=False):
+    """fsync a file (data only where supported) or a directory entry; errors are ignored."""
+    try:
+      fd = os.open(path, os.O_RDONLY)
+    except OSError:
+      return  # Deleted in the meantime, or directories cannot be opened (Windows).
+    try:
+      if ((not isDir) and hasattr(os, "fdatasync")):
+        os.fdatasync(fd)
+      else:
+        os.fsync(fd)
+    except OSError:
+      pass
+    finally:
+      os.close(fd)
+
+  def run(self):
+    """Flush the scheduled files in batches for the lifetime of the process."""
+    while (True):
+      batch = self._collectBatch()
+      for filePath in batch:
+        self._flush(filePath)
+      # Make the new directory entries durable as well (one flush per directory).
+      for dirPath in {os.path.dirname(os.path.abspath(filePath)) for filePath in batch}:
+        self._flush(dirPath, isDir=True)
+
+
+def EnsureQueueWatcher(app, createIfMissing=False):
+  """
+  Make sure the queue watcher of the app is running, restarting it if its thread has exited.
+  The check and the restart happen under app.config["QUEUE_WATCHER_LOCK"], so concurrent requests
+  never start two watchers. Without `createIfMissing`, an app that has no watcher (test mode) keeps none.
+  Returns "running", "restarted", "started", or None (no watcher).
+  """
+
+  with app.config["QUEUE_WATCHER_LOCK"]:
+    queueWatcher = app.config.get("QUEUE_WATCHER")
+    if (queueWatcher is None):
+      if (not createIfMissing):
+        return None
+      state = "started"
+    elif (queueWatcher.is_alive()):
+      return "running"
+    else:
+      state = "restarted"
+    # A thread can only be started once, so a fresh watcher replaces the old one.
+    queueWatcher = QueueWatcher(
+      app.config["ProcessJob"],
+      maxJobs=app.config.get("MAX_JOBS", 1),
+      maxTimeout=app.config.get("MAX_TIMEOUT", 10),
+    )
+    queueWatcher.jobHistoryObj = app.config["JOB_HISTORY_OBJ"]
+    app.config["QUEUE_WATCHER"] = queueWatcher
+    queueWatcher.start()
+    return state
@@ -14,29 +14,104 @@ import shutup
 shutup.please()  # This function call suppresses unnecessary warnings.
 
 # Import necessary libraries for the text-to-speech system.
-import torch, os, time, whisper, yaml, logging
+import torch, os, time, whisper, logging, functools
+import numpy as np
 from FFMPEGHelper import FFMPEGHelper
+from ConfigsLoader import LoadConfigs
+
+try:
+  # Optional CTranslate2 backend (int8 quantized Whisper).
+  import faster_whisper
+except Exception:
+  faster_whisper = None
 
 # Use module logger so messages go through Python's logging system and appear with Flask output.
 logger = logging.getLogger(__name__)
 
-with open("configs.yaml", "r") as configFile:
-  # Load the configuration from the YAML file.
-  configs = yaml.safe_load(configFile)
+configs = LoadConfigs()  # Shared configuration settings (configs.yaml is parsed once per process).
 VERBOSE = configs.get("verbose", False)  # Get the verbose setting from the configuration.
 
 
+@functools.lru_cache(maxsize=4)
+def _LoadModel(backend, modelName, device, computeType, numWorkers=1):
+  """
+  Load a Whisper model once per process and share it between the helper instances.
+  Returns a (model, batchedPipeline) tuple; the batched pipeline is None for the openai-whisper backend.
+  """
+  if (backend == "faster-whisper"):
+    # Prefer the locally converted int8 CTranslate2 model (see ConvertModel) over the hub download.
+    localModelPath = _LocalModelPath(modelName)
+    if (os.path.isfile(os.path.join(localModelPath, "model.bin"))):
+      if (VERBOSE):
+        logger.info(f"Using the local CTranslate2 model: {localModelPath}")
+      modelName = localModelPath
+    # Load the quantized CTranslate2 model.
+    # numWorkers lets that many transcribe calls run in parallel (one per concurrent pipeline batch).
+    model = faster_whisper.WhisperModel(modelName, device=device, compute_type=computeType, num_workers=numWorkers)
+    # Batched pipeline that decodes several clips per forward pass.
+    return model, faster_whisper.BatchedInferencePipeline(model=model)
+
+  model = whisper.load_model(modelName, device=device).eval()
+  if (device == "cuda"):
+    # Allow TF32 tensor cores for the remaining FP32 matmuls/convolutions.
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    # transcribe() runs in FP16 on CUDA and casts every Linear/Conv1d weight to the input dtype on
+    # every forward pass; store those weights in FP16 once instead. LayerNorm stays in FP32, as
+    # Whisper's LayerNorm computes in FP32 regardless of the input dtype.
+    for module in model.modules():
+      if (isinstance(module, (whisper.model.Linear, whisper.model.Conv1d))):
+        module.half()
+  return model, None
+
+
+def _LocalModelPath(modelName):
+  """Return the directory of the locally converted CTranslate2 model of the given model name."""
+  return os.path.join(configs["whisper"].get("modelsPath", "./Assets/Models/Whisper"), f"{modelName}-ct2")
+
+
+def ConvertModel(modelName, quantization="int8_float16"):
+  """
+  Convert a Whisper model to a quantized CTranslate2 model (one-time step; requires `transformers`).
+  The weights are stored quantized on disk (int8_float16 is ~4x smaller than FP32 and loads as int8 on CPU),
+  and the faster-whisper backend picks the converted model up from `whisper.modelsPath`.
+  Parameters:
+    modelName (str): A Whisper model name (e.g., "base.en" or "turbo") or a Hugging Face repository ID.
+    quantization (str): The CTranslate2 weight quantization (e.g., "int8_float16", "int8", or "float16").
+  Returns:
+    str: The directory of the converted model.
+  """
+  from ctranslate2.converters import TransformersConverter
+
+  # Map the Whisper model names to their Hugging Face repositories.
+  repoNames = {"turbo": "large-v3-turbo", "large": "large-v3"}
+  repoId = modelName if ("/" in modelName) else f"openai/whisper-{repoNames.get(modelName, modelName)}"
+  outputDir = _LocalModelPath(modelName)
+  converter = TransformersConverter(repoId, copy_files=["tokenizer.json", "preprocessor_config.json"])
+  converter.convert(outputDir, quantization=quantization, force=True)
+  return outputDir
+
+
 class WhisperTranscribeHelper(object):
   def __init__(self):
     """Initialize the WhisperTranscribeHelper with a specified model."""
+    # Select the backend: "faster-whisper" (CTranslate2, int8), "openai", or "auto" (faster-whisper when installed).
+    backend = configs["whisper"].get("backend", "auto")
+    if (backend == "auto"):
+      backend = "faster-whisper" if (faster_whisper is not None) else "openai"
+    elif ((backend == "faster-whisper") and (faster_whisper is None)):
+      logger.warning("faster-whisper is not installed. Falling back to the openai-whisper backend.")
+      backend = "openai"
+    self.backend = backend
+
     # Get a list of available Whisper models.
     self.availableModels = whisper.available_models()
+    if (self.backend == "faster-whisper"):
+      # Add the CTranslate2 model names (e.g., distil variants) to the list.
+      self.availableModels = list(dict.fromkeys(self.availableModels + faster_whisper.available_models()))
     # Initialize the FFMPEG helper for audio processing.
     self.ffmpegHelper = FFMPEGHelper()
 
-    # Default model name from the configuration.
-    self.modelName = configs["whisper"].get("modelName", "base.en")
-    self.SetModelName(self.modelName)  # Load the specified Whisper model.
     # Check if GPU is available, otherwise use CPU.
     self.device = "cuda" if (torch.cuda.is_available()) else "cpu"
     if (self.device == "cuda"):
@@ -45,6 +120,16 @@ class WhisperTranscribeHelper(object):
     else:
       # Indicate that the CPU is being used.
       logger.info("Using CPU for transcription.")
+    # Compute type of the CTranslate2 model ("auto" selects int8_float16 on GPU and int8 on CPU).
+    computeType = configs["whisper"].get("computeType", "auto")
+    if (computeType == "auto"):
+      computeType = "int8_float16" if (self.device == "cuda") else "int8"
+    self.computeType = computeType
+    # Side stream for the pinned host-to-device audio uploads (openai-whisper backend on CUDA only).
+    self._copyStream = torch.cuda.Stream() if ((self.device == "cuda") and (self.backend != "faster-whisper")) else None
+
+    # Load the default model from the configuration (the device is known, so the model cache key is valid).
+    self.SetModelName(configs["whisper"].get("modelName", "base.en"))
 
   def GetAvailableModels(self):
     """Return a list of available Whisper models."""
@@ -60,30 +145,142 @@ class WhisperTranscribeHelper(object):
     """Set the Whisper model to a new model name."""
     # Check if the requested model is available.
     if (modelName in self.availableModels):
+      if ((modelName == getattr(self, "modelName", None)) and hasattr(self, "model")):
+        return  # The requested model is already loaded.
+      # Load the new model (or reuse the one already loaded by another instance).
+      self.model, self.batchedPipeline = _LoadModel(
+        self.backend, modelName, self.device, self.computeType,
+        max(1, configs["whisper"].get("maxConcurrency", 2)),
+      )
       self.modelName = modelName  # Update the model name.
-      self.model = whisper.load_model(modelName)  # Load the new model.
     else:
       # Raise an error if the model is not available.
       raise ValueError(f"Model {modelName} is not available.\nAvailable models: {self.availableModels}")
 
-  def Transcribe(self, audioPath, language="en"):
-    """Transcribe audio to text using the Whisper model."""
-    # Load the audio file and process it for transcription.
-    # Load the audio file into memory.
-    audio = whisper.load_audio(audioPath)
-    # Pad or trim the audio to fit the model's input requirements.
-    audio = whisper.pad_or_trim(audio)
+  def _RunModel(self, audio, language, clipTimestamps=None, initialPrompt=None):
+    """
+    Run the loaded model on the decoded audio and return the result in the openai-whisper format.
+    With the faster-whisper backend, clipTimestamps (a list of {"start", "end"} dictionaries in seconds,
+    each at most 30 seconds long) decodes the given regions as one batch.
+    The TTS audio is clean and its text is known, so decoding is greedy, without temperature fallback and
+    without conditioning on the previous window; initialPrompt (the synthesized text) guides the decoder.
+    """
+    if (self.backend != "faster-whisper"):
+      if (isinstance(audio, np.ndarray) and (self._copyStream is not None)):
+        # Upload the samples so that transcribe() computes the mel spectrogram on the GPU.
+        audio = self._UploadAudio(audio)
+        torch.cuda.current_stream().wait_stream(self._copyStream)
+        audio.record_stream(torch.cuda.current_stream())
+      # Skip the autograd bookkeeping entirely during inference.
+      with torch.inference_mode():
+        return self.model.transcribe(
+          audio,
+          language=language,  # Specify the language for transcription.
+          word_timestamps=True,  # Enable word-level timestamps.
+          fp16=(self.device == "cuda"),  # FP16 inference on GPU (FP32 on CPU).
+          beam_size=None,  # Greedy decoding (no beam search).
+          best_of=None,
+          temperature=0.0,  # Single temperature, so no fallback re-decoding.
+          condition_on_previous_text=False,  # Each window stands alone (no error propagation).
+          initial_prompt=initialPrompt,
+        )
+
+    # Skip the silent regions with the Silero VAD (the timestamps are restored to the original audio).
+    vadFilter = configs["whisper"].get("vadFilter", True)
+    vadParameters = {"min_silence_duration_ms": configs["whisper"].get("vadMinSilenceMs", 500)}
+
+    if (clipTimestamps):
+      # Decode the clips in batches; the segment timestamps are offset back to the joined audio.
+      segments, info = self.batchedPipeline.transcribe(
+        audio,
+        language=language,  # Specify the language for transcription.
+        word_timestamps=True,  # Enable word-level timestamps.
+        beam_size=1,  # Greedy decoding; the TTS audio is clean, so beam search only adds decoder passes.
+        best_of=1,
+        temperature=0.0,  # Single temperature, so no fallback re-decoding.
+        clip_timestamps=clipTimestamps,  # One batch element per clip (replaces the VAD chunking).
+        batch_size=configs["whisper"].get("batchSize", 8),  # Clips decoded per forward pass.
+      )
+    else:
+      # The CTranslate2 model yields the segments lazily; consume them into the openai-whisper layout.
+      segments, info = self.model.transcribe(
+        audio,
+        language=language,  # Specify the language for transcription.
+        word_timestamps=True,  # Enable word-level timestamps.
+        beam_size=1,  # Greedy decoding; the TTS audio is clean, so beam search only adds decoder passes.
+        best_of=1,
+        temperature=0.0,  # Single temperature, so no fallback re-decoding.
+        condition_on_previous_text=False,  # Each window stands alone (no error propagation).
+        initial_prompt=initialPrompt,
+        vad_filter=vadFilter,  # Transcribe only the voiced regions.
+        vad_parameters=vadParameters if (vadFilter) else None,
+      )
+    segmentsList = [
+      {
+        "start": segment.start,  # Start time of the segment.
+        "end"  : segment.end,  # End time of the segment.
+        "text" : segment.text,  # Text of the segment.
+        "words": [
+          {"word": word.word, "start": word.start, "end": word.end}
+          for word in (segment.words or [])
+        ],
+      }
+      for segment in segments
+    ]
+    return {
+      "text"    : "".join(segment["text"] for segment in segmentsList),  # Full transcribed text.
+      "segments": segmentsList,
+      "language": info.language,  # Detected (or forced) language.
+      "duration": info.duration,  # Duration of the decoded audio in seconds.
+    }
+
+  def _UploadAudio(self, audio):
+    """
+    Move decoded samples to the model device for the openai-whisper backend.
+    On CUDA the samples are staged in pinned memory and copied asynchronously on a side stream,
+    so the copy overlaps the work queued on the compute stream.
+    """
+    samples = torch.from_numpy(audio)
+    if (self._copyStream is None):
+      return samples  # CPU inference: nothing to upload.
+    samples = samples.pin_memory()
+    with torch.cuda.stream(self._copyStream):
+      return samples.to(self.device, non_blocking=True)
+
+  def _LoadAudio(self, audioPath):
+    """Decode an audio file to 16 kHz mono float32 samples."""
+    if (faster_whisper is not None):
+      # Decode in-process with PyAV instead of spawning an ffmpeg subprocess per file.
+      return faster_whisper.decode_audio(audioPath, sampling_rate=whisper.audio.SAMPLE_RATE)
+    return whisper.load_audio(audioPath)
+
+  def Transcribe(self, audioPath, language="en", initialPrompt=None):
+    """
+    Transcribe audio to text using the Whisper model. A list of paths is transcribed as one batch.
+    initialPrompt (e.g., the text that was synthesized) guides the decoder for a single file.
+    """
+    if (isinstance(audioPath, (list, tuple))):
+      # Transcribe multiple audio files with a single model call.
+      return self.TranscribeBatch(audioPath, language=language)
+    if (self.backend == "faster-whisper"):
+      # faster-whisper decodes the file itself and chunks it internally (no 30-second truncation).
+      audio = audioPath
+    else:
+      # Load the audio file and process it for transcription.
+      # Load the audio file into memory.
+      audio = self._LoadAudio(audioPath)
+      # The decoded samples are at 16 kHz, so the duration needs no extra ffprobe call.
+      audioDuration = len(audio) / whisper.audio.SAMPLE_RATE
+      # No pad_or_trim: transcribe() windows (and pads) the audio itself, and trimming would drop
+      # everything after the first 30 seconds.
 
     # Make a prediction using the Whisper model.
     # Transcribe the audio to text in English.
-    result = self.model.transcribe(
-      audio,
-      language=language,  # Specify the language for transcription.
-      word_timestamps=True,  # Enable word-level timestamps.
-    )
+    result = self._RunModel(audio, language, initialPrompt=initialPrompt)
 
-    # Get the duration of the audio file.
-    audioDuration = self.ffmpegHelper.GetFileDuration(audioPath)
+    if (self.backend == "faster-whisper"):
+      # Get the duration of the audio file as measured by the decoder.
+      audioDuration = result["duration"]
 
     # Process the result to extract relevant information.
     resultDict = {
@@ -112,6 +309,208 @@ class WhisperTranscribeHelper(object):
     return resultDict
 
 
+  def TranscribeBatch(self, audioPaths, language="en", gapSeconds=1.0):
+    """
+    Transcribe several audio files with a single Whisper call.
+    The clips are decoded once, joined with short silent gaps, and transcribed together so that
+    the model fills its 30-second windows with speech instead of padding. Each word is then
+    mapped back to its clip (by the word midpoint) and re-based to the clip start.
+    Parameters:
+      audioPaths (list): The list of audio file paths to transcribe.
+      language (str): The language for transcription (default is "en").
+      gapSeconds (float): The silence inserted between clips (default is 1.0 second).
+    Returns:
+      list: A list of transcription dictionaries, one per audio file, in the input order.
+    """
+    if (len(audioPaths) == 0):
+      return []  # Nothing to transcribe.
+
+    # Load all the audio files into memory (16 kHz mono float32).
+    audios = [self._LoadAudio(audioPath) for audioPath in audioPaths]
+    # Silent gap separating consecutive clips.
+    gap = np.zeros(int(whisper.audio.SAMPLE_RATE * gapSeconds), dtype=np.float32)
+
+    # Compute the start offset (in seconds) of each clip in the joined audio.
+    offsets = []
+    pieces = []
+    position = 0
+    for audio in audios:
+      offsets.append(position / whisper.audio.SAMPLE_RATE)
+      pieces.extend([audio, gap])
+      position += len(audio) + len(gap)
+    joinedAudio = np.concatenate(pieces)
+
+    clipTimestamps = None
+    clipDurations = [len(audio) / whisper.audio.SAMPLE_RATE for audio in audios]
+    if ((self.backend == "faster-whisper") and (max(clipDurations) <= 30.0)):
+      # Decode every clip as its own batch element. Clips of similar duration are grouped together
+      # so that each batch carries as little padding as possible.
+      clipTimestamps = [
+        {"start": offsets[i], "end": offsets[i] + clipDurations[i]}
+        for i in sorted(range(len(audios)), key=lambda i: clipDurations[i])
+      ]
+
+    # Make a single prediction over the joined audio.
+    result = self._RunModel(joinedAudio, language, clipTimestamps=clipTimestamps)
+
+    # Prepare an empty segment list per clip.
+    clipSegments = [[] for _ in audioPaths]
+    for segment in result["segments"]:
+      # Group the words of the segment by the clip they belong to.
+      groups = {}
+      for word in segment.get("words", []):
+        midpoint = (word["start"] + word["end"]) / 2.0
+        # Find the last clip that starts before the word midpoint.
+        clipIndex = max(int(np.searchsorted(offsets, midpoint, side="right")) - 1, 0)
+        groups.setdefault(clipIndex, []).append(word)
+      for clipIndex, words in groups.items():
+        offset = offsets[clipIndex]  # Start of the clip in the joined audio.
+        clipDuration = clipDurations[clipIndex]
+        # Re-base the word timings to the clip and clamp them to its duration.
+        clipWords = [
+          {
+            "word" : word["word"].strip(),  # Individual word.
+            "start": min(max(word["start"] - offset, 0.0), clipDuration),  # Start time of the word.
+            "end"  : min(max(word["end"] - offset, 0.0), clipDuration),  # End time of the word.
+          }
+          for word in words
+        ]
+        clipSegments[clipIndex].append(
+          {
+            "start": clipWords[0]["start"],  # Start time of the segment.
+            "end"  : clipWords[-1]["end"],  # End time of the segment.
+            "text" : "".join(word["word"] for word in words),  # Text of the segment.
+            "words": clipWords,
+          }
+        )
+
+    # Build one result dictionary per clip.
+    resultsList = []
+    for i, audioPath in enumerate(audioPaths):
+      resultsList.append(
+        {
+          "text"    : "".join(segment["text"] for segment in clipSegments[i]),  # Full transcribed text.
+          "segments": clipSegments[i],  # Segments re-based to the clip.
+          "language": result["language"],  # Detected language.
+          "duration": clipDurations[i],  # Duration of the audio in seconds (from the decoded samples).
+        }
+      )
+
+    # Return the transcription results in the input order.
+    return resultsList
+
+  def Align(self, audioPaths, texts, language="en"):
+    """
+    Get the word timings of known texts by forced alignment instead of transcription.
+    Each clip is encoded once and the decoder is teacher-forced with the tokens of its text; dynamic time
+    warping over the cross-attention of the alignment heads then gives the word boundaries. No
+    autoregressive decoding is run. Clips that cannot be aligned (longer than one 30-second window,
+    empty text, or no aligned words) are transcribed with TranscribeBatch instead.
+    Parameters:
+      audioPaths (list): The list of audio file paths.
+      texts (list): The text spoken in each audio file (e.g., the text given to the TTS).
+      language (str): The language of the texts (default is "en").
+    Returns:
+      list: A list of dictionaries in the Transcribe format, one per audio file, in the input order.
+    """
+    if (len(audioPaths) == 0):
+      return []  # Nothing to align.
+
+    # Load all the audio files into memory (16 kHz mono float32).
+    audios = [self._LoadAudio(audioPath) for audioPath in audioPaths]
+    clipDurations = [len(audio) / whisper.audio.SAMPLE_RATE for audio in audios]
+    # Only the clips that fit in a single window (and have text) are aligned.
+    alignable = [
+      i for i in range(len(audios))
+      if ((clipDurations[i] <= whisper.audio.CHUNK_LENGTH) and texts[i] and texts[i].strip())
+    ]
+
+    alignments = [None] * len(audios)  # Lists of (word, start, end) per clip.
+    if (alignable and (self.backend == "faster-whisper")):
+      from faster_whisper.tokenizer import Tokenizer
+      from faster_whisper.transcribe import pad_or_trim, merge_punctuations
+      tokenizer = Tokenizer(self.model.hf_tokenizer, self.model.model.is_multilingual, task="transcribe", language=language)
+      # Compute the log-mel features of every clip and encode them all in a single batch.
+      features = [self.model.feature_extractor(audios[i])[..., :-1] for i in alignable]
+      numFrames = [feature.shape[-1] for feature in features]
+      encoderOutput = self.model.encode(np.stack([pad_or_trim(feature) for feature in features]))
+      results = self.model.find_alignment(
+        tokenizer,
+        [tokenizer.encode(" " + texts[i].strip()) for i in alignable],
+        encoderOutput,
+        numFrames,
+      )
+      for i, words in zip(alignable, results):
+        # Attach the punctuation to the neighbouring words (as the transcription does).
+        merge_punctuations(words, "\"'“¿([{-", "\"'.。,，!！?？:：”)]}、")
+        alignments[i] = [(word["word"], word["start"], word["end"]) for word in words]
+    elif (alignable):
+      tokenizer = whisper.tokenizer.get_tokenizer(
+        self.model.is_multilingual, num_languages=self.model.num_languages, language=language, task="transcribe",
+      )
+      dtype = torch.float16 if (self.device == "cuda") else torch.float32
+      # Upload the samples of the next clip while the current clip is being aligned.
+      nextSamples = self._UploadAudio(audios[alignable[0]])
+      for k, i in enumerate(alignable):
+        samples = nextSamples
+        if (self._copyStream is not None):
+          # Make the compute stream wait for the upload (and own the uploaded memory from now on).
+          torch.cuda.current_stream().wait_stream(self._copyStream)
+          samples.record_stream(torch.cuda.current_stream())
+        if (k + 1 < len(alignable)):
+          nextSamples = self._UploadAudio(audios[alignable[k + 1]])
+        # The STFT and the mel filter bank run on the device of the samples (GPU when available).
+        mel = whisper.log_mel_spectrogram(samples, self.model.dims.n_mels)
+        numFrames = mel.shape[-1]
+        mel = whisper.pad_or_trim(mel, whisper.audio.N_FRAMES).to(dtype)
+        with torch.inference_mode():
+          words = whisper.timing.find_alignment(
+            self.model, tokenizer, tokenizer.encode(" " + texts[i].strip()), mel, numFrames,
+          )
+        # Attach the punctuation to the neighbouring words (as the transcription does).
+        whisper.timing.merge_punctuations(words, "\"'“¿([{-", "\"'.。,，!！?？:：”)]}、")
+        alignments[i] = [(word.word, word.start, word.end) for word in words]
+
+    resultsList = [None] * len(audios)
+    for i, words in enumerate(alignments):
+      # Drop the entries emptied by the punctuation merge.
+      words = [(word.strip(), start, end) for word, start, end in (words or []) if (word.strip())]
+      if (not words):
+        continue  # Fall back to the transcription below.
+      clipWords = [
+        {
+          "word" : word,  # Individual word.
+          "start": min(max(float(start), 0.0), clipDurations[i]),  # Start time of the word.
+          "end"  : min(max(float(end), 0.0), clipDurations[i]),  # End time of the word.
+        }
+        for word, start, end in words
+      ]
+      resultsList[i] = {
+        "text"    : " " + texts[i].strip(),  # The known text.
+        "segments": [
+          {
+            "start": clipWords[0]["start"],  # Start time of the segment.
+            "end"  : clipWords[-1]["end"],  # End time of the segment.
+            "text" : " " + texts[i].strip(),  # Text of the segment.
+            "words": clipWords,
+          }
+        ],
+        "language": language,  # The language of the text.
+        "duration": clipDurations[i],  # Duration of the audio in seconds.
+      }
+
+    # Transcribe the clips that could not be aligned.
+    missing = [i for i, result in enumerate(resultsList) if (result is None)]
+    if (missing):
+      if (VERBOSE):
+        logger.info(f"Forced alignment is not possible for {len(missing)} clip(s); transcribing them instead.")
+      for i, result in zip(missing, self.TranscribeBatch([audioPaths[i] for i in missing], language=language)):
+        resultsList[i] = result
+
+    # Return the alignment results in the input order.
+    return resultsList
+
+
 if __name__ == "__main__":
   # Example usage of the WhisperTranscribeHelper class.
   whisperTransObj = WhisperTranscribeHelper()  # Initialize the WhisperTranscribeHelper object.
@@ -8,23 +8,52 @@
 # Permissions and Citation: Refer to the README file.
 '''
 
-import os, json, time, hashlib, asyncio, logging, shutil, glob
-from flask import Blueprint, jsonify, current_app, request, send_file
+import os, stat, json, time, hashlib, asyncio, logging, shutil, glob, secrets, functools, zipfile
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, Response, jsonify, current_app, request, send_file, stream_with_context
+from werkzeug.security import safe_join
 from WebHelpers import *
 from TextToSpeechHelper import TextToSpeechHelper
 from FFMPEGHelper import FFMPEGHelper
+from ConfigsLoader import LoadConfigs
 
 apiBp = Blueprint("api", __name__)
 
+# Allowed audio upload extensions (lower-case), built once at import.
+AUDIO_EXTENSIONS = frozenset(
+  ext.lower() for ext in LoadConfigs()["audio"].get("allowedExtensions", [".mp3", ".wav", ".ogg"])
+)
+
+# FFMPEG (codec, format) pair used to encode each audio extension.
+_CODEC_TABLE = {
+  ".mp3": ("libmp3lame", "mp3"),
+  ".wav": ("pcm_s16le", "wav"),
+  ".ogg": ("libvorbis", "ogg"),
+}
+
+# Units used when reporting file sizes (index = power of 1024).
+SIZE_UNITS = ("bytes", "KB", "MB", "GB")
+
+# Shared FFMPEG helper (stateless, so one instance serves every request).
+_FFMPEG = FFMPEGHelper()
+
+# Shared pool for reading uncached job.json files in parallel (keeps several reads in flight).
+_JOBS_IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="JobsIO")
+
 # Use module logger so messages go through Python's logging system and appear with Flask output.
 logger = logging.getLogger(__name__)
 
 
+def _FastHash(data):
+  """Return a 32-character hex digest of the given bytes (BLAKE2b-128; used for upload and output names)."""
+  return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 @apiBp.route("/api/v1/status", methods=["GET"])
 def GetServerStatus():
   # Enhanced server status with environment checks.
   storePath = current_app.config["STORE_PATH"]
-  ffPath = FFMPEGHelper().DetectFFmpegPath()
+  ffPath = _FFMPEG.DetectFFmpegPath()
   ffAvailable = (ffPath is not None)
   storeWritable = False
   try:
@@ -45,36 +74,79 @@ def GetServerStatus():
   }), 200
 
 
+# Body of the (constant) "ready" answer, encoded once; busy answers carry a live count and stay dynamic.
+READY_BODY = b'{"ready":true}\n'
+
+
 @apiBp.route("/api/v1/ready", methods=["GET"])
 def GetServerReady():
-  JOB_HISTORY_OBJ = current_app.config["JOB_HISTORY_OBJ"]
-  MAX_JOBS = current_app.config.get("MAX_JOBS", 1)
-  noOfQuestedJobs = len([status for status in JOB_HISTORY_OBJ.values() if (status == "queued")])
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  JOB_HISTORY_OBJ = appConfig["JOB_HISTORY_OBJ"]
+  MAX_JOBS = appConfig.get("MAX_JOBS", 1)
+  noOfQuestedJobs = JOB_HISTORY_OBJ.queuedCount()
   isBusy = (noOfQuestedJobs >= MAX_JOBS)
   if (not isBusy):
-    return jsonify({"ready": True}), 200
+    return Response(READY_BODY, status=200, mimetype="application/json")
   else:
     return jsonify({"ready": False, "jobsInProgress": len(JOB_HISTORY_OBJ)}), 503
 
 
+def _StatOrNone(path):
+  """Return `os.stat(path)`, or None when the path does not exist (one syscall instead of exists + getsize)."""
+  try:
+    return os.stat(path)
+  except FileNotFoundError:
+    return None
+
+
+@functools.cache
+def _TTSHelper():
+  """Return the shared TextToSpeechHelper used for the (static) language and voice listings."""
+  return TextToSpeechHelper()
+
+
+# Listings that never change while the server runs may be cached by clients and proxies for a day.
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+
+def StaticJsonResponse(key, BuildPayload):
+  """
+  Return a JSON response whose body is serialized once per app and then reused for every request.
+  The body carries a stable ETag, so repeated requests with If-None-Match get an empty 304.
+  """
+  staticJson = current_app.config.setdefault("STATIC_JSON", {})
+  cached = staticJson.get(key)
+  if (cached is None):
+    body = current_app.json.dumps(BuildPayload()).encode()
+    cached = (body, _FastHash(body))
+    staticJson[key] = cached
+  body, etag = cached
+  response = Response(body, status=200, mimetype="application/json", headers={"Cache-Control": STATIC_CACHE_CONTROL})
+  response.set_etag(etag)
+  return response.make_conditional(request)
+
+
 @apiBp.route("/api/v1/languages", methods=["GET"])
 def GetAvailableLanguages():
-  languages = TextToSpeechHelper().GetAvailableLanguages()
-  return jsonify({"languages": languages}), 200
+  return StaticJsonResponse("languages", lambda: {"languages": _TTSHelper().GetAvailableLanguages()})
 
 
 @apiBp.route("/api/v1/videoTypes", methods=["GET"])
 def GetAvailableVideoTypes():
   configs = current_app.config["configs"]
-  videoTypes = configs["video"].get("availableTypes", ["Horizontal", "Vertical"])
-  return jsonify({"videoTypes": videoTypes}), 200
+  return StaticJsonResponse(
+    "videoTypes",
+    lambda: {"videoTypes": configs["video"].get("availableTypes", ["Horizontal", "Vertical"])},
+  )
 
 
 @apiBp.route("/api/v1/videoQualities", methods=["GET"])
 def GetAvailableVideoQualities():
   configs = current_app.config["configs"]
-  videoQualities = configs["video"].get("availableQualities", [])
-  return jsonify({"videoQualities": videoQualities}), 200
+  return StaticJsonResponse(
+    "videoQualities",
+    lambda: {"videoQualities": configs["video"].get("availableQualities", [])},
+  )
 
 
 @apiBp.route("/api/v1/voices", methods=["GET"])
@@ -83,17 +155,55 @@ def GetAvailableVoices():
   if (typeKey not in ["list", "dict"]):
     return jsonify({"error": "Invalid type parameter, must be 'list' or 'dict'"}), 400
   if (typeKey == "dict"):
-    voices = TextToSpeechHelper().GetAvailableVoicesByLanguage()
-  else:
-    voices = TextToSpeechHelper().GetAvailableVoices()
-  return jsonify({"voices": voices}), 200
+    return StaticJsonResponse("voicesDict", lambda: {"voices": _TTSHelper().GetAvailableVoicesByLanguage()})
+  return StaticJsonResponse("voicesList", lambda: {"voices": _TTSHelper().GetAvailableVoices()})
+
+
+def RunAsync(coroutine):
+  """Run a coroutine on the shared background event loop and wait for its result."""
+  return asyncio.run_coroutine_threadsafe(coroutine, current_app.config["BG_LOOP"]).result()
+
+
+def _ReadJobJson(jobFilePath):
+  """Read a job.json file, returning None if it is missing or unreadable."""
+  try:
+    return ReadJsonFile(jobFilePath)
+  except (OSError, ValueError):
+    return None
+
+
+def LoadJobMeta(jobId):
+  """Return the job.json data of a job from the in-memory metadata cache (read from disk on a miss)."""
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  JOB_META_OBJ = appConfig["JOB_META_OBJ"]
+  jobData = JOB_META_OBJ.get(jobId)
+  if (jobData is None):
+    jobData = _ReadJobJson(os.path.join(appConfig["STORE_PATH"], jobId, "job.json"))
+    if (jobData is None):
+      return None  # Missing or unreadable job data.
+    JOB_META_OBJ[jobId] = jobData
+  return jobData
+
+
+def LoadJobsMeta(jobIds):
+  """Warm the metadata cache for several jobs, reading the uncached job.json files in parallel."""
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  JOB_META_OBJ = appConfig["JOB_META_OBJ"]
+  missingIds = [jobId for jobId in jobIds if (jobId not in JOB_META_OBJ)]
+  if (not missingIds):
+    return
+  storePath = appConfig["STORE_PATH"]
+  jobFilePaths = [os.path.join(storePath, jobId, "job.json") for jobId in missingIds]
+  for jobId, jobData in zip(missingIds, _JOBS_IO_POOL.map(_ReadJobJson, jobFilePaths)):
+    if (jobData is not None):
+      JOB_META_OBJ[jobId] = jobData
 
 
 @apiBp.route("/api/v1/jobs", methods=["GET"])
 def GetAllJobs():
-  JOB_HISTORY_OBJ = current_app.config["JOB_HISTORY_OBJ"]
-  STORE_PATH = current_app.config["STORE_PATH"]
-  configs = current_app.config["configs"]
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  JOB_HISTORY_OBJ = appConfig["JOB_HISTORY_OBJ"]
+  configs = appConfig["configs"]
   # Pagination params.
   try:
     page = int(request.args.get("page", 1))
@@ -107,44 +217,49 @@ def GetAllJobs():
     page = 1
   if (pageSize <= 0 or pageSize > 200):
     pageSize = 20
-  jobsList = []
-  for jobId, status in JOB_HISTORY_OBJ.items():
-    jobDir = os.path.join(STORE_PATH, jobId)
-    jobFilePath = os.path.join(jobDir, "job.json")
-    if (os.path.exists(jobFilePath)):
-      try:
-        with open(jobFilePath, "r") as f:
-          jobData = json.load(f)
-        jobsList.append({
-          "jobId"       : jobId,
-          "status"      : status,
-          "text"        : jobData.get("text", ""),
-          "language"    : jobData.get("language", configs["tts"]["language"]),
-          "voice"       : jobData.get("voice", configs["tts"]["voice"]),
-          "speechRate"  : jobData.get("speechRate", configs["tts"]["speechRate"]),
-          "videoQuality": jobData.get("videoQuality", None),
-          "videoType"   : jobData.get("videoType", None),
-          "createdAt"   : jobData.get("createdAt", "N/A"),
-          "isCompleted" : (status == "completed"),
-        })
-      except Exception:
-        pass
-  total = len(jobsList)
+  # The listed fields never change after creation, so they come from the metadata cache
+  # (the status comes from the job history); job.json is only read for uncached jobs.
+  jobItems = list(JOB_HISTORY_OBJ.items())
+  LoadJobsMeta([jobId for jobId, _ in jobItems])
+  JOB_META_OBJ = appConfig["JOB_META_OBJ"]
+  jobItems = [(jobId, status) for jobId, status in jobItems if (jobId in JOB_META_OBJ)]
+  total = len(jobItems)
   startIdx = (page - 1) * pageSize
   endIdx = startIdx + pageSize
-  pagedJobs = jobsList[startIdx:endIdx]
-  return jsonify({"total": total, "page": page, "pageSize": pageSize, "jobs": pagedJobs}), 200
+  pagedItems = jobItems[startIdx:endIdx]
+  dumps = current_app.json.dumps
+
+  def GenerateJobs():
+    # Stream the page one job at a time instead of building the whole response body first.
+    yield f'{{"total":{total},"page":{page},"pageSize":{pageSize},"jobs":['.encode()
+    for i, (jobId, status) in enumerate(pagedItems):
+      jobData = JOB_META_OBJ.get(jobId, {})
+      job = dumps({
+        "jobId"       : jobId,
+        "status"      : status,
+        "text"        : jobData.get("text", ""),
+        "language"    : jobData.get("language", configs["tts"]["language"]),
+        "voice"       : jobData.get("voice", configs["tts"]["voice"]),
+        "speechRate"  : jobData.get("speechRate", configs["tts"]["speechRate"]),
+        "videoQuality": jobData.get("videoQuality", None),
+        "videoType"   : jobData.get("videoType", None),
+        "createdAt"   : jobData.get("createdAt", "N/A"),
+        "isCompleted" : (status == "completed"),
+      })
+      yield (f",{job}" if (i > 0) else job).encode()
+    yield b"]}"
+
+  return Response(stream_with_context(GenerateJobs()), status=200, mimetype="application/json")
 
 
 @apiBp.route("/api/v1/jobs", methods=["POST"])
 def PostJob():
-  QUEUE_WATCHER = current_app.config["QUEUE_WATCHER"]
-  JOB_HISTORY_OBJ = current_app.config["JOB_HISTORY_OBJ"]
-  STORE_PATH = current_app.config["STORE_PATH"]
-  configs = current_app.config["configs"]
-  VERBOSE = current_app.config.get("VERBOSE", False)
-  MAX_JOBS = current_app.config.get("MAX_JOBS", 1)
-  MAX_TIMEOUT = current_app.config.get("MAX_TIMEOUT", 10)
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  JOB_HISTORY_OBJ = appConfig["JOB_HISTORY_OBJ"]
+  STORE_PATH = appConfig["STORE_PATH"]
+  configs = appConfig["configs"]
+  VERBOSE = appConfig.get("VERBOSE", False)
+  ttsConfigs = configs["tts"]
 
   if (not request.is_json):
     return jsonify({"error": "Request must be JSON"}), 400
@@ -152,17 +267,17 @@ def PostJob():
 
   if (not data):
     return jsonify({"error": "Invalid JSON data"}), 400
-  text = request.json.get("text", "").strip()
+  text = data.get("text", "").strip()
   if (not isinstance(text, str)):
     text = str(text)
   if (not text):
     return jsonify({"error": "Text is required"}), 400
 
-  speechRate = request.json.get("speechRate", configs["tts"]["speechRate"])
+  speechRate = data.get("speechRate", ttsConfigs["speechRate"])
   try:
     speechRate = float(speechRate)
   except ValueError:
-    speechRate = configs["tts"]["speechRate"]
+    speechRate = ttsConfigs["speechRate"]
 
   maxTextLength = configs["api"].get("maxTextLength", 2500)
   if (len(text) > maxTextLength):
@@ -171,16 +286,14 @@ def PostJob():
   if (VERBOSE):
     logger.info(f"Creating a new job with text: {text[:50]}...")
 
-  os.makedirs(STORE_PATH, exist_ok=True)
   currentTime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-  jobId = str(hashlib.md5(text.encode() + currentTime.encode()).hexdigest())
+  # 32 hex characters: a millisecond timestamp (IDs sort by creation time) followed by 80 random bits.
+  jobId = f"{time.time_ns() // 1_000_000:012x}{secrets.token_hex(10)}"
   jobDir = os.path.join(STORE_PATH, jobId)
-  os.makedirs(jobDir, exist_ok=True)
-
-  if (QUEUE_WATCHER and not QUEUE_WATCHER.is_alive()):
-    QUEUE_WATCHER = QueueWatcher(current_app.config["ProcessJob"], maxJobs=MAX_JOBS, maxTimeout=MAX_TIMEOUT)
-    QUEUE_WATCHER.jobHistoryObj = JOB_HISTORY_OBJ
-    current_app.config["QUEUE_WATCHER"] = QUEUE_WATCHER
+  try:
+    os.mkdir(jobDir)  # The store path is created at startup; one mkdir per job.
+  except FileNotFoundError:
+    os.makedirs(jobDir, exist_ok=True)  # The store path was removed while running.
   JOB_HISTORY_OBJ.updateStatus(jobId, "queued")
 
   jobData = {
@@ -188,40 +301,40 @@ def PostJob():
     "status"      : "queued",
     "text"        : text,
     "speechRate"  : speechRate,
-    "language"    : request.json.get("language", configs["tts"]["language"]),
-    "voice"       : request.json.get("voice", configs["tts"]["voice"]),
-    "videoQuality": request.json.get("videoQuality", None),
-    "videoType"   : request.json.get("videoType", None),
+    "language"    : data.get("language", ttsConfigs["language"]),
+    "voice"       : data.get("voice", ttsConfigs["voice"]),
+    "videoQuality": data.get("videoQuality", None),
+    "videoType"   : data.get("videoType", None),
     "createdAt"   : currentTime,
   }
 
-  with open(os.path.join(jobDir, "job.json"), "w") as f:
-    json.dump(jobData, f)
+  jobFilePath = os.path.join(jobDir, "job.json")
+  WriteJsonFile(jobFilePath, jobData)
+  appConfig["FILE_SYNCER"].sync(jobFilePath)  # Flushed to disk in the background (grouped with other writes).
+  appConfig["JOB_META_OBJ"][jobId] = jobData  # Cache the metadata for the jobs listing.
 
-  if (QUEUE_WATCHER and not QUEUE_WATCHER.is_alive()):
-    QUEUE_WATCHER.start()
-  else:
-    if (VERBOSE):
-      logger.info("Queue watcher is already running or not initialized.")
+  # Make sure the queue watcher is running (it exits after a period without jobs).
+  if ((EnsureQueueWatcher(current_app) in (None, "running")) and VERBOSE):
+    logger.info("Queue watcher is already running or not initialized.")
 
   return jsonify({"jobId": jobId}), 202
 
 
 @apiBp.route("/api/v1/jobs/<jobId>", methods=["GET"])
 def GetJobStatus(jobId):
-  jobHistoryObj = current_app.config["JOB_HISTORY_OBJ"]
-  storePath = current_app.config["STORE_PATH"]
-  configs = current_app.config["configs"]
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  jobHistoryObj = appConfig["JOB_HISTORY_OBJ"]
+  storePath = appConfig["STORE_PATH"]
+  configs = appConfig["configs"]
 
-  if (jobId not in jobHistoryObj.keys()):
+  if (jobId not in jobHistoryObj):
     return jsonify({"error": "Job not found"}), 404
 
   status = jobHistoryObj.get(jobId, "unknown")
   jobDir = os.path.join(storePath, jobId)
 
   try:
-    with open(os.path.join(jobDir, "job.json"), "r") as f:
-      jobData = json.load(f)
+    jobData = ReadJsonFile(os.path.join(jobDir, "job.json"))
   except FileNotFoundError:
     return jsonify({"error": "Job data not found"}), 404
 
@@ -240,37 +353,23 @@ def GetJobStatus(jobId):
 
 @apiBp.route("/api/v1/jobs/triggerRemaining", methods=["POST"])
 def TriggerRemainingJobs():
-  queueWatcher = current_app.config["QUEUE_WATCHER"]
-  jobHistoryObj = current_app.config["JOB_HISTORY_OBJ"]
-  maxJobs = current_app.config.get("MAX_JOBS", 1)
-  maxTimeout = current_app.config.get("MAX_TIMEOUT", 10)
-
-  if (queueWatcher and not queueWatcher.is_alive()):
-    queueWatcher = QueueWatcher(current_app.config["ProcessJob"], maxJobs=maxJobs, maxTimeout=maxTimeout)
-    queueWatcher.jobHistoryObj = jobHistoryObj
-    current_app.config["QUEUE_WATCHER"] = queueWatcher
-    queueWatcher.start()
+  state = EnsureQueueWatcher(current_app, createIfMissing=True)
+  if (state == "restarted"):
     return jsonify({"message": "Triggered processing for remaining queued jobs."}), 200
-  elif (queueWatcher and queueWatcher.is_alive()):
-    return jsonify({"message": "Queue watcher is already running."}), 200
-  elif (not queueWatcher):
-    queueWatcher = QueueWatcher(current_app.config["ProcessJob"], maxJobs=maxJobs, maxTimeout=maxTimeout)
-    queueWatcher.jobHistoryObj = jobHistoryObj
-    current_app.config["QUEUE_WATCHER"] = queueWatcher
-    queueWatcher.start()
+  if (state == "started"):
     return jsonify({"message": "Initialized and started queue watcher."}), 200
-  else:
-    return jsonify({"message": "Queue watcher is already running or not initialized."}), 200
+  return jsonify({"message": "Queue watcher is already running."}), 200
 
 
 @apiBp.route("/api/v1/jobs/<jobId>/result", methods=["GET"])
 def GetProcessedVideo(jobId):
-  jobHistoryObj = current_app.config["JOB_HISTORY_OBJ"]
-  storePath = current_app.config["STORE_PATH"]
-  configs = current_app.config["configs"]
-  logger = current_app.config["logger"]
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  jobHistoryObj = appConfig["JOB_HISTORY_OBJ"]
+  storePath = appConfig["STORE_PATH"]
+  configs = appConfig["configs"]
+  logger = appConfig["logger"]
 
-  if (jobId not in jobHistoryObj.keys()):
+  if (jobId not in jobHistoryObj):
     logger.warning(f"Job {jobId} not found in the jobs.")
     return jsonify({"error": "Job not found"}), 404
 
@@ -278,8 +377,7 @@ def GetProcessedVideo(jobId):
   jobDataPath = os.path.join(jobDir, "job.json")
 
   try:
-    with open(jobDataPath, "r") as f:
-      jobData = json.load(f)
+    jobData = ReadJsonFile(jobDataPath)
   except FileNotFoundError:
     logger.error(f"Job data file not found for job {jobId}: {jobDataPath}")
     return jsonify({"error": "Job data not found"}), 404
@@ -295,142 +393,169 @@ def GetProcessedVideo(jobId):
   # Primary expected location is inside the job directory
   outputVideoPath = os.path.join(jobDir, f"{jobId}_Final.{videoFormat}")
 
-  if (not os.path.exists(outputVideoPath)):
+  fileStat = _StatOrNone(outputVideoPath)  # One stat answers both "exists" and "empty".
+  if (fileStat is None):
     # Fallback: search for any matching final video file in the job directory
     matchingFiles = glob.glob(os.path.join(jobDir, f"{jobId}_Final.*"))
-    if (matchingFiles):
-      outputVideoPath = matchingFiles[0]
-    else:
+    if (not matchingFiles):
       logger.error(f"Processed video file not found for job {jobId}: {outputVideoPath}")
       return jsonify({"error": "Processed video file not found"}), 404
+    outputVideoPath = matchingFiles[0]
+    fileStat = os.stat(outputVideoPath)
 
-  if (not os.access(outputVideoPath, os.R_OK)):
-    logger.error(f"Processed video file is not readable for job {jobId}: {outputVideoPath}")
-    return jsonify({"error": "Processed video file is not accessible"}), 500
-
-  if (os.path.getsize(outputVideoPath) == 0):
+  if (fileStat.st_size == 0):
     logger.error(f"Processed video file is empty for job {jobId}: {outputVideoPath}")
     return jsonify({"error": "Processed video file is empty"}), 500
 
   logger.info(f"Returning processed video for job {jobId}: {outputVideoPath}")
-  return send_file(outputVideoPath, as_attachment=True), 200
+  # The final video never changes once the job is completed, so clients may cache it.
+  try:
+    return SendStoredFile(outputVideoPath, maxAge=3600)
+  except PermissionError:
+    logger.error(f"Processed video file is not readable for job {jobId}: {outputVideoPath}")
+    return jsonify({"error": "Processed video file is not accessible"}), 500
+
+
+def SendStoredFile(filePath, maxAge=None):
+  """
+  Send a file from the store path as an attachment, answering conditional requests (ETag /
+  Last-Modified) with 304 and byte ranges with 206.
+  With `api.sendfileOffload` set, only headers are returned and the reverse proxy sends the file itself:
+  "x-sendfile" keeps Flask's X-Sendfile header, "x-accel" maps it to an nginx X-Accel-Redirect URI.
+  """
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  response = send_file(filePath, as_attachment=True, conditional=True, etag=True, max_age=maxAge)
+  configs = appConfig["configs"]
+  if ((configs["api"].get("sendfileOffload", "none") == "x-accel") and ("X-Sendfile" in response.headers)):
+    relativePath = os.path.relpath(os.path.abspath(filePath), os.path.abspath(appConfig["STORE_PATH"]))
+    prefix = configs["api"].get("accelRedirectPrefix", "/_protected/").rstrip("/")
+    del response.headers["X-Sendfile"]
+    response.headers["X-Accel-Redirect"] = f"{prefix}/{relativePath.replace(os.sep, '/')}"
+  return response
 
 
 @apiBp.route("/api/v1/jobs/<jobId>", methods=["DELETE"])
 def DeleteProcessedVideo(jobId):
-  jobHistoryObj = current_app.config["JOB_HISTORY_OBJ"]
-  storePath = current_app.config["STORE_PATH"]
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  jobHistoryObj = appConfig["JOB_HISTORY_OBJ"]
+  storePath = appConfig["STORE_PATH"]
 
-  if (jobId not in jobHistoryObj.keys()):
+  if (jobId not in jobHistoryObj):
     return jsonify({"error": "Job not found"}), 404
   jobDir = os.path.join(storePath, jobId)
 
   if (os.path.exists(jobDir)):
-    import shutil
-    shutil.rmtree(jobDir)
+    DeleteDirsInBackground([jobDir], storePath)
 
-  if (jobId in jobHistoryObj.keys()):
+  if (jobId in jobHistoryObj):
     jobHistoryObj.delete(jobId)
+  appConfig["JOB_META_OBJ"].pop(jobId, None)
 
   return jsonify({"message": "Job data deleted successfully"}), 200
 
 
 @apiBp.route("/api/v1/jobs/all", methods=["DELETE"])
 def DeleteAllProcessedVideos():
+  appConfig = current_app.config  # Resolve the app proxy once per request.
   # Delete all processed videos and associated data for all jobs.
-  storePath = current_app.config.get("STORE_PATH")
-  jobHistoryObj = current_app.config.get("JOB_HISTORY_OBJ")
+  storePath = appConfig.get("STORE_PATH")
+  jobHistoryObj = appConfig.get("JOB_HISTORY_OBJ")
 
-  # Remove all job directories and their contents.
+  # Remove all job directories and their contents (the files are deleted in the background).
   if (storePath and os.path.exists(storePath)):
-    import shutil
-    for item in os.listdir(storePath):
-      itemPath = os.path.join(storePath, item)
-      if (os.path.isdir(itemPath)):
-        shutil.rmtree(itemPath)
+    with os.scandir(storePath) as entries:
+      jobDirs = [entry.path for entry in entries if (entry.is_dir() and (entry.name != TRASH_DIR_NAME))]
+    if (jobDirs):
+      DeleteDirsInBackground(jobDirs, storePath)
 
   # Clear the job statuses dictionary.
   if (jobHistoryObj):
     jobHistoryObj.clear()
+  appConfig["JOB_META_OBJ"].clear()
 
   # Return a success message.
   return jsonify({"message": "All job data deleted successfully"}), 200
 
 
-@apiBp.route("/api/v1/audio-duration", methods=["POST"])
-def GetAudioDuration():
-  # Get the file from the request.
-  if (not request.files or "audioFile" not in request.files):
-    return jsonify({"error": "No file provided"}), 400
-  file = request.files["audioFile"]
-  if (file.filename == ""):
-    return jsonify({"error": "No file selected"}), 400
-  allowedExtensions = current_app.config["configs"]["audio"].get("allowedExtensions", [".mp3", ".wav", ".ogg"])
-  if (not any(file.filename.endswith(ext) for ext in allowedExtensions)):
-    return jsonify({"error": f"File type not allowed, must be one of {allowedExtensions}"}), 400
+def AudioUpload(saveToDisk=False):
+  """
+  Decorator for the single-file audio endpoints.
+  Validates the `audioFile` upload once and calls the handler with the file (and, when `saveToDisk`
+  is set, the path of a temporary copy that is removed after the handler returns, plus its content digest).
+  """
+
+  def Decorator(fn):
+    @functools.wraps(fn)
+    def Wrapper():
+      # Get the file from the request.
+      file = request.files.get("audioFile")
+      if (file is None):
+        return jsonify({"error": "No file provided"}), 400
+      if (file.filename == ""):
+        return jsonify({"error": "No file selected"}), 400
+      usedExtension = os.path.splitext(file.filename)[1]
+      if (usedExtension.lower() not in AUDIO_EXTENSIONS):
+        return jsonify({"error": f"File type not allowed, must be one of {sorted(AUDIO_EXTENSIONS)}"}), 400
+      if (not saveToDisk):
+        return fn(file)
+
+      # Save the file to a temporary location.
+      tempFilePath = os.path.join(current_app.config["STORE_PATH"], f"{secrets.token_hex(16)}{usedExtension}")
+      contentHasher = hashlib.blake2b(digest_size=16)  # Hashed while saving (audio-tools cache key).
+      _FFMPEG.SaveStreamToFile(file.stream, tempFilePath, hasher=contentHasher)
+      try:
+        return fn(file, tempFilePath, contentHasher.hexdigest())
+      finally:
+        # Delete the temporary file after processing.
+        if (os.path.exists(tempFilePath)):
+          os.remove(tempFilePath)
 
-  # Save the file to a temporary location.
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}"
-  usedExtension = os.path.splitext(file.filename)[1]
-  tempFilePath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempFilePath)
+    return Wrapper
+
+  return Decorator
 
+
+@apiBp.route("/api/v1/audio-duration", methods=["POST"])
+@AudioUpload()
+def GetAudioDuration(file):
   # Calculate the audio duration using FFMPEG.
   try:
-    duration = FFMPEGHelper().GetFileDuration(tempFilePath)
-    # Round the duration to 2 decimal places.
-    if (duration is not None):
-      duration = round(duration, 2)
-    else:
-      duration = None
-    # Delete the temporary file after processing.
-    if (os.path.exists(tempFilePath)):
-      os.remove(tempFilePath)
+    # Probe the uploaded stream directly (no temporary file in the common case).
+    duration = _FFMPEG.GetFileDurationFromStream(file.stream)
+    if (duration is None):
+      # Piped streams without a known size (e.g., MP3) have no container duration; probe a saved copy.
+      usedExtension = os.path.splitext(file.filename)[1]
+      tempFilePath = os.path.join(current_app.config["STORE_PATH"], f"{secrets.token_hex(16)}{usedExtension}")
+      _FFMPEG.SaveStreamToFile(file.stream, tempFilePath)
+      try:
+        duration = _FFMPEG.GetFileDuration(tempFilePath)
+      finally:
+        # Delete the temporary file after processing.
+        if (os.path.exists(tempFilePath)):
+          os.remove(tempFilePath)
     if (duration is None):
       return jsonify({"error": "Could not determine audio duration"}), 500
-    return jsonify({"duration": duration}), 200
+    # Round the duration to 2 decimal places.
+    return jsonify({"duration": round(duration, 2)}), 200
   except Exception as e:
     current_app.logger.error(f"Error calculating audio duration: {str(e)}")
     return jsonify({"error": "Error calculating audio duration"}), 500
 
 
 @apiBp.route("/api/v1/audio-size", methods=["POST"])
-def getAudioSize():
-  # Get the file from the request.
-  if (not request.files or "audioFile" not in request.files):
-    return jsonify({"error": "No file provided"}), 400
-  file = request.files["audioFile"]
-  if (file.filename == ""):
-    return jsonify({"error": "No file selected"}), 400
-  allowedExtensions = current_app.config["configs"]["audio"].get("allowedExtensions", [".mp3", ".wav", ".ogg"])
-  if (not any(file.filename.endswith(ext) for ext in allowedExtensions)):
-    return jsonify({"error": f"File type not allowed, must be one of {allowedExtensions}"}), 400
-
-  # Save the file to a temporary location.
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}"
-  usedExtension = os.path.splitext(file.filename)[1]
-  tempFilePath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempFilePath)
-
-  # Calculate the audio size.
+@AudioUpload()
+def getAudioSize(file):
+  # Calculate the audio size directly from the uploaded stream.
   try:
-    size = FFMPEGHelper().GetFileSize(tempFilePath)
+    size = _FFMPEG.GetStreamSize(file.stream)
     # If the size is None, it means the file could not be read.
     if (size is None):
       size = 0
     else:
       # Convert size to kilobytes (KB), Megabytes (MB), or Gigabytes (GB) as needed.
-      if (size < 1024):
-        size = f"{size} bytes"
-      elif (size < 1024 * 1024):
-        size = f"{size / 1024:.2f} KB"
-      elif (size < 1024 * 1024 * 1024):
-        size = f"{size / (1024 * 1024):.2f} MB"
-      else:
-        size = f"{size / (1024 * 1024 * 1024):.2f} GB"
-    # Delete the temporary file after processing.
-    if (os.path.exists(tempFilePath)):
-      os.remove(tempFilePath)
+      # The unit index is the base-1024 exponent, taken from the bit length of the size.
+      unitIdx = min(max(0, (size.bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+      size = f"{size} bytes" if (unitIdx == 0) else f"{size / (1 << (10 * unitIdx)):.2f} {SIZE_UNITS[unitIdx]}"
     return jsonify({"size": size}), 200
   except Exception as e:
     current_app.logger.error(f"Error calculating audio size: {str(e)}")
@@ -438,47 +563,91 @@ def getAudioSize():
 
 
 @apiBp.route("/api/v1/check-silence", methods=["POST"])
-def checkAudioSilence():
-  # Get the file from the request.
-  if (not request.files or "audioFile" not in request.files):
-    return jsonify({"error": "No file provided"}), 400
-  file = request.files["audioFile"]
-  if (file.filename == ""):
-    return jsonify({"error": "No file selected"}), 400
-  allowedExtensions = current_app.config["configs"]["audio"].get("allowedExtensions", [".mp3", ".wav", ".ogg"])
-  if (not any(file.filename.endswith(ext) for ext in allowedExtensions)):
-    return jsonify({"error": f"File type not allowed, must be one of {allowedExtensions}"}), 400
-
-  # Save the file to a temporary location.
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}"
-  usedExtension = os.path.splitext(file.filename)[1]
-  tempFilePath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempFilePath)
-
+@AudioUpload()
+def checkAudioSilence(file):
   # Check for silence in the audio using FFMPEG.
   try:
-    isSilent = FFMPEGHelper().IsFileSilent(tempFilePath)
-    # Delete the temporary file after processing.
-    if (os.path.exists(tempFilePath)):
-      os.remove(tempFilePath)
+    # Decode the uploaded stream directly (no temporary file in the common case).
+    isSilent = _FFMPEG.IsStreamSilent(file.stream)
+    if (isSilent is None):
+      # E.g., no audio stream: let the file-based check (which probes the streams first) decide.
+      usedExtension = os.path.splitext(file.filename)[1]
+      tempFilePath = os.path.join(current_app.config["STORE_PATH"], f"{secrets.token_hex(16)}{usedExtension}")
+      _FFMPEG.SaveStreamToFile(file.stream, tempFilePath)
+      try:
+        isSilent = _FFMPEG.IsFileSilent(tempFilePath)
+      finally:
+        # Delete the temporary file after processing.
+        if (os.path.exists(tempFilePath)):
+          os.remove(tempFilePath)
     return jsonify({"isSilent": isSilent}), 200
   except Exception as e:
     current_app.logger.error(f"Error checking audio silence: {str(e)}")
     return jsonify({"error": "Error checking audio silence"}), 500
 
 
-@apiBp.route("/api/v1/normalize-audio", methods=["POST"])
-def normalizeAudio():
-  # Get the file from the request.
-  if (not request.files or "audioFile" not in request.files):
-    return jsonify({"error": "No file provided"}), 400
-  file = request.files["audioFile"]
-  if (file.filename == ""):
-    return jsonify({"error": "No file selected"}), 400
-  allowedExtensions = current_app.config["configs"]["audio"].get("allowedExtensions", [".mp3", ".wav", ".ogg"])
-  if (not any(file.filename.endswith(ext) for ext in allowedExtensions)):
-    return jsonify({"error": f"File type not allowed, must be one of {allowedExtensions}"}), 400
+def CachedConvert(handlerName, inputPath, params, outputPath, Produce, inputDigest=None):
+  """
+  Run an FFMPEG step through the audio-tools cache.
+  The key is a BLAKE2b digest of the handler name, the parameters, and the input content digest
+  (`inputDigest` when it was computed while saving the upload, otherwise the input is read in 1 MiB
+  chunks); a hit is hard-linked (or copied) to `outputPath` instead of running FFMPEG again.
+  `Produce` runs the step and returns whether it succeeded; successful outputs are added to the cache.
+  """
+  cacheConfigs = current_app.config["configs"]["cache"]
+  # Never let FFMPEG write into an existing file: it may be a hard link to a cache entry.
+  if (os.path.lexists(outputPath)):
+    os.remove(outputPath)
+  if (not (cacheConfigs.get("enabled", True) and cacheConfigs.get("audioTools", True))):
+    return Produce()
+
+  if ((inputDigest is None) and (inputPath is not None)):
+    contentHasher = hashlib.blake2b(digest_size=16)
+    with open(inputPath, "rb") as f:
+      while (chunk := f.read(1024 * 1024)):
+        contentHasher.update(chunk)
+    inputDigest = contentHasher.hexdigest()
+  hasher = hashlib.blake2b(digest_size=16)
+  hasher.update(f"{handlerName}\0{json.dumps(params, sort_keys=True)}\0{inputDigest}".encode())
+  cacheDir = os.path.join(cacheConfigs.get("path", "./Cache"), "Audio")
+  cacheFilePath = os.path.join(cacheDir, f"{hasher.hexdigest()}{os.path.splitext(outputPath)[1]}")
+
+  if (os.path.isfile(cacheFilePath)):
+    try:
+      try:
+        os.link(cacheFilePath, outputPath)  # Same file system: no copy at all.
+      except OSError:
+        shutil.copyfile(cacheFilePath, outputPath)
+      os.utime(cacheFilePath)  # Mark the entry as recently used for the pruning order.
+      return True
+    except OSError:
+      pass  # Unusable entry; produce the output again.
+
+  isDone = Produce()
+  outputStat = _StatOrNone(outputPath) if (isDone) else None
+  if ((outputStat is not None) and stat.S_ISREG(outputStat.st_mode) and (outputStat.st_size > 0)):
+    try:
+      os.makedirs(cacheDir, exist_ok=True)
+      tempCachePath = f"{cacheFilePath}.{secrets.token_hex(4)}.tmp"
+      try:
+        os.link(outputPath, tempCachePath)
+      except OSError:
+        shutil.copyfile(outputPath, tempCachePath)
+      os.replace(tempCachePath, cacheFilePath)  # Publish complete entries only.
+      # Prune the least recently used entries beyond the configured limit.
+      with os.scandir(cacheDir) as entries:
+        cached = sorted((entry.stat().st_mtime, entry.path) for entry in entries if (entry.is_file()))
+      for _, oldPath in cached[:max(len(cached) - cacheConfigs.get("maxEntries", 256), 0)]:
+        os.remove(oldPath)
+    except OSError as e:
+      if (current_app.config.get("VERBOSE", False)):
+        logger.info(f"Failed to cache the output of {handlerName}: {e}")
+  return isDone
 
+
+@apiBp.route("/api/v1/normalize-audio", methods=["POST"])
+@AudioUpload(saveToDisk=True)
+def normalizeAudio(file, tempFilePath, inputDigest):
   normalizeBitrate = request.form.get("normalizeBitrate", "256k")
   try:
     normalizeBitrate = str(normalizeBitrate)
@@ -499,62 +668,46 @@ def normalizeAudio():
   if (normalizeFilter not in ["loudnorm", "dynaudnorm", "acompressor", "volumedetect"]):
     normalizeFilter = "loudnorm"
 
-  # Save the file to a temporary location.
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}"
+  # Name the normalized output after the uploaded file.
+  uniqueFilename = f"{_FastHash(file.filename.encode())}"
   usedExtension = os.path.splitext(file.filename)[1]
-  tempFilePath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempFilePath)
-
-  if (usedExtension == ".mp3"):
-    audioCodec = "libmp3lame"
-    audioFormat = "mp3"
-  elif (usedExtension == ".wav"):
-    audioCodec = "pcm_s16le"
-    audioFormat = "wav"
-  elif (usedExtension == ".ogg"):
-    audioCodec = "libvorbis"
-    audioFormat = "ogg"
-  else:
-    audioCodec = "libmp3lame"
-    audioFormat = "mp3"
+
+  audioCodec, audioFormat = _CODEC_TABLE.get(usedExtension, _CODEC_TABLE[".mp3"])
 
   # Normalize the audio using FFMPEG.
   try:
     outputPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_normalized{usedExtension}")
-    if (os.path.exists(outputPath)):
-      os.remove(outputPath)
     logger.info(audioCodec, audioFormat, normalizeBitrate, normalizeSampleRate, normalizeFilter)
-    # Normalize the audio file using FFMPEG.
-    isDone = asyncio.run(
-      FFMPEGHelper().NormalizeAudio(
-        tempFilePath,
-        outputPath,
-        audioCodec=audioCodec,
-        audioFormat=audioFormat,
-        audioBitrate=normalizeBitrate,
-        sampleRate=normalizeSampleRate,
-        normalizationFilter=normalizeFilter,
-      )
+    # Normalize the audio file using FFMPEG (identical requests are served from the cache).
+    params = {
+      "audioCodec"         : audioCodec,
+      "audioFormat"        : audioFormat,
+      "audioBitrate"       : normalizeBitrate,
+      "sampleRate"         : normalizeSampleRate,
+      "normalizationFilter": normalizeFilter,
+    }
+    isDone = CachedConvert(
+      "normalizeAudio", tempFilePath, params, outputPath,
+      lambda: RunAsync(_FFMPEG.NormalizeAudio(tempFilePath, outputPath, **params)),
+      inputDigest=inputDigest,
     )
     if (not isDone):
       current_app.logger.error("Failed to normalize audio.")
       return jsonify({"error": "Failed to normalize audio"}), 500
-    # Check if the normalized audio file was created successfully.
-    if (not os.path.exists(outputPath)):
+    # Check if the normalized audio file was created successfully (one stat for all the checks).
+    normalizedAudioPath = os.path.normpath(outputPath)
+    fileStat = _StatOrNone(normalizedAudioPath)
+    if (fileStat is None):
       current_app.logger.error(f"Normalized audio file not found: {outputPath}")
       return jsonify({"error": "Normalized audio file not found"}), 404
-    # Normalize the audio file path to ensure it is accessible.
-    normalizedAudioPath = os.path.normpath(outputPath)
-    if (not os.access(normalizedAudioPath, os.R_OK)):
+    # The server owns the file it just wrote, so the owner read bit decides accessibility.
+    if (not (fileStat.st_mode & stat.S_IRUSR)):
       current_app.logger.error(f"Normalized audio file is not readable: {normalizedAudioPath}")
       return jsonify({"error": "Normalized audio file is not accessible"}), 500
     # If the file size is zero, return an error.
-    if (os.path.getsize(normalizedAudioPath) == 0):
+    if (fileStat.st_size == 0):
       current_app.logger.error(f"Normalized audio file is empty: {normalizedAudioPath}")
       return jsonify({"error": "Normalized audio file is empty"}), 500
-    # Delete the temporary file after processing.
-    if (os.path.exists(tempFilePath)):
-      os.remove(tempFilePath)
     current_app.logger.info(f"Normalized audio file created successfully: {normalizedAudioPath}")
     # Return the normalized audio file as a link.
     return {
@@ -579,40 +732,32 @@ def generateSilentAudio():
   except ValueError:
     return jsonify({"error": "Duration must be a positive number"}), 400
 
-  configs = current_app.config["configs"]
   STORE_PATH = current_app.config["STORE_PATH"]
-  allowedExtensions = configs["audio"].get("allowedExtensions", [".mp3", ".wav", ".ogg"])
   outputFormat = data.get("silentFormat", ".wav").lower()
-  if (outputFormat not in allowedExtensions):
+  if (outputFormat not in AUDIO_EXTENSIONS):
     outputFormat = ".wav"
 
-  uniqueFilename = f"silent_{int(duration)}s_{hashlib.md5(str(time.time()).encode()).hexdigest()}"
+  uniqueFilename = f"silent_{int(duration)}s_{_FastHash(str(time.time()).encode())}"
   outputPath = os.path.join(STORE_PATH, f"{uniqueFilename}{outputFormat}")
 
   try:
-    if (outputFormat == ".mp3"):
-      audioCodec = "libmp3lame"
-      audioFormat = "mp3"
-    elif (outputFormat == ".wav"):
-      audioCodec = "pcm_s16le"
-      audioFormat = "wav"
-    elif (outputFormat == ".ogg"):
-      audioCodec = "libvorbis"
-      audioFormat = "ogg"
-    else:
-      audioCodec = "libmp3lame"
-      audioFormat = "mp3"
+    audioCodec, audioFormat = _CODEC_TABLE.get(outputFormat, _CODEC_TABLE[".mp3"])
 
-    isDone = asyncio.run(
-      FFMPEGHelper().GenerateSilentAudio(outputPath, duration, audioCodec=audioCodec, audioFormat=audioFormat)
+    isDone = CachedConvert(
+      "generateSilentAudio", None, {"duration": duration, "audioCodec": audioCodec, "audioFormat": audioFormat},
+      outputPath,
+      lambda: RunAsync(
+        _FFMPEG.GenerateSilentAudio(outputPath, duration, audioCodec=audioCodec, audioFormat=audioFormat)
+      ),
     )
     if (not isDone):
       return jsonify({"error": "Failed to generate silent audio"}), 500
-    if (not os.path.exists(outputPath)):
+    fileStat = _StatOrNone(outputPath)
+    if (fileStat is None):
       return jsonify({"error": "Silent audio file not found"}), 404
-    if (not os.access(outputPath, os.R_OK)):
+    if (not (fileStat.st_mode & stat.S_IRUSR)):
       return jsonify({"error": "Silent audio file is not accessible"}), 500
-    if (os.path.getsize(outputPath) == 0):
+    if (fileStat.st_size == 0):
       return jsonify({"error": "Silent audio file is empty"}), 500
     return {
       "link"    : f"/api/v1/download/{uniqueFilename}{outputFormat}",
@@ -631,32 +776,32 @@ def convertAudio():
   file = request.files["audioFile"]
   if (file.filename == ""):
     return jsonify({"error": "No file selected"}), 400
-  configs = current_app.config["configs"]
-  allowedExtensions = configs["audio"].get("allowedExtensions", [".mp3", ".wav", ".ogg"])
+  ffmpegConfigs = current_app.config["configs"]["ffmpeg"]
   usedExtension = os.path.splitext(file.filename)[1].lower()
-  if (usedExtension not in allowedExtensions):
-    return jsonify({"error": f"File type not allowed, must be one of {allowedExtensions}"}), 400
+  if (usedExtension not in AUDIO_EXTENSIONS):
+    return jsonify({"error": f"File type not allowed, must be one of {sorted(AUDIO_EXTENSIONS)}"}), 400
 
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  contentHasher = hashlib.blake2b(digest_size=16)  # Hashed while saving (audio-tools cache key).
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath, hasher=contentHasher)
 
   # Parameters
   outFormat = request.form.get("outputFormat", usedExtension.replace('.', ''))
   if (not outFormat.startswith(".")):
     outFormat = "." + outFormat
-  if (outFormat not in allowedExtensions):
+  if (outFormat.lower() not in AUDIO_EXTENSIONS):
     outFormat = usedExtension
 
   bitrate = request.form.get("bitrate", None)
   try:
-    sampleRate = int(request.form.get("sampleRate", configs["ffmpeg"].get("sampleRate", 44100)))
+    sampleRate = int(request.form.get("sampleRate", ffmpegConfigs.get("sampleRate", 44100)))
   except Exception:
-    sampleRate = configs["ffmpeg"].get("sampleRate", 44100)
+    sampleRate = ffmpegConfigs.get("sampleRate", 44100)
   try:
-    channels = int(request.form.get("channels", configs["ffmpeg"].get("channels", 2)))
+    channels = int(request.form.get("channels", ffmpegConfigs.get("channels", 2)))
   except Exception:
-    channels = configs["ffmpeg"].get("channels", 2)
+    channels = ffmpegConfigs.get("channels", 2)
 
   startTime = request.form.get("startTime", None)
   endTime = request.form.get("endTime", None)
@@ -669,7 +814,7 @@ def convertAudio():
         s = float(startTime)
         e = float(endTime)
         trimmedPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_trimmed{usedExtension}")
-        isDone = asyncio.run(FFMPEGHelper().TrimAudio(workingPath, trimmedPath, s, e))
+        isDone = RunAsync(_FFMPEG.TrimAudio(workingPath, trimmedPath, s, e))
         if (not isDone):
           raise Exception("Failed to trim file")
         # remove original temp and use trimmed
@@ -686,35 +831,28 @@ def convertAudio():
     outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_converted{outFormat}")
     # Use NormalizeAudio function as a general re-encoder (it applies codec/bitrate/sample rate)
     # Choose codec based on extension
-    if (outFormat == ".mp3"):
-      audioCodec = "libmp3lame"
-      audioFormat = "mp3"
-    elif (outFormat == ".wav"):
-      audioCodec = "pcm_s16le"
-      audioFormat = "wav"
-    elif (outFormat == ".ogg"):
-      audioCodec = "libvorbis"
-      audioFormat = "ogg"
-    else:
-      audioCodec = configs["ffmpeg"].get("audioCodec", "libmp3lame")
-      audioFormat = outFormat.replace('.', '')
+    audioCodec, audioFormat = _CODEC_TABLE.get(
+      outFormat, (ffmpegConfigs.get("audioCodec", "libmp3lame"), outFormat.replace('.', ''))
+    )
 
     # Set bitrate if provided
     if (bitrate and not bitrate.endswith('k')):
       bitrate = str(bitrate) + 'k'
 
-    isDone = asyncio.run(
-      FFMPEGHelper().NormalizeAudio(
-        workingPath,
-        outPath,
-        audioCodec=audioCodec,
-        audioFormat=audioFormat,
-        audioBitrate=bitrate or configs["ffmpeg"].get("audioBitrate", "256k"),
-        sampleRate=sampleRate,
-        channels=channels,
-        normalizationFilter=request.form.get("normalizeFilter",
-                                             configs["ffmpeg"].get("normalizationFilter", "loudnorm"))
-      )
+    params = {
+      "audioCodec"         : audioCodec,
+      "audioFormat"        : audioFormat,
+      "audioBitrate"       : bitrate or ffmpegConfigs.get("audioBitrate", "256k"),
+      "sampleRate"         : sampleRate,
+      "channels"           : channels,
+      "normalizationFilter": request.form.get("normalizeFilter",
+                                              ffmpegConfigs.get("normalizationFilter", "loudnorm")),
+    }
+    isDone = CachedConvert(
+      "convertAudio", workingPath, params, outPath,
+      lambda: RunAsync(_FFMPEG.NormalizeAudio(workingPath, outPath, **params)),
+      # The saved digest only describes the input when it was not trimmed.
+      inputDigest=contentHasher.hexdigest() if (workingPath == tempPath) else None,
     )
 
     if (os.path.exists(workingPath)):
@@ -750,18 +888,22 @@ def changeVolume():
   except Exception:
     volume = 1.0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  contentHasher = hashlib.blake2b(digest_size=16)  # Hashed while saving (audio-tools cache key).
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath, hasher=contentHasher)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_vol{usedExtension}")
   try:
-    ff = FFMPEGHelper()
     cmd = [
       "ffmpeg", "-i", tempPath,
       "-af", f"volume={volume}",
       "-y", outPath
     ]
-    success, proc = asyncio.run(ff._ExecuteFFmpegCommand(cmd, "ChangeVolume"))
+    success = CachedConvert(
+      "changeVolume", tempPath, {"volume": volume}, outPath,
+      lambda: RunAsync(_FFMPEG._ExecuteFFmpegCommand(cmd, "ChangeVolume"))[0],
+      inputDigest=contentHasher.hexdigest(),
+    )
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not success or not os.path.exists(outPath)):
@@ -789,9 +931,10 @@ def changeSpeed():
   except Exception:
     speed = 1.0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  contentHasher = hashlib.blake2b(digest_size=16)  # Hashed while saving (audio-tools cache key).
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath, hasher=contentHasher)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_spd{usedExtension}")
   try:
     # atempo supports 0.5-2.0 per instance; chain if needed
@@ -807,9 +950,12 @@ def changeSpeed():
       tempo /= 0.5
     atempoFilters.append(f"atempo={tempo}")
     af = ",".join(atempoFilters)
-    ff = FFMPEGHelper()
     cmd = ["ffmpeg", "-i", tempPath, "-af", af, "-y", outPath]
-    success, proc = asyncio.run(ff._ExecuteFFmpegCommand(cmd, "ChangeSpeed"))
+    success = CachedConvert(
+      "changeSpeed", tempPath, {"filter": af}, outPath,
+      lambda: RunAsync(_FFMPEG._ExecuteFFmpegCommand(cmd, "ChangeSpeed"))[0],
+      inputDigest=contentHasher.hexdigest(),
+    )
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not success or not os.path.exists(outPath)):
@@ -833,14 +979,13 @@ def reverseAudio():
   if (file.filename == ""):
     return jsonify({"error": "No file selected"}), 400
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_rev{usedExtension}")
   try:
-    ff = FFMPEGHelper()
     cmd = ["ffmpeg", "-i", tempPath, "-af", "areverse", "-y", outPath]
-    success, proc = asyncio.run(ff._ExecuteFFmpegCommand(cmd, "ReverseAudio"))
+    success, proc = RunAsync(_FFMPEG._ExecuteFFmpegCommand(cmd, "ReverseAudio"))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not success or not os.path.exists(outPath)):
@@ -864,15 +1009,14 @@ def extractAudio():
   if (file.filename == ""):
     return jsonify({"error": "No file selected"}), 400
   usedExtension = ".mp3"
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{os.path.splitext(file.filename)[1]}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_extracted{usedExtension}")
   try:
-    ff = FFMPEGHelper()
     # Check whether the uploaded video actually contains an audio stream.
     try:
-      hasAudio = ff.HasAudioStream(tempPath)
+      hasAudio = _FFMPEG.HasAudioStream(tempPath)
     except Exception as e:
       hasAudio = False
     if (not hasAudio):
@@ -886,7 +1030,7 @@ def extractAudio():
 
     # Extract audio and convert to mp3
     cmd = ["ffmpeg", "-i", tempPath, "-vn", "-acodec", "libmp3lame", "-y", outPath]
-    success, proc = asyncio.run(ff._ExecuteFFmpegCommand(cmd, "ExtractAudio"))
+    success, proc = RunAsync(_FFMPEG._ExecuteFFmpegCommand(cmd, "ExtractAudio"))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not success or not os.path.exists(outPath)):
@@ -913,12 +1057,12 @@ def concatAudio():
   try:
     for f in files:
       ext = os.path.splitext(f.filename)[1]
-      unique = f"{hashlib.md5(f.filename.encode()).hexdigest()}_{int(time.time())}"
+      unique = f"{_FastHash(f.filename.encode())}_{int(time.time())}"
       p = os.path.join(current_app.config["STORE_PATH"], f"{unique}{ext}")
-      f.save(p)
+      _FFMPEG.SaveStreamToFile(f.stream, p)
       storedPaths.append(p)
     outPath = os.path.join(current_app.config["STORE_PATH"], f"concat_{int(time.time())}.mp3")
-    isDone = asyncio.run(FFMPEGHelper().ConcatAudioFiles(storedPaths, outPath))
+    isDone = RunAsync(_FFMPEG.ConcatAudioFiles(storedPaths, outPath))
     # cleanup inputs
     for p in storedPaths:
       try:
@@ -950,11 +1094,11 @@ def splitAudio():
   except Exception:
     segmentDuration = 10.0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   try:
-    totalDur = FFMPEGHelper().GetFileDuration(tempPath)
+    totalDur = _FFMPEG.GetFileDuration(tempPath)
     if (totalDur is None):
       raise Exception("Could not determine duration")
     parts = []
@@ -963,14 +1107,13 @@ def splitAudio():
     while start < totalDur:
       end = min(start + segmentDuration, totalDur)
       outPart = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_part{idx}{usedExtension}")
-      isDone = asyncio.run(FFMPEGHelper().TrimAudio(tempPath, outPart, start, end))
+      isDone = RunAsync(_FFMPEG.TrimAudio(tempPath, outPart, start, end))
       if (not isDone or not os.path.exists(outPart)):
         raise Exception("Failed to create segment")
       parts.append(outPart)
       start = end
       idx += 1
     # Create a zip archive of parts
-    import zipfile
     zipName = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_parts.zip")
     with zipfile.ZipFile(zipName, 'w') as zf:
       for p in parts:
@@ -1010,9 +1153,9 @@ def fadeAudio():
   except Exception:
     fadeOut = 0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_fade{usedExtension}")
   try:
     afParts = []
@@ -1020,16 +1163,15 @@ def fadeAudio():
       afParts.append(f"afade=t=in:st=0:d={fadeIn}")
     if (fadeOut > 0):
       # Need file duration to place fade out start
-      duration = FFMPEGHelper().GetFileDuration(tempPath) or 0
+      duration = _FFMPEG.GetFileDuration(tempPath) or 0
       startOut = max(0, duration - fadeOut)
       afParts.append(f"afade=t=out:st={startOut}:d={fadeOut}")
     af = ",".join(afParts) if afParts else ""
-    ff = FFMPEGHelper()
     cmd = ["ffmpeg", "-i", tempPath]
     if af:
       cmd += ["-af", af]
     cmd += ["-y", outPath]
-    success, proc = asyncio.run(ff._ExecuteFFmpegCommand(cmd, "FadeAudio"))
+    success, proc = RunAsync(_FFMPEG._ExecuteFFmpegCommand(cmd, "FadeAudio"))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not success or not os.path.exists(outPath)):
@@ -1053,15 +1195,14 @@ def removeVocals():
   if (file.filename == ""):
     return jsonify({"error": "No file selected"}), 400
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_novocals{usedExtension}")
   try:
     # Basic center-channel vocal removal for stereo files
-    ff = FFMPEGHelper()
     cmd = ["ffmpeg", "-i", tempPath, "-af", "pan=stereo|c0=c0-c1|c1=c1-c0", "-y", outPath]
-    success, proc = asyncio.run(ff._ExecuteFFmpegCommand(cmd, "RemoveVocals"))
+    success, proc = RunAsync(_FFMPEG._ExecuteFFmpegCommand(cmd, "RemoveVocals"))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not success or not os.path.exists(outPath)):
@@ -1097,16 +1238,15 @@ def equalizeAudio():
   except Exception:
     gain = 5.0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_eq{usedExtension}")
   try:
     # Use equalizer filter: equalizer=f=<freq>:width_type=h:width=<width>:g=<gain>
     filterStr = f"equalizer=f={freq}:width_type=h:width={width}:g={gain}"
-    ff = FFMPEGHelper()
     cmd = ["ffmpeg", "-i", tempPath, "-af", filterStr, "-y", outPath]
-    success, proc = asyncio.run(ff._ExecuteFFmpegCommand(cmd, "EqualizeAudio"))
+    success, proc = RunAsync(_FFMPEG._ExecuteFFmpegCommand(cmd, "EqualizeAudio"))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not success or not os.path.exists(outPath)):
@@ -1133,9 +1273,9 @@ def mixAudio():
   try:
     for f in files:
       ext = os.path.splitext(f.filename)[1]
-      unique = f"{hashlib.md5(f.filename.encode()).hexdigest()}_{int(time.time())}"
+      unique = f"{_FastHash(f.filename.encode())}_{int(time.time())}"
       p = os.path.join(current_app.config["STORE_PATH"], f"{unique}{ext}")
-      f.save(p)
+      _FFMPEG.SaveStreamToFile(f.stream, p)
       storedPaths.append(p)
     # Get volume levels from form data (comma-separated).
     volumesStr = request.form.get("volumes", "")
@@ -1147,7 +1287,7 @@ def mixAudio():
         volumes = None
     duration = request.form.get("duration", "longest")
     outPath = os.path.join(current_app.config["STORE_PATH"], f"mixed_{int(time.time())}.mp3")
-    isDone = asyncio.run(FFMPEGHelper().MixAudioFiles(storedPaths, outPath, volumes=volumes, duration=duration))
+    isDone = RunAsync(_FFMPEG.MixAudioFiles(storedPaths, outPath, volumes=volumes, duration=duration))
     for p in storedPaths:
       try:
         os.remove(p)
@@ -1178,12 +1318,12 @@ def reduceNoise():
   except Exception:
     noiseReduction = 20
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_noisereduced{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().ReduceNoise(tempPath, outPath, noiseReduction=noiseReduction))
+    isDone = RunAsync(_FFMPEG.ReduceNoise(tempPath, outPath, noiseReduction=noiseReduction))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1213,12 +1353,12 @@ def removeSilence():
     threshold = -50
     duration = 0.5
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_nosilence{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().RemoveSilence(tempPath, outPath, threshold=threshold, duration=duration))
+    isDone = RunAsync(_FFMPEG.RemoveSilence(tempPath, outPath, threshold=threshold, duration=duration))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1248,12 +1388,12 @@ def enhanceAudio():
     bassGain = 0
     trebleGain = 0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_enhanced{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().EnhanceAudio(tempPath, outPath, bassGain=bassGain, trebleGain=trebleGain))
+    isDone = RunAsync(_FFMPEG.EnhanceAudio(tempPath, outPath, bassGain=bassGain, trebleGain=trebleGain))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1289,13 +1429,13 @@ def compressAudio():
     release = 1000
     makeupGain = 0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_compressed{usedExtension}")
   try:
-    isDone = asyncio.run(
-      FFMPEGHelper().CompressAudio(tempPath, outPath, threshold=threshold, ratio=ratio, attack=attack,
+    isDone = RunAsync(
+      _FFMPEG.CompressAudio(tempPath, outPath, threshold=threshold, ratio=ratio, attack=attack,
                                    release=release, makeupGain=makeupGain))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
@@ -1324,13 +1464,13 @@ def convertChannels():
   except Exception:
     targetChannels = 1
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   channelName = "mono" if targetChannels == 1 else "stereo"
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_{channelName}{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().ConvertChannels(tempPath, outPath, targetChannels=targetChannels))
+    isDone = RunAsync(_FFMPEG.ConvertChannels(tempPath, outPath, targetChannels=targetChannels))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1362,12 +1502,12 @@ def loopAudio():
     loopCount = 2
     totalDuration = None
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_looped{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().LoopAudio(tempPath, outPath, loopCount=loopCount, totalDuration=totalDuration))
+    isDone = RunAsync(_FFMPEG.LoopAudio(tempPath, outPath, loopCount=loopCount, totalDuration=totalDuration))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1395,12 +1535,12 @@ def shiftPitch():
   except Exception:
     semitones = 0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_pitched{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().ShiftPitch(tempPath, outPath, semitones=semitones))
+    isDone = RunAsync(_FFMPEG.ShiftPitch(tempPath, outPath, semitones=semitones))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1430,12 +1570,12 @@ def addEcho():
     delay = 1000
     decay = 0.5
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_echo{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().AddEcho(tempPath, outPath, delay=delay, decay=decay))
+    isDone = RunAsync(_FFMPEG.AddEcho(tempPath, outPath, delay=delay, decay=decay))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1463,12 +1603,12 @@ def adjustStereo():
   except Exception:
     width = 1.0
   usedExtension = os.path.splitext(file.filename)[1]
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{usedExtension}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_stereo{usedExtension}")
   try:
-    isDone = asyncio.run(FFMPEGHelper().AdjustStereoWidth(tempPath, outPath, width=width))
+    isDone = RunAsync(_FFMPEG.AdjustStereoWidth(tempPath, outPath, width=width))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1499,12 +1639,12 @@ def generateWaveform():
     width = 1280
     height = 240
     colors = "blue"
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{os.path.splitext(file.filename)[1]}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_waveform.png")
   try:
-    isDone = asyncio.run(FFMPEGHelper().GenerateWaveform(tempPath, outPath, width=width, height=height, colors=colors))
+    isDone = RunAsync(_FFMPEG.GenerateWaveform(tempPath, outPath, width=width, height=height, colors=colors))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1535,13 +1675,13 @@ def generateSpectrum():
     width = 1280
     height = 720
     colorScheme = "rainbow"
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{os.path.splitext(file.filename)[1]}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}_spectrum.mp4")
   try:
-    isDone = asyncio.run(
-      FFMPEGHelper().GenerateSpectrum(tempPath, outPath, width=width, height=height, colorScheme=colorScheme))
+    isDone = RunAsync(
+      _FFMPEG.GenerateSpectrum(tempPath, outPath, width=width, height=height, colorScheme=colorScheme))
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (not isDone or not os.path.exists(outPath)):
@@ -1569,15 +1709,15 @@ def crossfadeAudio():
     duration = int(request.form.get("duration", 3))
   except Exception:
     duration = 3
-  unique1 = f"{hashlib.md5(file1.filename.encode()).hexdigest()}_{int(time.time())}"
-  unique2 = f"{hashlib.md5(file2.filename.encode()).hexdigest()}_{int(time.time()) + 1}"
+  unique1 = f"{_FastHash(file1.filename.encode())}_{int(time.time())}"
+  unique2 = f"{_FastHash(file2.filename.encode())}_{int(time.time()) + 1}"
   path1 = os.path.join(current_app.config["STORE_PATH"], f"{unique1}{os.path.splitext(file1.filename)[1]}")
   path2 = os.path.join(current_app.config["STORE_PATH"], f"{unique2}{os.path.splitext(file2.filename)[1]}")
-  file1.save(path1)
-  file2.save(path2)
+  _FFMPEG.SaveStreamToFile(file1.stream, path1)
+  _FFMPEG.SaveStreamToFile(file2.stream, path2)
   outPath = os.path.join(current_app.config["STORE_PATH"], f"crossfade_{int(time.time())}.mp3")
   try:
-    isDone = asyncio.run(FFMPEGHelper().CrossfadeAudio(path1, path2, outPath, duration=duration))
+    isDone = RunAsync(_FFMPEG.CrossfadeAudio(path1, path2, outPath, duration=duration))
     if (os.path.exists(path1)):
       os.remove(path1)
     if (os.path.exists(path2)):
@@ -1603,11 +1743,11 @@ def analyzeAudio():
   file = request.files["audioFile"]
   if (file.filename == ""):
     return jsonify({"error": "No file selected"}), 400
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{os.path.splitext(file.filename)[1]}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   try:
-    analysis = FFMPEGHelper().AnalyzeAudio(tempPath)
+    analysis = _FFMPEG.AnalyzeAudio(tempPath)
     if (os.path.exists(tempPath)):
       os.remove(tempPath)
     if (analysis is None):
@@ -1632,9 +1772,9 @@ def transcribeAudio():
     return jsonify({"error": "No file selected"}), 400
   language = request.form.get("language", "en")
   outputFormat = request.form.get("outputFormat", "txt")
-  uniqueFilename = f"{hashlib.md5(file.filename.encode()).hexdigest()}_{int(time.time())}"
+  uniqueFilename = f"{_FastHash(file.filename.encode())}_{int(time.time())}"
   tempPath = os.path.join(current_app.config["STORE_PATH"], f"{uniqueFilename}{os.path.splitext(file.filename)[1]}")
-  file.save(tempPath)
+  _FFMPEG.SaveStreamToFile(file.stream, tempPath)
   try:
     from WhisperTranscribeHelper import WhisperTranscribeHelper
     transcriber = WhisperTranscribeHelper()
@@ -1683,11 +1823,9 @@ def formatSRTTime(seconds):
 @apiBp.route("/api/v1/download/<filename>", methods=["GET"])
 def downloadFile(filename):
   STORE_PATH = current_app.config["STORE_PATH"]
-  # Sanitize filename to prevent path traversal
-  safeFilename = os.path.basename(filename)
-  filePath = os.path.join(STORE_PATH, safeFilename)
-
-  if (not os.path.exists(filePath)):
+  # Reject path traversal (e.g., "..", absolute paths) and anything that is not a file inside the store path.
+  filePath = safe_join(STORE_PATH, filename)
+  if ((filePath is None) or (not os.path.isfile(filePath))):
     return jsonify({"error": "File not found"}), 404
 
   if (not os.access(filePath, os.R_OK)):
@@ -1699,7 +1837,7 @@ def downloadFile(filename):
   #     return jsonify({"error": "File type not allowed"}), 403
 
   try:
-    return send_file(filePath, as_attachment=True), 200
+    return SendStoredFile(filePath)
   except Exception as e:
     current_app.logger.error(f"Error sending file: {str(e)}")
     return jsonify({"error": "Error sending file"}), 500
@@ -1707,9 +1845,10 @@ def downloadFile(filename):
 
 @apiBp.route("/api/v1/jobs/<jobId>/cancel", methods=["DELETE"])
 def CancelJob(jobId):
-  JOB_HISTORY_OBJ = current_app.config["JOB_HISTORY_OBJ"]
-  STORE_PATH = current_app.config["STORE_PATH"]
-  if (jobId not in JOB_HISTORY_OBJ.keys()):
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  JOB_HISTORY_OBJ = appConfig["JOB_HISTORY_OBJ"]
+  STORE_PATH = appConfig["STORE_PATH"]
+  if (jobId not in JOB_HISTORY_OBJ):
     return jsonify({"error": "Job not found"}), 404
   status = JOB_HISTORY_OBJ.get(jobId, "unknown")
   jobDir = os.path.join(STORE_PATH, jobId)
@@ -1717,14 +1856,12 @@ def CancelJob(jobId):
   if (not os.path.exists(jobFilePath)):
     return jsonify({"error": "Job data not found"}), 404
   try:
-    with open(jobFilePath, "r") as f:
-      jobData = json.load(f)
+    jobData = ReadJsonFile(jobFilePath)
   except Exception:
     return jsonify({"error": "Invalid job data"}), 500
   # Mark cancelRequested flag.
   jobData["cancelRequested"] = True
-  with open(jobFilePath, "w") as f:
-    json.dump(jobData, f)
+  WriteJsonFile(jobFilePath, jobData)
   # If job is queued, cancel immediately.
   if (status == "queued"):
     JOB_HISTORY_OBJ.updateStatus(jobId, "canceled")
@@ -1735,13 +1872,11 @@ def CancelJob(jobId):
 
 @apiBp.route("/api/v1/jobs/<jobId>/retry", methods=["POST"])
 def RetryJob(jobId):
-  QUEUE_WATCHER = current_app.config["QUEUE_WATCHER"]
-  JOB_HISTORY_OBJ = current_app.config["JOB_HISTORY_OBJ"]
-  STORE_PATH = current_app.config["STORE_PATH"]
-  configs = current_app.config["configs"]
-  MAX_JOBS = current_app.config.get("MAX_JOBS", 1)
-  MAX_TIMEOUT = current_app.config.get("MAX_TIMEOUT", 10)
-  if (jobId not in JOB_HISTORY_OBJ.keys()):
+  appConfig = current_app.config  # Resolve the app proxy once per request.
+  JOB_HISTORY_OBJ = appConfig["JOB_HISTORY_OBJ"]
+  STORE_PATH = appConfig["STORE_PATH"]
+  configs = appConfig["configs"]
+  if (jobId not in JOB_HISTORY_OBJ):
     return jsonify({"error": "Job not found"}), 404
   status = JOB_HISTORY_OBJ.get(jobId, "unknown")
   if (status == "completed"):
@@ -1751,23 +1886,17 @@ def RetryJob(jobId):
   if (not os.path.exists(jobFilePath)):
     return jsonify({"error": "Job data not found"}), 404
   try:
-    with open(jobFilePath, "r") as f:
-      jobData = json.load(f)
+    jobData = ReadJsonFile(jobFilePath)
   except Exception:
     return jsonify({"error": "Invalid job data"}), 500
   retries = int(jobData.get("retries", 0)) + 1
   jobData["retries"] = retries
   jobData["status"] = "queued"
   jobData.pop("cancelRequested", None)
-  with open(jobFilePath, "w") as f:
-    json.dump(jobData, f)
+  WriteJsonFile(jobFilePath, jobData)
   JOB_HISTORY_OBJ.updateStatus(jobId, "queued")
   # Ensure watcher is running
-  if (QUEUE_WATCHER and not QUEUE_WATCHER.is_alive()):
-    QUEUE_WATCHER = QueueWatcher(current_app.config["ProcessJob"], maxJobs=MAX_JOBS, maxTimeout=MAX_TIMEOUT)
-    QUEUE_WATCHER.jobHistoryObj = JOB_HISTORY_OBJ
-    current_app.config["QUEUE_WATCHER"] = QUEUE_WATCHER
-    QUEUE_WATCHER.start()
+  EnsureQueueWatcher(current_app)
   return jsonify({"message": "Job re-queued", "retries": retries}), 200
 
 
@@ -1779,7 +1908,7 @@ def DownloadJobMetadata(jobId):
   if (not os.path.exists(jobFilePath)):
     return jsonify({"error": "Job data not found"}), 404
   try:
-    return send_file(jobFilePath, as_attachment=True), 200
+    return SendStoredFile(jobFilePath)
   except Exception as e:
     current_app.logger.error(f"Error sending job metadata: {str(e)}")
     return jsonify({"error": "Error sending job metadata"}), 500
@@ -523,3 +523,50 @@ def Test_DownloadNotFound(client):
   rv = client.get("/api/v1/download/this_file_should_not_exist.xyz")
   # Expect 404.
   assert (rv.status_code == 404)
+
+
+# Test that downloads cannot leave the store path.
+def Test_DownloadPathTraversal(client):
+  # Request files outside the store path through encoded separators.
+  for url in ("/api/v1/download/..%2Fconfigs.yaml", "/api/v1/download/..", "/api/v1/download/%2Fetc%2Fpasswd"):
+    # Expect 404.
+    assert (client.get(url).status_code == 404)
+  # Call the view directly so that the file name reaches safe_join unchanged.
+  with app.test_request_context():
+    # Request a file one level above the store path.
+    rv = app.view_functions["api.downloadFile"]("../configs.yaml")
+  # Expect the 404 response tuple.
+  assert (rv[1] == 404)
+
+
+# Test that the static listings carry an ETag and answer revalidations with 304.
+@pytest.mark.parametrize("endpoint", ["/api/v1/videoTypes", "/api/v1/videoQualities"])
+def Test_StaticListingsETag(client, endpoint):
+  # Request the listing.
+  rv = client.get(endpoint)
+  # Assert OK status code and the caching headers.
+  assert (rv.status_code == 200)
+  assert (rv.headers.get("ETag") and ("max-age" in rv.headers.get("Cache-Control", "")))
+  # Revalidate with the ETag.
+  rv304 = client.get(endpoint, headers={"If-None-Match": rv.headers["ETag"]})
+  # Assert an empty 304 response.
+  assert ((rv304.status_code == 304) and (rv304.data == b""))
+  # Assert the body is reused for the next request.
+  assert (client.get(endpoint).data == rv.data)
+
+
+# Test the size units at their boundaries.
+@pytest.mark.parametrize("size, expected", [
+  (1023, "1023 bytes"),
+  (1024, "1.00 KB"),
+  (1536, "1.50 KB"),
+  (1024 * 1024, "1.00 MB"),
+])
+def Test_AudioSizeUnits(client, size, expected):
+  # Upload a file of the given size.
+  data = {"audioFile": (io.BytesIO(b"\0" * size), "test.wav")}
+  # Post to audio-size endpoint.
+  rv = client.post("/api/v1/audio-size", content_type="multipart/form-data", data=data)
+  # Assert OK status code and the formatted size.
+  assert (rv.status_code == 200)
+  assert (rv.get_json()["size"] == expected)
@@ -0,0 +1,272 @@
+'''
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+'''
+
+import os, sys, random, pytest
+import numpy as np
+
+# Ensure the repository root is importable.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if (ROOT not in sys.path):
+  sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+# Try to import the helpers; if import fails, skip all tests.
+try:
+  # Attempt to import the caption helpers.
+  from FFMPEGHelper import FFMPEGHelper
+  from VideoCreatorHelper import VideoCreatorHelper, _PackWords, _SplitSentences
+except Exception as e:
+  # Skip all tests if the helpers cannot be imported.
+  pytest.skip(f"Could not import the caption helpers: {e}", allow_module_level=True)
+
+
+# Pack the word widths the way the original caption loop did (empty lines dropped).
+def BaselinePackWords(widths, reservedWidth):
+  # List of (start, end) line ranges.
+  lines = []
+  # Index of the first word of the current line.
+  counter = 0
+  # Width of the last examined word.
+  wordWidth = 0
+  # Loop until all the words are placed.
+  while (counter < len(widths)):
+    # Width of the current line.
+    currentWidth = 0
+    # Index of the examined word.
+    i = counter
+    # Add the words while they fit.
+    while (i < len(widths)):
+      # Width of the examined word.
+      wordWidth = widths[i]
+      # Stop at a word wider than the line.
+      if (wordWidth > reservedWidth):
+        break
+      # Add the word if it still fits.
+      if (currentWidth + wordWidth <= reservedWidth):
+        currentWidth += wordWidth
+        i += 1
+      else:
+        break
+    # Keep the line (the original loop also emitted an empty line before a leading oversized word).
+    if (i > counter):
+      lines.append((counter, i))
+    # Move to the next word.
+    counter = i
+    # An oversized word forms a line on its own.
+    if (wordWidth > reservedWidth):
+      lines.append((counter, counter + 1))
+      counter += 1
+  # Return the line ranges.
+  return lines
+
+
+# Convert the end indices returned by _PackWords into (start, end) ranges.
+def EndsToRanges(lineEnds):
+  # Starts are the previous ends.
+  starts = [0] + [int(end) for end in lineEnds[:-1]]
+  # Pair the starts with the ends.
+  return list(zip(starts, [int(end) for end in lineEnds]))
+
+
+# Build the caption words structure used by _BuildCaptionsList.
+def MakeCaptionWords(words):
+  # One 0.5-second window per word.
+  return {
+    "word" : list(words),
+    "start": np.arange(len(words), dtype=np.float64) * 0.5,
+    "end"  : np.arange(1, len(words) + 1, dtype=np.float64) * 0.5,
+  }
+
+
+# Test that the packing matches the original loop on random inputs.
+def Test_PackWordsMatchesBaseline():
+  # Use a fixed seed for reproducibility.
+  rng = random.Random(1234)
+  # Try many random cases.
+  for _ in range(500):
+    # Random number of words.
+    noOfWords = rng.randint(0, 40)
+    # Random widths, some of them wider than the line.
+    widths = np.array([float(rng.randint(1, 120)) for _ in range(noOfWords)], dtype=np.float64)
+    # Random line width.
+    reservedWidth = float(rng.randint(40, 200))
+    # Assert the same line ranges.
+    assert (EndsToRanges(_PackWords(widths, reservedWidth)) == BaselinePackWords(widths.tolist(), reservedWidth))
+
+
+# Test that a leading oversized word forms its own line without an empty line before it.
+def Test_PackWordsLeadingOversizedWord():
+  # The first word is wider than the line.
+  widths = np.array([150.0, 30.0, 30.0, 50.0], dtype=np.float64)
+  # Pack the words.
+  lineEnds = _PackWords(widths, 100.0)
+  # Assert the oversized word is alone and the rest are packed greedily.
+  assert (EndsToRanges(lineEnds) == [(0, 1), (1, 3), (3, 4)])
+
+
+# Test the caption lines built from the words.
+def Test_BuildCaptionsList():
+  # Create a helper without loading the TTS and Whisper models.
+  helper = VideoCreatorHelper.__new__(VideoCreatorHelper)
+  # Every character is 10 pixels wide.
+  charactersWidth = {char: 10.0 for char in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+  # Build the caption words.
+  captionWords = MakeCaptionWords(["hello", "big", "world", "extraordinarily", "ok"])
+  # Pack them into 100-pixel lines.
+  captionsList = helper._BuildCaptionsList(captionWords, charactersWidth, 100.0)
+  # Assert the line texts.
+  assert ([caption["text"] for caption in captionsList] == ["hello big", "world", "extraordinarily", "ok"])
+  # Assert the word timings are carried over.
+  assert (captionsList[0]["words"][1] == {"start": 0.5, "end": 1.0, "word": "big"})
+  # Assert every word is placed exactly once.
+  assert (sum(len(caption["words"]) for caption in captionsList) == 5)
+
+
+# Test the sentence splitting used by the sentence-level cache.
+def Test_SplitSentences():
+  # Split a text with abbreviations, line breaks, and extra spaces.
+  sentences = _SplitSentences("Hello there. Dr. Smith is here!  Is it?\n\nYes\n")
+  # Assert the sentences.
+  assert (sentences == ["Hello there.", "Dr. Smith is here!", "Is it?", "Yes"])
+  # Assert empty texts give no sentences.
+  assert (_SplitSentences("  \n ") == [])
+
+
+# Minimal stand-ins for the TTS and Whisper helpers used by the cache key.
+class _Settings(object):
+  # Return the selected language.
+  def GetSelectedLanguage(self):
+    return "en-us"
+
+  # Return the selected voice.
+  def GetSelectedVoice(self):
+    return "af_nova"
+
+  # Return the speech rate.
+  def GetSpeechRate(self):
+    return 1.0
+
+  # Return the Whisper model name.
+  def GetModelName(self):
+    return "turbo"
+
+
+# Test the cache key of the TTS + Whisper results.
+def Test_CacheKey():
+  # Create a helper without loading the TTS and Whisper models.
+  helper = VideoCreatorHelper.__new__(VideoCreatorHelper)
+  # Attach the settings stand-ins.
+  helper.ttsHelper = _Settings()
+  helper.whisperHelper = _Settings()
+  # Compute a key with the defaults.
+  key = helper._GetCacheKey("Hello world.", None, None, None)
+  # Skip when caching is disabled in the configuration.
+  if (key is None):
+    pytest.skip("The cache is disabled in configs.yaml.")
+  # Assert a 32-character hex key.
+  assert ((len(key) == 32) and all(char in "0123456789abcdef" for char in key))
+  # Assert explicit defaults share the same key.
+  assert (helper._GetCacheKey("Hello world.", "en-us", "af_nova", 1.0) == key)
+  # Assert a different voice or text changes the key.
+  assert (helper._GetCacheKey("Hello world.", "en-us", "am_adam", 1.0) != key)
+  assert (helper._GetCacheKey("Hello world!", None, None, None) != key)
+  # Assert a random voice is never cached.
+  assert (helper._GetCacheKey("Hello world.", None, "random", None) is None)
+
+
+# Test that a cache entry stored again after being pruned is not served from stale in-memory metadata.
+def Test_CacheEntryReplaced(tmp_path, monkeypatch):
+  # Import the module to redirect the cache folder into the temporary path.
+  import VideoCreatorHelper as module
+  monkeypatch.setitem(module.configs, "cache", dict(module.configs.get("cache", {}), path=str(tmp_path / "Cache")))
+  # Create a helper without loading the TTS and Whisper models.
+  helper = VideoCreatorHelper.__new__(VideoCreatorHelper)
+  # Create a dummy audio file.
+  audioFilePath = str(tmp_path / "chunk.wav")
+  with open(audioFilePath, "wb") as f:
+    f.write(b"RIFF")
+  # Store and load a first version of the entry.
+  helper._StoreInCache("key", [("First.", "p", None, audioFilePath, {"duration": 1.0})])
+  dataList = helper._LoadFromCache("key", str(tmp_path / "Work1"), "job")
+  assert (dataList[0][0] == "First.")
+  # Store a second version under the same key (as after a prune and a new job).
+  helper._StoreInCache("key", [("Second one.", "p", None, audioFilePath, {"duration": 2.0})])
+  dataList = helper._LoadFromCache("key", str(tmp_path / "Work2"), "job")
+  # Assert the new metadata is returned.
+  assert ((dataList[0][0] == "Second one.") and (dataList[0][4] == {"duration": 2.0}))
+
+
+# Captions shared by the subtitle writer tests.
+CAPTIONS = [
+  {"text": "it's {a}", "words": [{"start": 0.0, "end": 0.5, "word": "it's"}, {"start": 0.5, "end": 1.25, "word": "{a}"}]},
+  {"text": "", "words": []},
+  {"text": "done", "words": [{"start": 3661.5, "end": 3662.0, "word": "done"}]},
+]
+
+
+# Test the SRT writer.
+def Test_WriteSrt(tmp_path):
+  # Path of the SRT file.
+  srtFilePath = str(tmp_path / "captions.srt")
+  # Write the captions.
+  noOfCues = FFMPEGHelper()._WriteSrt(CAPTIONS, srtFilePath)
+  # Assert the empty caption is skipped.
+  assert (noOfCues == 2)
+  # Read the file back.
+  with open(srtFilePath, "r", encoding="utf-8") as f:
+    content = f.read()
+  # Assert the cues (uppercase words, no quotes or braces, HH:MM:SS,mmm times).
+  assert (content == (
+    "1\n00:00:00,000 --> 00:00:01,250\nITS A\n"
+    "\n"
+    "2\n01:01:01,500 --> 01:01:02,000\nDONE\n"
+  ))
+
+
+# Test the ASS writer.
+def Test_WriteAss(tmp_path):
+  # Path of the ASS file.
+  assFilePath = str(tmp_path / "captions.ass")
+  # Caption style (as returned by _GetSubtitlesStyle plus the play resolution).
+  style = {
+    "fontName"              : "Arial",
+    "fontSize"              : 48,
+    "textColor"             : "white",
+    "borderColor"           : "navy",
+    "borderWidth"           : 2,
+    "textColorHighlighted"  : "navy",
+    "borderColorHighlighted": "white",
+    "borderWidthHighlighted": 3.0,
+    "alignment"             : 2,
+    "marginV"               : 40,
+    "playResX"              : 1920,
+    "playResY"              : 1080,
+  }
+  # Write the captions.
+  noOfEvents = FFMPEGHelper()._WriteAss(CAPTIONS, assFilePath, style)
+  # Assert one event per word window (two for the first line, one for the second).
+  assert (noOfEvents == 3)
+  # Read the file back.
+  with open(assFilePath, "r", encoding="utf-8") as f:
+    lines = f.read().splitlines()
+  # Assert the header and the style line.
+  assert ("PlayResX: 1920" in lines and "PlayResY: 1080" in lines)
+  assert ("Style: Default,Arial,48,&H00FFFFFF,&H00FFFFFF,&H00800000,&H00000000,"
+          "0,0,0,0,100,100,0,0,1,2,0,2,0,0,40,1" in lines)
+  # Collect the dialogue events.
+  events = [line for line in lines if (line.startswith("Dialogue:"))]
+  # The highlighted word carries the override tags and is reset after it.
+  tag = "{\\c&H800000&\\3c&HFFFFFF&\\bord3.0}"
+  # Assert the word-by-word highlighting and the H:MM:SS.cs times.
+  assert (events == [
+    f"Dialogue: 0,0:00:00.00,0:00:00.50,Default,,0,0,0,,{tag}ITS{{\\r}} A",
+    f"Dialogue: 0,0:00:00.50,0:00:01.25,Default,,0,0,0,,ITS {tag}A{{\\r}}",
+    f"Dialogue: 0,1:01:01.50,1:01:02.00,Default,,0,0,0,,{tag}DONE{{\\r}}",
+  ])
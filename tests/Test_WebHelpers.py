@@ -0,0 +1,139 @@
+'''
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+'''
+
+import os, sys, time, pytest
+
+# Ensure the repository root is importable.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if (ROOT not in sys.path):
+  sys.path.insert(0, ROOT)
+
+# Try to import the helpers; if import fails, skip all tests.
+try:
+  # Attempt to import the web helpers.
+  from WebHelpers import (
+    JobStatusHistory, ReadJsonFile, WriteJsonFile, DeleteDirsInBackground, SweepTrash, MMAP_MIN_SIZE, TRASH_DIR_NAME,
+  )
+except Exception as e:
+  # Skip all tests if the helpers cannot be imported.
+  pytest.skip(f"Could not import WebHelpers: {e}", allow_module_level=True)
+
+
+# Wait until a condition holds (background threads) or the timeout expires.
+def WaitFor(condition, timeout=5.0):
+  # Deadline of the wait.
+  deadline = time.time() + timeout
+  # Poll the condition.
+  while (time.time() < deadline):
+    if (condition()):
+      return True
+    time.sleep(0.02)
+  # Check one last time.
+  return condition()
+
+
+# Test the JSON round trip for small (single read) and large (memory-mapped) files.
+@pytest.mark.parametrize("textLength", [10, MMAP_MIN_SIZE + 10])
+def Test_JsonFileRoundTrip(tmp_path, textLength):
+  # Data with nested values and non-ASCII text.
+  data = {"id": "job", "status": "queued", "speechRate": 0.8, "text": "é" * textLength, "tags": [1, None, True]}
+  # Path of the JSON file.
+  filePath = str(tmp_path / "job.json")
+  # Write and read the data back.
+  WriteJsonFile(filePath, data)
+  # Assert the same data.
+  assert (ReadJsonFile(filePath) == data)
+  # Overwrite with smaller data (the file must be truncated).
+  WriteJsonFile(filePath, {"id": "job"})
+  # Assert the new data.
+  assert (ReadJsonFile(filePath) == {"id": "job"})
+
+
+# Test the queued/processing counters of the job history.
+def Test_JobStatusHistoryCounters():
+  # Create an empty history.
+  history = JobStatusHistory()
+  # Queue three jobs.
+  for jobId in ("a", "b", "c"):
+    history.updateStatus(jobId, "queued")
+  # Assert the counters.
+  assert ((history.queuedCount() == 3) and (history.processingCount() == 0))
+  # Start one job.
+  history.updateStatus("a", "processing")
+  # Assert the counters.
+  assert ((history.queuedCount() == 2) and (history.processingCount() == 1))
+  # Queue a job again (no double counting).
+  history.updateStatus("b", "queued")
+  # Assert the counters.
+  assert (history.queuedCount() == 2)
+  # Complete the processing job and delete a queued one.
+  history.updateStatus("a", "completed")
+  history.delete("c")
+  # Assert the counters and the membership.
+  assert ((history.queuedCount() == 1) and (history.processingCount() == 0))
+  assert (("c" not in history) and ("a" in history) and (len(history) == 2))
+  # Clear the history.
+  history.clear()
+  # Assert the counters are reset.
+  assert ((history.queuedCount() == 0) and (len(history) == 0))
+
+
+# Test that popQueued returns the queued jobs in arrival order and skips stale entries.
+def Test_JobStatusHistoryPopQueued():
+  # Create an empty history.
+  history = JobStatusHistory()
+  # Queue four jobs.
+  for jobId in ("a", "b", "c", "d"):
+    history.updateStatus(jobId, "queued")
+  # Make two of them stale (cancelled and deleted).
+  history.updateStatus("a", "cancelled")
+  history.delete("c")
+  # Requeue a job (its older entry must not be returned twice).
+  history.updateStatus("b", "queued")
+  # Pop the queued jobs.
+  popped = []
+  while ((jobId := history.popQueued()) is not None):
+    popped.append(jobId)
+    history.updateStatus(jobId, "processing")
+  # Assert the arrival order without stale entries or duplicates.
+  assert (popped == ["b", "d"])
+  # Assert the wait returns at once when nothing can start.
+  assert (history.waitForQueued(maxJobs=1, timeout=0.01) is False)
+
+
+# Test that deleted directories go through the trash folder inside the store path.
+def Test_DeleteDirsInBackground(tmp_path):
+  # Create a store with three job directories.
+  storePath = str(tmp_path)
+  for jobId in ("j1", "j2", "j3"):
+    os.makedirs(os.path.join(storePath, jobId, "sub"))
+  # Delete two of them.
+  DeleteDirsInBackground([os.path.join(storePath, "j1"), os.path.join(storePath, "j2")], storePath)
+  # Assert they leave the store at once and only the kept one remains.
+  assert (sorted(name for name in os.listdir(storePath) if (name != TRASH_DIR_NAME)) == ["j3"])
+  # Assert the trash folder is emptied in the background.
+  assert (WaitFor(lambda: os.listdir(os.path.join(storePath, TRASH_DIR_NAME)) == []))
+
+
+# Test that leftover trash folders are swept.
+def Test_SweepTrash(tmp_path):
+  # Create a leftover trash folder from an interrupted run.
+  storePath = str(tmp_path)
+  os.makedirs(os.path.join(storePath, TRASH_DIR_NAME, "123-abcd", "oldJob", "sub"))
+  # Create a job directory that must be kept.
+  os.makedirs(os.path.join(storePath, "job"))
+  # Sweep the trash.
+  SweepTrash(storePath)
+  # Assert the leftover folder is removed.
+  assert (WaitFor(lambda: os.listdir(os.path.join(storePath, TRASH_DIR_NAME)) == []))
+  # Assert the job directory is kept.
+  assert (os.path.isdir(os.path.join(storePath, "job")))
+  # Assert sweeping a store without a trash folder is a no-op.
+  SweepTrash(str(tmp_path / "missing"))